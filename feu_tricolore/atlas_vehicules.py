@@ -0,0 +1,233 @@
+# feu_tricolore/atlas_vehicules.py
+import numpy as np
+import pygame
+from feu_tricolore.voiture import Voiture
+from feu_tricolore.cache_images import cache_images
+
+
+class AtlasVehicules:
+    """
+    Sprites pré-rendus des véhicules.
+
+    Chaque combinaison (couleur, direction, ambulance, pluie) est dessinée une
+    seule fois par Voiture.dessiner_modele dans un sprite carré centré sur le
+    véhicule ; une frame n'est plus qu'une liste de blits passée à
+    Surface.blits. Les sprites opaques utilisent une couleur transparente
+    (colorkey) pour rester identiques au dessin direct ; le gyrophare, dont le
+    halo est semi-transparent, est un sprite alpha superposé à la carrosserie.
+    """
+
+    DEMI_COTE = 40  # Faisceaux (38 px) et halo du gyrophare compris
+    COULEUR_TRANSPARENTE = (255, 0, 255)
+    DIRECTIONS = ("N", "S", "E", "O")
+    PHASES_GYROPHARE = 3
+
+    def __init__(self):
+        self.carrosseries = {}  # (couleur, direction, est_ambulance, pluie) -> Surface
+        self.gyrophares = {}  # (direction, phase) -> Surface alpha
+        self.faisceaux = {}  # direction -> Surface (faisceaux seuls, redessinés sur la pluie)
+        self.simplifies = {}  # (couleur, direction, est_ambulance) -> Surface (trafic dense)
+
+    def preparer(self, couleurs, couleur_ambulance):
+        """
+        Pré-rend tous les sprites utilisés par la simulation, ou les relit dans
+        le cache d'images s'ils ont déjà été dessinés avec les mêmes paramètres.
+
+        Args:
+            couleurs (list): Couleurs des voitures (COULEURS_VOITURES)
+            couleur_ambulance (tuple): Couleur de carrosserie des ambulances
+        """
+        cote = 2 * self.DEMI_COTE
+        parametres = (tuple(couleurs), couleur_ambulance, self.DEMI_COTE, self.PHASES_GYROPHARE,
+                      Voiture.largeur, Voiture.hauteur)
+        inventaire = list(self._inventaire(couleurs, couleur_ambulance))
+
+        sprites = cache_images.charger("atlas_vehicules", (cote, cote), parametres)
+        if sprites is not None and len(sprites) == len(inventaire):
+            for (table, cle, _, _), sprite in zip(inventaire, sprites):
+                table[cle] = self._finaliser(sprite, alpha=table is self.gyrophares)
+            return
+
+        sprites = [creer(*arguments) for _, _, creer, arguments in inventaire]
+        cache_images.enregistrer("atlas_vehicules", (cote, cote), parametres, sprites)
+
+    def _inventaire(self, couleurs, couleur_ambulance):
+        """Sprites pré-rendus par preparer, dans un ordre fixe : (table, clé, création, arguments)"""
+        for direction in self.DIRECTIONS:
+            for couleur in couleurs:
+                for pluie in (False, True):
+                    yield (self.carrosseries, (couleur, direction, False, pluie),
+                           self.carrosserie, (couleur, direction, False, pluie))
+                yield (self.simplifies, (couleur, direction, False),
+                       self.simplifie, (couleur, direction, False))
+            yield (self.carrosseries, (couleur_ambulance, direction, True, False),
+                   self.carrosserie, (couleur_ambulance, direction, True, False))
+            yield (self.simplifies, (couleur_ambulance, direction, True),
+                   self.simplifie, (couleur_ambulance, direction, True))
+            for phase in range(self.PHASES_GYROPHARE):
+                yield self.gyrophares, (direction, phase), self.gyrophare, (direction, phase)
+            yield self.faisceaux, direction, self.faisceau, (direction,)
+
+    def _nouveau_sprite(self, alpha=False):
+        """Surface vide d'un sprite (transparente)"""
+        cote = 2 * self.DEMI_COTE
+        if alpha:
+            return pygame.Surface((cote, cote), pygame.SRCALPHA)
+        sprite = pygame.Surface((cote, cote))
+        sprite.fill(self.COULEUR_TRANSPARENTE)
+        return sprite
+
+    def _finaliser(self, sprite, alpha=False):
+        """Convertit le sprite au format de l'écran (si ouvert) pour des blits rapides"""
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha() if alpha else sprite.convert()
+        if not alpha:
+            sprite.set_colorkey(self.COULEUR_TRANSPARENTE, pygame.RLEACCEL)
+        return sprite
+
+    def _gabarit(self, direction, couleur, est_ambulance=False):
+        """Véhicule centré dans le sprite, servant de modèle de dessin"""
+        return Voiture(self.DEMI_COTE, self.DEMI_COTE, direction, couleur, est_ambulance)
+
+    def carrosserie(self, couleur, direction, est_ambulance, pluie):
+        """Sprite de carrosserie (avec phares, et faisceaux sous la pluie)"""
+        cle = (couleur, direction, est_ambulance, pluie and not est_ambulance)
+        sprite = self.carrosseries.get(cle)
+        if sprite is None:
+            sprite = self._nouveau_sprite()
+            gabarit = self._gabarit(direction, couleur, est_ambulance)
+            if cle[3]:
+                gabarit._dessiner_faisceaux_lumineux(sprite)
+            gabarit.dessiner_modele(sprite)
+            sprite = self._finaliser(sprite)
+            self.carrosseries[cle] = sprite
+        return sprite
+
+    def gyrophare(self, direction, phase):
+        """Sprite alpha du gyrophare d'une ambulance pour une phase"""
+        cle = (direction, phase)
+        sprite = self.gyrophares.get(cle)
+        if sprite is None:
+            sprite = self._nouveau_sprite(alpha=True)
+            self._gabarit(direction, Voiture.BLANC, True).dessiner_gyrophare(sprite, phase)
+            sprite = self._finaliser(sprite, alpha=True)
+            self.gyrophares[cle] = sprite
+        return sprite
+
+    def faisceau(self, direction):
+        """Sprite des faisceaux lumineux seuls (repassés par-dessus la pluie)"""
+        sprite = self.faisceaux.get(direction)
+        if sprite is None:
+            sprite = self._nouveau_sprite()
+            self._gabarit(direction, Voiture.BLANC)._dessiner_faisceaux_lumineux(sprite)
+            sprite = self._finaliser(sprite)
+            self.faisceaux[direction] = sprite
+        return sprite
+
+    @staticmethod
+    def dimensions_carrosserie(direction):
+        """Largeur et hauteur à l'écran de la carrosserie selon l'orientation"""
+        if direction in ("N", "S"):
+            return Voiture.hauteur, Voiture.largeur
+        return Voiture.largeur, Voiture.hauteur
+
+    def simplifie(self, couleur, direction, est_ambulance):
+        """
+        Sprite réduit à la carrosserie (niveau de détail simplifié) :
+        rectangle uni et contour fin, sans phares, faisceaux ni gyrophare.
+        """
+        cle = (couleur, direction, est_ambulance)
+        sprite = self.simplifies.get(cle)
+        if sprite is None:
+            largeur, hauteur = self.dimensions_carrosserie(direction)
+            sprite = pygame.Surface((largeur, hauteur))
+            sprite.fill(couleur)
+            pygame.draw.rect(sprite, Voiture.NOIR, sprite.get_rect(), 1)
+            if est_ambulance:
+                Voiture(largeur // 2, hauteur // 2, direction, couleur, True)._dessiner_croix(sprite)
+            sprite = self._finaliser(sprite)  # Encodage RLE : blits plus rapides qu'en opaque
+            self.simplifies[cle] = sprite
+        return sprite
+
+    def sprites(self, voiture, pluie, gyrophare=True):
+        """
+        Blits d'un véhicule (fait avancer l'animation du gyrophare).
+
+        Args:
+            voiture (Voiture): Véhicule à dessiner
+            pluie (bool): Météo pluvieuse (faisceaux allumés)
+            gyrophare (bool): False pour omettre le halo des ambulances (qualité réduite)
+
+        Returns:
+            list: Couples (sprite, position) pour Surface.blits
+        """
+        position = (int(voiture.x) - self.DEMI_COTE, int(voiture.y) - self.DEMI_COTE)
+        blits = [(self.carrosserie(voiture.couleur, voiture.direction, voiture.est_ambulance, pluie), position)]
+        if voiture.est_ambulance and gyrophare:
+            blits.append((self.gyrophare(voiture.direction, voiture.phase_gyrophare()), position))
+        return blits
+
+    def sequence(self, voitures, pluie, gyrophares=True):
+        """
+        Blits de tous les véhicules, dans l'ordre donné (ordre de profondeur).
+
+        Returns:
+            list: Couples (sprite, position) pour un seul appel à Surface.blits
+        """
+        blits = []
+        for voiture in voitures:
+            blits.extend(self.sprites(voiture, pluie, gyrophares))
+        return blits
+
+    def sprite_simplifie(self, voiture):
+        """Blit d'un véhicule au niveau de détail simplifié"""
+        largeur, hauteur = self.dimensions_carrosserie(voiture.direction)
+        return (self.simplifie(voiture.couleur, voiture.direction, voiture.est_ambulance),
+                (int(voiture.x) - largeur // 2, int(voiture.y) - hauteur // 2))
+
+    def sequence_simplifiee(self, voies):
+        """
+        Blits de tous les véhicules au niveau de détail simplifié.
+
+        Les positions sont lues directement dans les colonnes des voies et les
+        véhicules dessinés voie par voie, sans tri de profondeur : à ce niveau
+        de détail, seul le coût par véhicule compte.
+
+        Args:
+            voies (iterable): VoieVehicules à dessiner
+
+        Returns:
+            list: Couples (sprite, position) pour un seul appel à Surface.blits
+        """
+        blits = []
+        for voie in voies:
+            if len(voie) == 0:
+                continue
+            direction = voie.direction
+            largeur, hauteur = self.dimensions_carrosserie(direction)
+            # Coin haut-gauche : coordonnée fixe de la voie et position le long de l'axe
+            if voie.axe_y:
+                fixe = int(voie.coord_fixe) - largeur // 2
+                decalage = hauteur // 2
+            else:
+                fixe = int(voie.coord_fixe) - hauteur // 2
+                decalage = largeur // 2
+            coins = (np.nan_to_num(voie.positions()).astype(np.int64) - decalage).tolist()
+            for voiture, coin in zip(voie.lignes(), coins):
+                if voiture is None:
+                    continue
+                sprite = self.simplifie(voiture.couleur, direction, voiture.est_ambulance)
+                blits.append((sprite, (fixe, coin) if voie.axe_y else (coin, fixe)))
+        return blits
+
+    def sequence_faisceaux(self, voitures):
+        """Blits des faisceaux de tous les véhicules, à repasser sur la pluie"""
+        return [
+            (self.faisceau(voiture.direction),
+             (int(voiture.x) - self.DEMI_COTE, int(voiture.y) - self.DEMI_COTE))
+            for voiture in voitures
+        ]
+
+
+# Instance globale unique (singleton)
+atlas_vehicules = AtlasVehicules()
@@ -0,0 +1,42 @@
+# feu_tricolore/audio.py
+import pygame
+from feu_tricolore.constants import FREQUENCE_AUDIO
+from feu_tricolore.demarrage import rapport_demarrage
+
+
+class Audio:
+    """
+    Accès au mixer Pygame, ouvert seulement au premier son joué.
+
+    L'audio est désactivé par défaut : la simulation sans interface
+    (main_headless) ne touche donc jamais au périphérique son, même quand une
+    ambulance demande sa sirène. L'interface graphique l'active au démarrage.
+    """
+
+    def __init__(self):
+        self.actif = False
+
+    def activer(self):
+        """Autorise l'ouverture du mixer (sans l'ouvrir)"""
+        self.actif = True
+
+    def ouvrir(self):
+        """
+        Ouvre le mixer s'il ne l'est pas encore.
+
+        Returns:
+            bool: False si l'audio n'est pas activé
+
+        Raises:
+            pygame.error: Aucun périphérique son disponible
+        """
+        if not self.actif:
+            return False
+        if pygame.mixer.get_init() is None:
+            with rapport_demarrage.mesurer("audio"):
+                pygame.mixer.init(frequency=FREQUENCE_AUDIO, size=-16, channels=2, buffer=512)
+        return True
+
+
+# Instance globale unique (singleton)
+audio = Audio()
@@ -0,0 +1,64 @@
+# feu_tricolore/cache_audio.py
+import os
+import numpy as np
+import pygame
+from feu_tricolore.constants import DOSSIER_CACHE_AUDIO, VERSION_SYNTHESE_AUDIO, FREQUENCE_AUDIO
+
+
+def frequence_mixer():
+    """Fréquence d'échantillonnage du mixer (FREQUENCE_AUDIO s'il n'est pas encore ouvert)"""
+    etat = pygame.mixer.get_init()
+    return etat[0] if etat else FREQUENCE_AUDIO
+
+
+class CacheAudio:
+    """
+    Signaux audio synthétisés, conservés sur disque entre deux lancements.
+
+    Chaque signal (tableau NumPy int16 mono) est rangé dans un fichier .npy
+    nommé d'après le son, la fréquence d'échantillonnage et la version de la
+    synthèse : changer l'algorithme (VERSION_SYNTHESE_AUDIO) invalide les anciens
+    fichiers. Un cache illisible ou non inscriptible n'empêche jamais d'obtenir
+    le son, il est simplement recalculé.
+    """
+
+    def __init__(self, dossier=DOSSIER_CACHE_AUDIO):
+        self.dossier = dossier
+
+    def chemin(self, nom, frequence):
+        """Fichier du signal nom échantillonné à frequence Hz"""
+        return os.path.join(self.dossier, f"{nom}_{frequence}hz_v{VERSION_SYNTHESE_AUDIO}.npy")
+
+    def obtenir(self, nom, frequence, synthetiser):
+        """
+        Retourne le signal depuis le disque, ou le synthétise puis l'enregistre.
+
+        Args:
+            nom (str): Identifiant du son (ex: "sirene_europeenne")
+            frequence (int): Fréquence d'échantillonnage (Hz)
+            synthetiser (callable): Appelé avec frequence, retourne le signal int16
+
+        Returns:
+            np.ndarray: Signal mono int16
+        """
+        chemin = self.chemin(nom, frequence)
+        try:
+            return np.load(chemin, allow_pickle=False)
+        except (OSError, ValueError):
+            pass
+
+        signal = synthetiser(frequence)
+        try:
+            os.makedirs(self.dossier, exist_ok=True)
+            # Écriture dans un fichier temporaire puis renommage : jamais de fichier à moitié écrit
+            temporaire = f"{chemin}.{os.getpid()}.tmp"
+            with open(temporaire, "wb") as fichier:
+                np.save(fichier, signal, allow_pickle=False)
+            os.replace(temporaire, chemin)
+        except OSError as e:
+            print(f"Impossible d'enregistrer le son {nom} en cache: {e}")
+        return signal
+
+
+# Instance globale unique (singleton)
+cache_audio = CacheAudio()
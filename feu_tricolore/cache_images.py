@@ -0,0 +1,105 @@
+# feu_tricolore/cache_images.py
+import hashlib
+import json
+import os
+import pygame
+from feu_tricolore.constants import DOSSIER_CACHE_IMAGES, VERSION_CACHE_IMAGES
+
+
+class CacheImages:
+    """
+    Surfaces générées (textures, décor, sprites), conservées sur disque entre
+    deux lancements.
+
+    Un fichier contient une ou plusieurs surfaces sous forme de pixels bruts
+    (RGB, ou RGBA pour les surfaces alpha), précédés d'une ligne d'en-tête JSON
+    donnant la taille et le format de chacune. Son nom associe la résolution et
+    une empreinte des paramètres de génération (et de VERSION_CACHE_IMAGES, à
+    incrémenter quand un dessin change). Au lancement suivant, les surfaces sont
+    créées par pygame.image.frombuffer directement sur les octets lus, sans
+    copie. Comme pour le cache audio, un fichier illisible ou non inscriptible
+    n'empêche jamais d'obtenir l'image, elle est simplement régénérée.
+    """
+
+    def __init__(self, dossier=DOSSIER_CACHE_IMAGES):
+        self.dossier = dossier
+
+    def chemin(self, nom, resolution, parametres):
+        """Fichier des surfaces nom générées pour resolution avec parametres"""
+        empreinte = hashlib.sha1(repr((VERSION_CACHE_IMAGES, parametres)).encode()).hexdigest()[:16]
+        largeur, hauteur = resolution
+        return os.path.join(self.dossier, f"{nom}_{largeur}x{hauteur}_{empreinte}.raw")
+
+    def charger(self, nom, resolution, parametres):
+        """
+        Surfaces enregistrées, dans l'ordre d'enregistrement.
+
+        Returns:
+            list: Surfaces (partageant le tampon lu), ou None si absentes ou invalides
+        """
+        try:
+            with open(self.chemin(nom, resolution, parametres), "rb") as fichier:
+                donnees = fichier.read()
+            fin_entete = donnees.index(b"\n")
+            entete = json.loads(donnees[:fin_entete])
+        except (OSError, ValueError):
+            return None
+
+        pixels = memoryview(donnees)[fin_entete + 1:]
+        surfaces = []
+        debut = 0
+        try:
+            for largeur, hauteur, format_pixels in entete:
+                fin = debut + largeur * hauteur * len(format_pixels)
+                surfaces.append(pygame.image.frombuffer(pixels[debut:fin], (largeur, hauteur), format_pixels))
+                debut = fin
+        except (TypeError, ValueError, pygame.error):
+            return None
+        if debut != len(pixels):
+            return None  # Fichier tronqué ou en-tête incohérent
+        return surfaces
+
+    def enregistrer(self, nom, resolution, parametres, surfaces):
+        """Écrit les surfaces (liste) sur disque"""
+        chemin = self.chemin(nom, resolution, parametres)
+        entete = []
+        blocs = []
+        for surface in surfaces:
+            format_pixels = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+            entete.append((surface.get_width(), surface.get_height(), format_pixels))
+            blocs.append(pygame.image.tobytes(surface, format_pixels))
+        try:
+            os.makedirs(self.dossier, exist_ok=True)
+            # Écriture dans un fichier temporaire puis renommage : jamais de fichier à moitié écrit
+            temporaire = f"{chemin}.{os.getpid()}.tmp"
+            with open(temporaire, "wb") as fichier:
+                fichier.write(json.dumps(entete).encode() + b"\n")
+                for bloc in blocs:
+                    fichier.write(bloc)
+            os.replace(temporaire, chemin)
+        except OSError as e:
+            print(f"Impossible d'enregistrer l'image {nom} en cache: {e}")
+
+    def obtenir(self, nom, resolution, parametres, generer):
+        """
+        Retourne une surface depuis le disque, ou la génère puis l'enregistre.
+
+        Args:
+            nom (str): Identifiant de l'image (ex: "herbe")
+            resolution (tuple): Taille de la fenêtre à laquelle l'image correspond
+            parametres (tuple): Tout ce dont dépend la génération (couleurs, géométrie...)
+            generer (callable): Appelé sans argument, retourne la surface
+
+        Returns:
+            pygame.Surface: Surface générée ou relue
+        """
+        surfaces = self.charger(nom, resolution, parametres)
+        if surfaces is not None and len(surfaces) == 1:
+            return surfaces[0]
+        surface = generer()
+        self.enregistrer(nom, resolution, parametres, [surface])
+        return surface
+
+
+# Instance globale unique (singleton)
+cache_images = CacheImages()
@@ -0,0 +1,68 @@
+# feu_tricolore/cache_texte.py
+from collections import OrderedDict
+
+
+class CacheTexte:
+    """
+    Cache LRU borné des textes rendus par pygame.font.
+
+    Les mêmes libellés (titres de sections, compteurs, minuteurs) sont
+    redessinés à chaque frame : la surface rendue est conservée par
+    (police, texte, antialias, couleur, alpha) et réutilisée tant qu'elle
+    reste parmi les plus récemment demandées.
+    Les surfaces retournées sont partagées et ne doivent pas être modifiées.
+    """
+
+    def __init__(self, capacite):
+        """
+        Args:
+            capacite (int): Nombre maximal de surfaces conservées
+        """
+        self.capacite = capacite
+        self._surfaces = OrderedDict()
+        self.nb_hits = 0
+        self.nb_miss = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def rendre(self, police, texte, antialias, couleur, alpha=None):
+        """
+        Équivalent de police.render(texte, antialias, couleur) avec mise en cache.
+
+        Args:
+            police (pygame.font.Font): Police utilisée
+            texte (str): Texte à rendre
+            antialias (bool): Lissage des caractères
+            couleur (tuple): Couleur du texte
+            alpha (int): Transparence globale de la surface (None = opaque)
+
+        Returns:
+            pygame.Surface: Surface du texte (partagée)
+        """
+        cle = (police, texte, antialias, couleur, alpha)
+        surface = self._surfaces.get(cle)
+        if surface is not None:
+            self._surfaces.move_to_end(cle)
+            self.nb_hits += 1
+            return surface
+
+        self.nb_miss += 1
+        surface = police.render(texte, antialias, couleur)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self._surfaces[cle] = surface
+        if len(self._surfaces) > self.capacite:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def statistiques(self):
+        """Compteurs d'utilisation du cache (pour le profilage)"""
+        demandes = self.nb_hits + self.nb_miss
+        return {
+            "hits": self.nb_hits,
+            "miss": self.nb_miss,
+            "taux_hits": self.nb_hits / demandes if demandes else 0.0,
+            "taille": len(self._surfaces),
+            "capacite": self.capacite,
+        }
@@ -11,6 +11,32 @@ LARGEUR = 1600
 HAUTEUR = 900
 FPS = 60
 
+# =============================================================================
+# PAS DE TEMPS DE LA SIMULATION
+# =============================================================================
+FPS_SIMULATION = 60  # pas de simulation par seconde simulée
+DT_SIMULATION = 1 / FPS_SIMULATION  # secondes simulées par pas (fixe)
+MAX_PAS_PAR_FRAME = 10  # limite de rattrapage par frame affichée
+
+# Accélération (pas de simulation par frame affichée)
+FACTEURS_VITESSE = [1, 2, 10, 50, None]  # None = aussi vite que possible
+BUDGET_FRAME_VITESSE_MAX = 0.012  # secondes de calcul par frame en mode MAX
+
+# =============================================================================
+# MISE À JOUR DE L'ÉCRAN
+# =============================================================================
+MISE_A_JOUR_PARTIELLE = True  # display.update(zones modifiées) au lieu de flip()
+MAX_ZONES_MODIFIEES = 200  # au-delà, une mise à jour complète est plus rapide
+MARGE_AFFICHAGE_VOITURE = 20  # faisceaux et halo du gyrophare autour de la carrosserie
+DEMI_ZONE_ANIMEE = 270  # feux, piétons et compteurs autour du centre
+
+# =============================================================================
+# PANNEAU DE CONTRÔLE
+# =============================================================================
+COULEUR_FOND_PANNEAU = (248, 249, 250)
+MARGE_TUILE_PANNEAU = 2  # ombre des cards autour de chaque section mise en cache
+HAUTEUR_MAX_SECTION = 300  # hauteur du brouillon dans lequel les sections sont dessinées
+
 # =============================================================================
 # COULEURS DE BASE
 # =============================================================================
@@ -67,17 +93,24 @@ CENTRE_Y = 450
 # =============================================================================
 # PARAMÈTRES DE SPAWN DES VOITURES
 # =============================================================================
-INTERVALLE_SPAWN_VOITURES = 30  # frames entre chaque spawn
+INTERVALLE_SPAWN_VOITURES = 0.5  # secondes entre chaque spawn
 PROBABILITE_SPAWN = 0.4  # Probabilité de ne pas spawn (0.4 = 60% de chance)
 VOITURES_INITIALES_MIN = 2
 VOITURES_INITIALES_MAX = 3
 
+# =============================================================================
+# VITESSES DES VÉHICULES
+# =============================================================================
+VITESSE_VOITURE = 180  # pixels par seconde
+VITESSE_AMBULANCE = 300  # pixels par seconde
+
 # =============================================================================
 # PARAMÈTRES DE COLLISION ET SÉCURITÉ
 # =============================================================================
 DISTANCE_SECURITE_VOITURE = 50  # Distance minimale entre voitures
 SEUIL_COLLISION_X = 35  # Seuil de collision horizontal
 SEUIL_COLLISION_Y = 30  # Seuil de collision vertical
+TAILLE_CELLULE_GRILLE = 40  # Côté des cellules de la grille spatiale (>= seuils de collision)
 
 # =============================================================================
 # ZONES D'INTERSECTION
@@ -88,7 +121,7 @@ ZONE_INTERSECTION_DEMI_HAUTEUR = 120
 # =============================================================================
 # PARAMÈTRES D'ACCIDENTS
 # =============================================================================
-DUREE_INTERVENTION_ACCIDENT = 300  # frames (5 secondes à 60 FPS)
+DUREE_INTERVENTION_ACCIDENT = 5  # secondes
 
 # =============================================================================
 # PARAMÈTRES AMBULANCES
@@ -133,6 +166,8 @@ DUREE_MESSAGE = 180  # frames (3 secondes à 60 FPS)
 TAILLE_POLICE_TITRE = 40
 TAILLE_POLICE_NORMALE = 28
 TAILLE_POLICE_PETITE = 22
+TAILLE_POLICE_KPI = 42
+TAILLE_CACHE_TEXTE = 256  # surfaces de texte rendues conservées (LRU)
 
 # =============================================================================
 # POSITIONS DES ÉLÉMENTS GRAPHIQUES
@@ -289,3 +324,53 @@ PIETON_COULEUR_CORPS = (100, 100, 100)
 PIETON_COULEUR_CONTOUR = (255, 255, 255)
 NOMBRE_PIETONS_SIMULTANES = 4
 DUREE_TRAVERSEE_PIETON = 7  # Durée standard pour calculer la progression
+TYPES_PIETONS = ("enfant", "adulte", "adulte", "senior")  # Tirage uniforme : plus d'adultes
+TAILLES_PIETONS = {"enfant": 0.7, "adulte": 1.0, "senior": 0.9}
+
+# =============================================================================
+# EFFET DE PLUIE
+# =============================================================================
+NOMBRE_GOUTTES_PLUIE = 300  # gouttes simultanées (intensité de la pluie)
+LONGUEUR_MIN_GOUTTE = 12
+LONGUEUR_MAX_GOUTTE = 25
+OPACITE_MIN_GOUTTE = 100
+OPACITE_MAX_GOUTTE = 180
+
+# =============================================================================
+# NIVEAUX DE DÉTAIL DES VÉHICULES (trafic dense)
+# =============================================================================
+DETAIL_COMPLET = "COMPLET"      # sprites complets (phares, faisceaux, gyrophare)
+DETAIL_SIMPLIFIE = "SIMPLIFIE"  # carrosserie unie, sans phares ni faisceaux
+DETAIL_DENSITE = "DENSITE"      # carte de densité du trafic
+SEUIL_DETAIL_SIMPLIFIE = 400    # véhicules au-delà desquels le dessin est simplifié
+SEUIL_DETAIL_DENSITE = 2500     # véhicules au-delà desquels seule la densité est dessinée
+HYSTERESIS_DETAIL = 0.9         # retour au niveau plus détaillé sous 90 % du seuil
+TAILLE_CELLULE_DENSITE = 16     # côté d'une cellule de la carte de densité (px)
+
+# =============================================================================
+# QUALITÉ DE RENDU ADAPTATIVE
+# =============================================================================
+QUALITE_ADAPTATIVE = True  # dégrade les effets coûteux quand le rendu dépasse son budget
+BUDGET_RENDU = 0.010  # secondes de rendu visées par frame (le reste pour la simulation)
+LISSAGE_TEMPS_RENDU = 0.1  # poids de la dernière frame dans le temps de rendu lissé
+MARGE_RETABLISSEMENT_QUALITE = 0.6  # qualité rétablie sous 60 % du budget
+FRAMES_AVANT_DEGRADATION = 30  # frames hors budget avant de baisser d'un cran
+FRAMES_AVANT_RETABLISSEMENT = 120  # frames sous la marge avant de remonter d'un cran
+
+# =============================================================================
+# SONS SYNTHÉTISÉS
+# =============================================================================
+FREQUENCE_AUDIO = 22050  # Hz, si le mixer n'est pas encore ouvert
+DOSSIER_CACHE_AUDIO = "cache_audio"  # signaux déjà synthétisés (.npy)
+VERSION_SYNTHESE_AUDIO = 1  # à incrémenter quand un algorithme de synthèse change
+
+# =============================================================================
+# DÉMARRAGE
+# =============================================================================
+RAPPORT_DEMARRAGE = True  # affiche la durée d'initialisation de chaque sous-système
+
+# =============================================================================
+# IMAGES GÉNÉRÉES
+# =============================================================================
+DOSSIER_CACHE_IMAGES = "cache_images"  # textures, décor et sprites déjà générés (pixels bruts)
+VERSION_CACHE_IMAGES = 1  # à incrémenter quand le dessin d'une image en cache change
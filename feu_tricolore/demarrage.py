@@ -0,0 +1,82 @@
+# feu_tricolore/demarrage.py
+import time
+from contextlib import contextmanager
+from feu_tricolore.constants import RAPPORT_DEMARRAGE
+
+
+class RapportDemarrage:
+    """
+    Durée d'initialisation de chaque sous-système.
+
+    Les mesures prises avant la première frame forment le rapport de démarrage
+    (affiché une fois par main_gui) ; celles des sous-systèmes créés plus tard,
+    au premier besoin, sont affichées au moment où elles ont lieu.
+    """
+
+    def __init__(self, actif=RAPPORT_DEMARRAGE):
+        self.actif = actif
+        self.debut = time.perf_counter()
+        # sous-système -> [secondes, profondeur], dans l'ordre d'initialisation
+        # (profondeur > 0 : mesure incluse dans celle d'un autre sous-système)
+        self.durees = {}
+        self.profondeur = 0
+        self.affiche = False
+
+    @contextmanager
+    def mesurer(self, nom):
+        """Chronomètre le bloc comme initialisation du sous-système nom"""
+        mesure = self.durees.setdefault(nom, [0.0, self.profondeur])
+        self.profondeur += 1
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            duree = time.perf_counter() - debut
+            self.profondeur -= 1
+            mesure[0] += duree
+            if self.actif and self.affiche:
+                print(f"Initialisation différée : {nom} {duree * 1000:.1f} ms")
+
+    def afficher(self):
+        """Affiche le rapport (appelé une fois la première frame à l'écran)"""
+        if self.affiche:
+            return
+        self.affiche = True
+        if not self.actif:
+            return
+        total = time.perf_counter() - self.debut
+        print(f"Démarrage en {total * 1000:.0f} ms :")
+        for nom, (duree, profondeur) in self.durees.items():
+            print(f"  {'  ' * profondeur}{nom:<{24 - 2 * profondeur}} {duree * 1000:7.1f} ms")
+
+
+class AttributParesseux:
+    """
+    Attribut créé au premier accès, puis conservé sur l'instance.
+
+    S'utilise comme décorateur de la méthode qui construit la valeur ; la
+    construction est chronométrée dans le rapport de démarrage.
+    """
+
+    def __init__(self, creer):
+        self.creer = creer
+        self.nom = creer.__name__
+        self.__doc__ = creer.__doc__
+
+    def __get__(self, instance, proprietaire=None):
+        if instance is None:
+            return self
+        with rapport_demarrage.mesurer(self.nom):
+            valeur = self.creer(instance)
+        # L'attribut d'instance masque désormais le descripteur (accès direct)
+        instance.__dict__[self.nom] = valeur
+        return valeur
+
+    @staticmethod
+    def existant(instance, nom):
+        """Valeur de l'attribut s'il a déjà été créé, None sinon (sans le créer)"""
+        return instance.__dict__.get(nom)
+
+
+# Instance globale unique (singleton)
+rapport_demarrage = RapportDemarrage()
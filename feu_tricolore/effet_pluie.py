@@ -1,6 +1,13 @@
+import threading
 import pygame
-import random
 import numpy as np
+from feu_tricolore.audio import audio
+from feu_tricolore.cache_audio import cache_audio, frequence_mixer
+from feu_tricolore.constants import (
+    NOMBRE_GOUTTES_PLUIE,
+    LONGUEUR_MIN_GOUTTE, LONGUEUR_MAX_GOUTTE,
+    OPACITE_MIN_GOUTTE, OPACITE_MAX_GOUTTE
+)
 
 class EffetPluie:
     """Gère l'effet visuel de pluie à l'écran avec son"""
@@ -8,94 +15,143 @@ class EffetPluie:
     # Variables de classe pour le son (partagées entre toutes les instances)
     son_pluie = None
     son_initialise = False
+    _signaux_pluie = {}  # fréquence -> signal int16 mono déjà synthétisé
+    _prechargement_son = None  # Thread de synthèse lancé au démarrage
+
+    # Surfaces translucides réutilisées : (taille, couleur) -> Surface
+    surfaces_voile = {}
+    surfaces_gouttes = {}
+    table_sprites = None
     
+    @classmethod
+    def precharger_son_pluie(cls):
+        """
+        Prépare le signal de pluie en arrière-plan (appelé au démarrage) :
+        activer la pluie n'a plus qu'à créer le son.
+        """
+        if cls._prechargement_son is not None:
+            return
+        cls._prechargement_son = threading.Thread(
+            target=cls._signal_pluie, args=(frequence_mixer(),),
+            name="synthese-pluie", daemon=True
+        )
+        cls._prechargement_son.start()
+
     @classmethod
     def initialiser_son_pluie(cls):
         """Initialise le son de pluie une seule fois pour toutes les instances"""
         if not cls.son_initialise:
             try:
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                if not audio.ouvrir():
+                    return
+                if cls._prechargement_son is not None:
+                    cls._prechargement_son.join()
                 cls.son_pluie = cls._generer_son_pluie()
                 cls.son_initialise = True
             except Exception as e:
                 print(f"Impossible d'initialiser le son de pluie: {e}")
                 cls.son_pluie = None
                 cls.son_initialise = True
-    
+
     @classmethod
-    def _generer_son_pluie(cls):
+    def _signal_pluie(cls, frequence):
+        """Signal de pluie (mémoire, puis cache disque, puis synthèse)"""
+        signal = cls._signaux_pluie.get(frequence)
+        if signal is None:
+            signal = cache_audio.obtenir("pluie", frequence, cls._synthetiser_son_pluie)
+            cls._signaux_pluie[frequence] = signal
+        return signal
+
+    @staticmethod
+    def _synthetiser_son_pluie(sample_rate):
         """
-        Génère un son de pluie synthétique réaliste CONTINU
+        Synthétise un son de pluie réaliste CONTINU (calcul NumPy vectorisé, sans Pygame)
         Combine du bruit blanc filtré pour créer un effet de pluie constant
+
+        Returns:
+            np.ndarray: Signal mono int16
+        """
+        rng = np.random.default_rng()
+
+        # Paramètres du son - DURÉE LONGUE pour continuité
+        duration = 8.0  # 8 secondes (boucle plus longue = plus fluide)
+        nb_echantillons = int(sample_rate * duration)
+
+        # BRUIT BLANC CONTINU - Base constante
+        noise = rng.normal(0, 0.2, nb_echantillons)  # Amplitude augmentée pour volume
+
+        # Ajouter des "gouttes" aléatoires TOUT AU LONG (pas de silence)
+        # Toutes les gouttes sont tirées d'un coup puis ajoutées en une seule passe
+        num_drops = int(duration * 150)  # Plus de gouttes = son plus dense
+        drop_idx = (rng.random(num_drops) * duration * sample_rate).astype(np.int64)
+        drop_idx = drop_idx[drop_idx < nb_echantillons - 100]
+        n = len(drop_idx)
+        drop_length = rng.integers(20, 60, n, endpoint=True)[:, None]
+        drop_freq = rng.integers(1800, 4500, n, endpoint=True)[:, None]
+        drop_gain = rng.uniform(0.08, 0.25, n)[:, None]
+
+        # Échantillon k de chaque goutte (lignes de longueur max, masquées au-delà de drop_length)
+        k = np.arange(60)[None, :]
+        actif = k < drop_length
+        # Équivalents de np.linspace(0, 4, L) et np.linspace(0, L/sample_rate, L)
+        drop_envelope = np.exp(-4.0 * k / (drop_length - 1))
+        instants = k * (drop_length / sample_rate) / (drop_length - 1)
+        drop_sound = np.sin(2 * np.pi * drop_freq * instants) * drop_envelope * drop_gain
+        noise += np.bincount((drop_idx[:, None] + k)[actif], weights=drop_sound[actif],
+                             minlength=nb_echantillons)
+
+        # Filtre passe-bas pour rendre le son plus doux (bruit constant)
+        filtered = np.convolve(noise, np.ones(8)/8, mode='same')
+
+        # Normaliser SANS réduire trop le volume (pour continuité perceptible)
+        max_val = np.max(np.abs(filtered))
+        if max_val > 0:
+            filtered = filtered / max_val * 0.35  # Volume plus élevé
+
+        # FADE ULTRA-COURT juste pour éviter clic lors boucle
+        # (quasi imperceptible = continuité totale)
+        fade_samples = int(sample_rate * 0.02)  # 0.02s seulement (20ms)
+        filtered[:fade_samples] *= np.linspace(0.8, 1.0, fade_samples)  # Fade in doux
+        filtered[-fade_samples:] *= np.linspace(1.0, 0.8, fade_samples)  # Fade out doux
+
+        # Convertir en format pygame
+        return np.int16(filtered * 32767)
+
+    @classmethod
+    def _generer_son_pluie(cls):
+        """
+        Crée le son de pluie à la fréquence du mixer (voir _synthetiser_son_pluie)
         """
         try:
-            # Paramètres du son - DURÉE LONGUE pour continuité
-            sample_rate = 22050
-            duration = 8.0  # 8 secondes (boucle plus longue = plus fluide)
-            
-            # Générer du bruit blanc (base du son de pluie)
-            t = np.linspace(0, duration, int(sample_rate * duration))
-            
-            # BRUIT BLANC CONTINU - Base constante
-            noise = np.random.normal(0, 0.2, len(t))  # Amplitude augmentée pour volume
-            
-            # Ajouter des "gouttes" aléatoires TOUT AU LONG (pas de silence)
-            num_drops = int(duration * 150)  # Plus de gouttes = son plus dense
-            for _ in range(num_drops):
-                drop_time = random.random() * duration
-                drop_idx = int(drop_time * sample_rate)
-                if drop_idx < len(noise) - 100:
-                    # Créer une enveloppe pour la goutte
-                    drop_length = random.randint(20, 60)
-                    drop_envelope = np.exp(-np.linspace(0, 4, drop_length))
-                    drop_sound = np.sin(2 * np.pi * random.randint(1800, 4500) * np.linspace(0, drop_length/sample_rate, drop_length))
-                    drop_sound = drop_sound * drop_envelope * random.uniform(0.08, 0.25)
-                    noise[drop_idx:drop_idx+drop_length] += drop_sound[:min(drop_length, len(noise)-drop_idx)]
-            
-            # Filtre passe-bas pour rendre le son plus doux (bruit constant)
-            filtered = np.convolve(noise, np.ones(8)/8, mode='same')
-            
-            # Normaliser SANS réduire trop le volume (pour continuité perceptible)
-            max_val = np.max(np.abs(filtered))
-            if max_val > 0:
-                filtered = filtered / max_val * 0.35  # Volume plus élevé
-            
-            # FADE ULTRA-COURT juste pour éviter clic lors boucle
-            # (quasi imperceptible = continuité totale)
-            fade_samples = int(sample_rate * 0.02)  # 0.02s seulement (20ms)
-            filtered[:fade_samples] *= np.linspace(0.8, 1.0, fade_samples)  # Fade in doux
-            filtered[-fade_samples:] *= np.linspace(1.0, 0.8, fade_samples)  # Fade out doux
-            
-            # Convertir en format pygame
-            signal = np.int16(filtered * 32767)
-            
+            signal = cls._signal_pluie(frequence_mixer())
+
             # Créer un tableau stéréo
             stereo_signal = np.column_stack((signal, signal))
-            
+
             # Créer un objet Sound à partir du tableau numpy
             sound = pygame.sndarray.make_sound(stereo_signal)
             return sound
-            
+
         except Exception as e:
             print(f"Impossible de générer le son de pluie: {e}")
             return None
     
-    def __init__(self, largeur, hauteur):
+    def __init__(self, largeur, hauteur, nombre_gouttes=NOMBRE_GOUTTES_PLUIE):
         self.largeur = largeur
         self.hauteur = hauteur
-        self.gouttes = []
-        self.nombre_gouttes = 300  # Nombre de gouttes simultanées
+        self.nombre_gouttes = nombre_gouttes  # Nombre de gouttes simultanées
+        self.nombre_actif = nombre_gouttes  # Gouttes animées et dessinées (qualité réduite : moins)
         self.son_actif = False  # Pour savoir si le son joue actuellement
-        
-        # Initialiser le son si pas encore fait
-        if not EffetPluie.son_initialise:
-            EffetPluie.initialiser_son_pluie()
+        # Générateur propre à la pluie : ne consomme pas le hasard de la simulation
+        self.rng = np.random.default_rng()
         
         # Créer les gouttes initiales
         self._creer_gouttes_initiales()
     
     def demarrer_son(self):
-        """Démarre le son de pluie en boucle"""
+        """Démarre le son de pluie en boucle (créé à la première activation de la pluie)"""
+        if not EffetPluie.son_initialise:
+            EffetPluie.initialiser_son_pluie()
         if EffetPluie.son_pluie and not self.son_actif:
             try:
                 EffetPluie.son_pluie.play(loops=-1)  # -1 = boucle infinie
@@ -114,46 +170,103 @@ class EffetPluie:
     
     def _creer_gouttes_initiales(self):
         """Crée toutes les gouttes initiales réparties sur l'écran"""
-        for _ in range(self.nombre_gouttes):
-            self.gouttes.append(self._creer_nouvelle_goutte(position_aleatoire=True))
+        n = self.nombre_gouttes
+        # État des gouttes en tableaux (une case par goutte)
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.vitesse = np.zeros(n)
+        self.vent = np.zeros(n)
+        self.longueur = np.zeros(n, dtype=np.int64)
+        self.opacite = np.zeros(n, dtype=np.int64)
+        self.indices_sprites = np.zeros(n, dtype=np.int64)
+        self._recreer_gouttes(np.ones(n, dtype=bool), position_aleatoire=True)
     
-    def _creer_nouvelle_goutte(self, position_aleatoire=False):
+    def _recreer_gouttes(self, masque, position_aleatoire=False):
         """
-        Crée une nouvelle goutte de pluie
+        Recrée d'un coup les gouttes désignées par le masque
         
         Args:
-            position_aleatoire: Si True, place la goutte aléatoirement sur tout l'écran
-                              Si False, place la goutte en haut de l'écran
+            masque: Tableau booléen des gouttes à recréer
+            position_aleatoire: Si True, place les gouttes aléatoirement sur tout l'écran
+                              Si False, place les gouttes en haut de l'écran
         """
+        n = int(np.count_nonzero(masque))
+        if n == 0:
+            return
+        rng = self.rng
+        self.x[masque] = rng.integers(0, self.largeur, n, endpoint=True)
         if position_aleatoire:
             # Position aléatoire sur tout l'écran (pour initialisation)
-            x = random.randint(0, self.largeur)
-            y = random.randint(0, self.hauteur)
+            self.y[masque] = rng.integers(0, self.hauteur, n, endpoint=True)
         else:
             # Position en haut de l'écran (pour gouttes qui tombent)
-            x = random.randint(0, self.largeur)
-            y = random.randint(-50, -10)
-        
-        return {
-            'x': x,
-            'y': y,
-            'vitesse': random.randint(8, 15),  # Vitesse de chute
-            'longueur': random.randint(12, 25),  # Longueur de la goutte
-            'opacite': random.randint(100, 180), # Transparence
-            'vent': random.uniform(-0.5, 0.5)
-        }
+            self.y[masque] = rng.integers(-50, -10, n, endpoint=True)
+        self.vitesse[masque] = rng.integers(8, 15, n, endpoint=True)  # Vitesse de chute
+        self.vent[masque] = rng.uniform(-0.5, 0.5, n)
+        longueur = rng.integers(LONGUEUR_MIN_GOUTTE, LONGUEUR_MAX_GOUTTE, n, endpoint=True)
+        opacite = rng.integers(OPACITE_MIN_GOUTTE, OPACITE_MAX_GOUTTE, n, endpoint=True)
+        self.longueur[masque] = longueur
+        self.opacite[masque] = opacite
+        self.indices_sprites[masque] = self._indice_sprite(longueur, opacite)
+    
+    @staticmethod
+    def _indice_sprite(longueur, opacite):
+        """Rang du sprite (longueur, opacité) dans la table des sprites de gouttes"""
+        nb_opacites = OPACITE_MAX_GOUTTE - OPACITE_MIN_GOUTTE + 1
+        return (longueur - LONGUEUR_MIN_GOUTTE) * nb_opacites + (opacite - OPACITE_MIN_GOUTTE)
     
+    @classmethod
+    def _table_sprites(cls):
+        """Tous les sprites de gouttes possibles, rangés selon _indice_sprite"""
+        if cls.table_sprites is None:
+            cls.table_sprites = [
+                cls._surface_goutte(longueur, opacite)
+                for longueur in range(LONGUEUR_MIN_GOUTTE, LONGUEUR_MAX_GOUTTE + 1)
+                for opacite in range(OPACITE_MIN_GOUTTE, OPACITE_MAX_GOUTTE + 1)
+            ]
+        return cls.table_sprites
+    
+    @classmethod
+    def _surface_voile(cls, largeur, hauteur, couleur):
+        """Voile semi-transparent plein écran (créé une fois par taille et couleur)"""
+        cle = (largeur, hauteur, couleur)
+        voile = cls.surfaces_voile.get(cle)
+        if voile is None:
+            voile = pygame.Surface((largeur, hauteur), pygame.SRCALPHA)
+            voile.fill(couleur)
+            if pygame.display.get_surface() is not None:
+                voile = voile.convert_alpha()
+            cls.surfaces_voile[cle] = voile
+        return voile
+
+    @classmethod
+    def _surface_goutte(cls, longueur, opacite):
+        """Sprite d'une goutte (créé une fois par longueur et opacité)"""
+        cle = (longueur, opacite)
+        goutte_surface = cls.surfaces_gouttes.get(cle)
+        if goutte_surface is None:
+            # Couleur bleu-gris clair avec transparence
+            couleur = (200, 210, 230, opacite)
+            goutte_surface = pygame.Surface((3, longueur), pygame.SRCALPHA)
+            pygame.draw.line(goutte_surface, couleur, (1, 0), (1, longueur), 2)
+            cls.surfaces_gouttes[cle] = goutte_surface
+        return goutte_surface
+
+    def definir_proportion(self, proportion):
+        """Limite la pluie à une proportion des gouttes (les autres restent en attente)"""
+        self.nombre_actif = int(self.nombre_gouttes * proportion)
+
     def update(self):
-        """Met à jour la position de toutes les gouttes"""
-        for goutte in self.gouttes:
-            # Faire tomber la goutte
-            goutte['y'] += goutte['vitesse']
-            goutte['x'] += goutte['vent'] 
-            
-            # Si la goutte sort de l'écran, la recréer en haut
-            if goutte['y'] > self.hauteur:
-                nouvelle = self._creer_nouvelle_goutte(position_aleatoire=False)
-                goutte.update(nouvelle)
+        """Met à jour la position de toutes les gouttes actives"""
+        n = self.nombre_actif
+        # Faire tomber les gouttes
+        self.y[:n] += self.vitesse[:n]
+        self.x[:n] += self.vent[:n]
+        
+        # Les gouttes sorties de l'écran sont recréées en haut
+        sorties = self.y > self.hauteur
+        sorties[n:] = False
+        self._recreer_gouttes(sorties)
     
     def dessiner(self, surface):
         """
@@ -163,31 +276,20 @@ class EffetPluie:
             surface: Surface pygame sur laquelle dessiner
         """
         # 1. EFFET D'ASSOMBRISSEMENT (ciel gris)
-        # Créer un voile semi-transparent gris sur tout l'écran
-        voile_gris = pygame.Surface((self.largeur, self.hauteur), pygame.SRCALPHA)
-        
-        # Gris sombre avec 50 de transparence (0=invisible, 255=opaque)
+        # Voile semi-transparent gris sur tout l'écran
+        # Gris sombre avec 100 de transparence (0=invisible, 255=opaque)
         # Plus le chiffre est élevé, plus c'est sombre
-        voile_gris.fill((45, 55, 75, 100))  # RGB gris + alpha (transparence)
+        voile_gris = self._surface_voile(self.largeur, self.hauteur, (45, 55, 75, 100))
         surface.blit(voile_gris, (0, 0))
         
-        # 2. GOUTTES DE PLUIE
-        for goutte in self.gouttes:
-            # Couleur bleu-gris clair avec transparence
-            couleur = (200, 210, 230, goutte['opacite'])
-            
-            # Créer une surface temporaire pour la transparence
-            goutte_surface = pygame.Surface((3, goutte['longueur']), pygame.SRCALPHA)
-            pygame.draw.line(
-                goutte_surface,
-                couleur,
-                (1, 0),
-                (1, goutte['longueur']),
-                2
-            )
-            
-            # Blitter la goutte sur la surface principale
-            surface.blit(goutte_surface, (goutte['x'], goutte['y']))
+        # 2. GOUTTES DE PLUIE (sprites pré-rendus, un seul appel de blit)
+        sprites = self._table_sprites()
+        n = self.nombre_actif
+        surface.blits(
+            zip(map(sprites.__getitem__, self.indices_sprites[:n].tolist()),
+                zip(self.x[:n].tolist(), self.y[:n].tolist())),
+            doreturn=False
+        )
     
     def __del__(self):
         """Destructeur - arrête le son quand l'effet est détruit"""
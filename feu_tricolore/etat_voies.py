@@ -0,0 +1,79 @@
+# feu_tricolore/etat_voies.py
+import numpy as np
+from feu_tricolore.constants import (
+    ZONE_INTERSECTION_DEMI_LARGEUR,
+    ZONE_INTERSECTION_DEMI_HAUTEUR
+)
+
+
+class EtatVoies:
+    """
+    Instantané de l'état des 4 voies, calculé en une seule passe.
+
+    Toutes les mesures sont exprimées en distance restante avant le centre de
+    l'intersection (positive avant le centre, négative après), ce qui rend les
+    4 directions symétriques.
+
+    Contenu :
+      - en_attente : voitures dans la zone d'attente, par direction (effectifs des voies)
+      - approchant : voitures dans la zone d'approche, par direction (effectifs des voies)
+      - distances_ambulances : distances des ambulances au centre, par direction
+      - occupation_intersection : véhicules dans la zone d'intersection
+      - vehicules_intersection : idem sans les ambulances
+    """
+
+    def __init__(self, voies, centre_x, centre_y):
+        """
+        Args:
+            voies (tuple): VoieVehicules dans l'ordre Nord, Sud, Est, Ouest
+            centre_x, centre_y (float): Centre de l'intersection
+        """
+        self.en_attente = {}
+        self.approchant = {}
+        self.distances_ambulances = {}
+        self.occupation_intersection = 0
+        self.vehicules_intersection = 0
+
+        for voie in voies:
+            if voie.axe_y:
+                centre = centre_y
+                demi_zone = ZONE_INTERSECTION_DEMI_HAUTEUR
+            else:
+                centre = centre_x
+                demi_zone = ZONE_INTERSECTION_DEMI_LARGEUR
+
+            direction = voie.direction
+            self.en_attente[direction] = voie.nb_en_attente()
+            self.approchant[direction] = voie.nb_approchant()
+            if len(voie) == 0:
+                self.distances_ambulances[direction] = ()
+                continue
+
+            distance = voie.signe * (centre - voie.positions())
+
+            dans_zone = np.abs(distance) <= demi_zone
+            occupation = int(np.count_nonzero(dans_zone))
+            self.occupation_intersection += occupation
+            if voie.contient_ambulance():
+                ambulances = voie.ambulances()
+                self.vehicules_intersection += int(np.count_nonzero(dans_zone & ~ambulances))
+                self.distances_ambulances[direction] = distance[ambulances]
+            else:
+                self.vehicules_intersection += occupation
+                self.distances_ambulances[direction] = ()
+
+    @property
+    def en_attente_ns(self):
+        return self.en_attente["N"] + self.en_attente["S"]
+
+    @property
+    def en_attente_eo(self):
+        return self.en_attente["E"] + self.en_attente["O"]
+
+    @property
+    def approchant_ns(self):
+        return self.approchant["N"] + self.approchant["S"]
+
+    @property
+    def approchant_eo(self):
+        return self.approchant["E"] + self.approchant["O"]
@@ -19,8 +19,9 @@ class GestionnaireAmbulances:
         self.compteur_ambulances = 0
         self.ambulance_active = None
         self.phase_avant_ambulance = None
+        self.sirene_active = False  # Une seule sirène tant qu'une ambulance circule
 
-    def detecter_ambulance_approchant(self, voitures_nord, voitures_sud, voitures_est, voitures_ouest, mode_urgence):
+    def detecter_ambulance_approchant(self, etat_voies, mode_urgence):
         """Détecte si une ambulance approche de l'intersection et active la priorité"""
         if mode_urgence:
             return None
@@ -28,26 +29,12 @@ class GestionnaireAmbulances:
         # Distance de détection (300 pixels avant l'intersection)
         distance_detection = DISTANCE_DETECTION_AMBULANCE
 
-        # Vérifier chaque direction - DÉTECTION ÉTENDUE jusqu'à l'entrée de l'intersection
-        for voiture in voitures_nord:
-            # Détecter de 300px avant jusqu'à l'ENTRÉE de l'intersection (y = centre_y - 140)
-            if voiture.est_ambulance and voiture.y < self.centre_y - 140 and voiture.y > self.centre_y - distance_detection:
-                return "N"
-
-        for voiture in voitures_sud:
-            # Détecter de 300px avant jusqu'à l'ENTRÉE de l'intersection (y = centre_y + 140)
-            if voiture.est_ambulance and voiture.y > self.centre_y + 140 and voiture.y < self.centre_y + distance_detection:
-                return "S"
-
-        for voiture in voitures_est:
-            # Détecter de 300px avant jusqu'à l'ENTRÉE de l'intersection (x = centre_x + 140)
-            if voiture.est_ambulance and voiture.x > self.centre_x + 140 and voiture.x < self.centre_x + distance_detection:
-                return "E"
-
-        for voiture in voitures_ouest:
-            # Détecter de 300px avant jusqu'à l'ENTRÉE de l'intersection (x = centre_x - 140)
-            if voiture.est_ambulance and voiture.x < self.centre_x - 140 and voiture.x > self.centre_x - distance_detection:
-                return "O"
+        # Vérifier chaque direction (N, S, E, O) - DÉTECTION ÉTENDUE jusqu'à l'entrée
+        # de l'intersection (140px avant le centre)
+        for direction, distances in etat_voies.distances_ambulances.items():
+            for distance in distances:
+                if 140 < distance < distance_detection:
+                    return direction
 
         return None
 
@@ -63,34 +50,15 @@ class GestionnaireAmbulances:
         self.ambulance_active = direction
         return direction
 
-    def verifier_ambulance_passee(self, voitures_nord, voitures_sud, voitures_est, voitures_ouest):
+    def verifier_ambulance_passee(self, etat_voies):
         """Vérifie si l'ambulance est passée pour restaurer le mode normal"""
         if self.ambulance_active is None:
             return False
 
-        ambulance_passee = True
-
-        # Vérifier si l'ambulance est encore dans la zone
-        if self.ambulance_active == "N":
-            for voiture in voitures_nord:
-                if voiture.est_ambulance and voiture.y < self.centre_y + 200:
-                    ambulance_passee = False
-                    break
-        elif self.ambulance_active == "S":
-            for voiture in voitures_sud:
-                if voiture.est_ambulance and voiture.y > self.centre_y - 200:
-                    ambulance_passee = False
-                    break
-        elif self.ambulance_active == "E":
-            for voiture in voitures_est:
-                if voiture.est_ambulance and voiture.x > self.centre_x - 200:
-                    ambulance_passee = False
-                    break
-        elif self.ambulance_active == "O":
-            for voiture in voitures_ouest:
-                if voiture.est_ambulance and voiture.x < self.centre_x + 200:
-                    ambulance_passee = False
-                    break
+        # L'ambulance est encore dans la zone tant qu'elle n'a pas dépassé
+        # le centre de plus de 200px
+        distances = etat_voies.distances_ambulances[self.ambulance_active]
+        ambulance_passee = not any(distance > -200 for distance in distances)
 
         if ambulance_passee:
             self.ambulance_active = None
@@ -99,22 +67,31 @@ class GestionnaireAmbulances:
 
         return False
 
-    def spawner_ambulance(self, direction, voitures_nord, voitures_sud, voitures_est, voitures_ouest):
-        """Spawne une ambulance dans une direction donnée"""
+    def spawner_ambulance(self, direction, voitures_nord, voitures_sud, voitures_est, voitures_ouest, pool):
+        """Spawne une ambulance dans une direction donnée (voiture prise dans le pool)"""
         couleur_ambulance = BLANC
 
         if direction == "N":
-            ambulance = Voiture(SPAWN_NORD_X, SPAWN_NORD_Y, "N", couleur_ambulance, est_ambulance=True)
-            voitures_nord.append(ambulance)
+            ambulance = pool.obtenir(SPAWN_NORD_X, SPAWN_NORD_Y, "N", couleur_ambulance, est_ambulance=True)
+            voitures_nord.ajouter(ambulance)
         elif direction == "S":
-            ambulance = Voiture(SPAWN_SUD_X, SPAWN_SUD_Y, "S", couleur_ambulance, est_ambulance=True)
-            voitures_sud.append(ambulance)
+            ambulance = pool.obtenir(SPAWN_SUD_X, SPAWN_SUD_Y, "S", couleur_ambulance, est_ambulance=True)
+            voitures_sud.ajouter(ambulance)
         elif direction == "E":
-            ambulance = Voiture(SPAWN_EST_X, SPAWN_EST_Y, "E", couleur_ambulance, est_ambulance=True)
-            voitures_est.append(ambulance)
+            ambulance = pool.obtenir(SPAWN_EST_X, SPAWN_EST_Y, "E", couleur_ambulance, est_ambulance=True)
+            voitures_est.ajouter(ambulance)
         else:  # "O"
-            ambulance = Voiture(SPAWN_OUEST_X, SPAWN_OUEST_Y, "O", couleur_ambulance, est_ambulance=True)
-            voitures_ouest.append(ambulance)
+            ambulance = pool.obtenir(SPAWN_OUEST_X, SPAWN_OUEST_Y, "O", couleur_ambulance, est_ambulance=True)
+            voitures_ouest.ajouter(ambulance)
 
         self.compteur_ambulances += 1
-        return True
\ No newline at end of file
+        if not self.sirene_active:
+            Voiture.demarrer_sirene()
+            self.sirene_active = True
+        return True
+
+    def mettre_a_jour_sirene(self, ambulance_en_circulation):
+        """Arrête la sirène quand la dernière ambulance a quitté les voies"""
+        if self.sirene_active and not ambulance_en_circulation:
+            Voiture.arreter_sirene()
+            self.sirene_active = False
\ No newline at end of file
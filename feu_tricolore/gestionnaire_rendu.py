@@ -1,19 +1,36 @@
 import pygame
 import math
 import random
+import numpy as np
 from feu_tricolore.meteo import meteo
+from feu_tricolore.cache_texte import CacheTexte
+from feu_tricolore.atlas_vehicules import atlas_vehicules
+from feu_tricolore.ordre_profondeur import OrdreProfondeur
+from feu_tricolore.gouverneur_qualite import GouverneurQualite
+from feu_tricolore.demarrage import rapport_demarrage, AttributParesseux
+from feu_tricolore.cache_images import cache_images
 from feu_tricolore.constants import (
     BLANC, NOIR, GRIS, GRIS_CLAIR, GRIS_FONCE,
     VERT, ROUGE, ORANGE, BLEU, BLEU_FONCE, JAUNE,
-    VERT_FONCE, VERT_GAZON,
-    TAILLE_POLICE_TITRE, TAILLE_POLICE_NORMALE, TAILLE_POLICE_PETITE,
+    VERT_FONCE, VERT_GAZON, COULEURS_VOITURES,
+    TAILLE_POLICE_TITRE, TAILLE_POLICE_NORMALE, TAILLE_POLICE_PETITE, TAILLE_POLICE_KPI,
+    TAILLE_CACHE_TEXTE,
     DUREE_MESSAGE,
+    MAX_ZONES_MODIFIEES, DEMI_ZONE_ANIMEE,
+    COULEUR_FOND_PANNEAU, MARGE_TUILE_PANNEAU, HAUTEUR_MAX_SECTION,
     PIETON_TETE_RAYON, PIETON_CORPS_LARGEUR, PIETON_CORPS_HAUTEUR,
     PIETON_JAMBE_LONGUEUR, PIETON_COULEUR_TETE, PIETON_COULEUR_CORPS,
-    PIETON_COULEUR_CONTOUR, NOMBRE_PIETONS_SIMULTANES, DUREE_TRAVERSEE_PIETON
+    PIETON_COULEUR_CONTOUR, NOMBRE_PIETONS_SIMULTANES, DUREE_TRAVERSEE_PIETON,
+    TYPES_PIETONS, TAILLES_PIETONS,
+    DETAIL_COMPLET, DETAIL_SIMPLIFIE, DETAIL_DENSITE,
+    SEUIL_DETAIL_SIMPLIFIE, SEUIL_DETAIL_DENSITE, HYSTERESIS_DETAIL, TAILLE_CELLULE_DENSITE,
+    QUALITE_ADAPTATIVE
 )
 
 class GestionnaireRendu:
+    # Couleurs de la carte de densité, indexées par nombre de véhicules par cellule
+    PALETTE_DENSITE = (None, (255, 214, 0), (255, 160, 0), (240, 96, 0), (210, 40, 0), (160, 0, 0))
+
     def __init__(self, ecran, centre_x, centre_y, largeur, hauteur):
         self.ecran = ecran
         self.centre_x = centre_x
@@ -24,6 +41,14 @@ class GestionnaireRendu:
         self.police_titre = pygame.font.Font(None, TAILLE_POLICE_TITRE)
         self.police_normale = pygame.font.Font(None, TAILLE_POLICE_NORMALE)
         self.police_petite = pygame.font.Font(None, TAILLE_POLICE_PETITE)
+        self.police_kpi = pygame.font.Font(None, TAILLE_POLICE_KPI)
+
+        # Textes rendus partagés par tout le rendu (hits / miss dans statistiques())
+        self.cache_texte = CacheTexte(TAILLE_CACHE_TEXTE)
+
+        # Hasard propre au rendu (texture, piétons) : le générateur global reste
+        # réservé à la simulation, dont les tirages sont ainsi reproductibles
+        self.rng = random.Random()
 
         # Message
         self.message = "Prêt à démarrer la simulation"
@@ -35,11 +60,44 @@ class GestionnaireRendu:
         self.scroll_max = 0
         self.header_height = 140  # Hauteur du header fixe
 
+        # Sections du panneau mises en cache : cle -> (signature, surface, hauteur, boutons)
+        self._tuiles_panneau = {}
+        self._brouillon_tuile = pygame.Surface((590, HAUTEUR_MAX_SECTION))
+        self._boutons_tuile = {}
+
         # Animation piétons
         self.frame_count = 0  # Compteur de frames pour animation jambes
-
-        # Texture d'herbe (générée une seule fois)
-        self.texture_herbe = self._generer_texture_herbe()
+        self.frame_marche = 0  # Frame utilisée pour la pose des jambes (figée si qualité réduite)
+        # Piétons de chaque traversée en cours : sens -> [(type, taille, décalage de départ)]
+        # Tirés une fois par phase piéton (voir _profil_traversee)
+        self._profils_pietons = {}
+        self._bulles_pietons = {}  # texte du compteur -> fond semi-transparent
+
+        # Qualité des effets coûteux ajustée au temps de rendu (voir main_gui)
+        self.gouverneur = GouverneurQualite(actif=QUALITE_ADAPTATIVE)
+
+        # Texture d'herbe et effet de pluie : créés au premier usage (voir plus bas)
+
+        # Sprites des véhicules (toutes couleurs, directions et météos)
+        with rapport_demarrage.mesurer("sprites vehicules"):
+            atlas_vehicules.preparer(COULEURS_VOITURES, BLANC)
+
+        # Ordre de dessin des véhicules, conservé d'une frame à l'autre
+        self.ordre_profondeur = OrdreProfondeur()
+        # Niveau de détail des véhicules, choisi à chaque frame selon leur nombre
+        self.niveau_detail = DETAIL_COMPLET
+
+        # Décor statique (herbe, routes, marquages) composé une seule fois
+        self.fond_statique = None
+        self._cle_fond = None
+
+        # Mise à jour partielle de l'écran : zones modifiées par la dernière frame
+        self.zones = []
+        self.rendu_complet = True  # Première frame ou fenêtre à réafficher entièrement
+        self.message_affiche = None
+        self._zones_mobiles = []  # Emprises des éléments mobiles à la frame précédente
+        self._scene_entiere = False  # Frame précédente réaffichée entièrement (pluie, trafic dense)
+        self._signatures = {}
 
         # Boutons
         self.btn_start = None
@@ -54,11 +112,22 @@ class GestionnaireRendu:
         self.btn_ambulance_est = None
         self.btn_ambulance_ouest = None
         self.btn_meteo = None
-        # NOUVEAU: Effet de pluie
+        self.btn_vitesse = None
+
+    @AttributParesseux
+    def effet_pluie(self):
+        """Effet de pluie, créé la première fois que la pluie est activée"""
         from feu_tricolore.effet_pluie import EffetPluie
-        self.effet_pluie = EffetPluie(largeur, hauteur)
+        return EffetPluie(self.largeur, self.hauteur)
 
-        
+    @AttributParesseux
+    def texture_herbe(self):
+        """
+        Texture d'herbe (générée une seule fois, à la composition du premier
+        décor absent du cache d'images, puis relue sur disque aux lancements suivants)
+        """
+        return cache_images.obtenir("herbe", (self.largeur, self.hauteur), (VERT_GAZON,),
+                                    self._generer_texture_herbe)
 
     def afficher_message(self, texte, couleur=BLEU):
         """Affiche un message temporaire"""
@@ -66,6 +135,128 @@ class GestionnaireRendu:
         self.message_couleur = couleur
         self.message_temps = DUREE_MESSAGE
 
+    def zones_modifiees(self):
+        """
+        Zones à transmettre à pygame.display.update() pour la dernière frame dessinée.
+
+        Returns:
+            list: Rectangles modifiés (l'écran entier si tout doit être réaffiché)
+        """
+        if self.rendu_complet or len(self.zones) > MAX_ZONES_MODIFIEES:
+            self.rendu_complet = False
+            return [self.ecran.get_rect()]
+        return self.zones
+
+    def _marquer_si_change(self, cle, signature, rect):
+        """Ajoute rect aux zones modifiées si le contenu décrit par signature a changé"""
+        if self._signatures.get(cle) != signature:
+            self._signatures[cle] = signature
+            self.zones.append(rect)
+
+    def _relever_zones_modifiees(self, voitures, accident_actif, feux, signature_entete, signature_contenu,
+                                 panneau_dessine=True):
+        """
+        Relève les zones de l'écran qui diffèrent de la frame précédente.
+
+        Les éléments mobiles (véhicules, accident) sont rafraîchis à leur
+        ancienne et à leur nouvelle position ; les feux, piétons, message et
+        panneau seulement quand ce qu'ils affichent change. La pluie et les
+        niveaux de détail réduits (trafic dense) couvrent toute la scène, qui
+        est alors réaffichée entièrement. Un panneau non redessiné (qualité
+        réduite) garde ses signatures pour être relevé à la frame suivante.
+        """
+        panel_x = self.largeur - 590
+        self.zones = []
+
+        scene_entiere = meteo.est_pluie or self.niveau_detail != DETAIL_COMPLET
+        if scene_entiere or self._scene_entiere:
+            self.zones.append(pygame.Rect(0, 0, panel_x, self.hauteur))
+            mobiles = []
+        else:
+            mobiles = [voiture.zone_affichage() for voiture in voitures]
+            if accident_actif:
+                pos_x, pos_y = accident_actif["position"]
+                mobiles.append(pygame.Rect(pos_x - 80, pos_y - 95, 160, 190))
+            self.zones.extend(mobiles)
+            self.zones.extend(self._zones_mobiles)
+        self._zones_mobiles = mobiles
+        self._scene_entiere = scene_entiere
+
+        # Feux, feux piétons et piétons en traversée (jambes animées à chaque frame)
+        etat_feux = tuple(
+            (feu.couleur, feu.temps_restant, feu.pieton_vert,
+             (feu.temps_pieton_restant, self.frame_marche) if feu.pieton_vert else None)
+            for feu in feux
+        )
+        zone_animee = pygame.Rect(self.centre_x - DEMI_ZONE_ANIMEE, self.centre_y - DEMI_ZONE_ANIMEE,
+                                  2 * DEMI_ZONE_ANIMEE, 2 * DEMI_ZONE_ANIMEE)
+        self._marquer_si_change("feux", etat_feux, zone_animee)
+
+        self._marquer_si_change("message", self.message_affiche, pygame.Rect(50, self.hauteur - 60, 900, 45))
+        if not panneau_dessine:
+            return
+        self._marquer_si_change("entete", signature_entete,
+                                pygame.Rect(panel_x - 2, 0, 592, self.header_height + 2))
+        self._marquer_si_change("contenu", signature_contenu,
+                                pygame.Rect(panel_x - 2, self.header_height, 592, self.hauteur - self.header_height))
+
+    def _choisir_niveau_detail(self, nb_vehicules):
+        """
+        Niveau de détail des véhicules pour la frame, selon leur nombre.
+        Le retour vers un niveau plus détaillé attend que le nombre repasse
+        sous HYSTERESIS_DETAIL fois le seuil, pour éviter d'alterner à chaque frame.
+        """
+        niveau = self.niveau_detail
+        if nb_vehicules > SEUIL_DETAIL_DENSITE:
+            return DETAIL_DENSITE
+        if niveau == DETAIL_DENSITE and nb_vehicules > SEUIL_DETAIL_DENSITE * HYSTERESIS_DETAIL:
+            return DETAIL_DENSITE
+        if nb_vehicules > SEUIL_DETAIL_SIMPLIFIE:
+            return DETAIL_SIMPLIFIE
+        if niveau != DETAIL_COMPLET and nb_vehicules > SEUIL_DETAIL_SIMPLIFIE * HYSTERESIS_DETAIL:
+            return DETAIL_SIMPLIFIE
+        return DETAIL_COMPLET
+
+    def _dessiner_densite(self, voies):
+        """
+        Carte de densité du trafic (niveau DETAIL_DENSITE) : les véhicules sont
+        comptés par cellule carrée, chaque cellule occupée est remplie d'une
+        couleur allant du jaune (un véhicule) au rouge sombre (cellule saturée).
+        Les ambulances restent dessinées par-dessus en sprites simplifiés.
+        """
+        cellule = TAILLE_CELLULE_DENSITE
+        nb_colonnes = self.largeur // cellule + 1
+        nb_lignes = self.hauteur // cellule + 1
+        comptes = np.zeros(nb_colonnes * nb_lignes, dtype=np.int64)
+        ambulances = []
+        for voie in voies:
+            positions = voie.positions()
+            positions = positions[~np.isnan(positions)]
+            if len(positions) == 0:
+                continue
+            rangs = np.floor_divide(positions, cellule).astype(np.int64)
+            fixe = int(voie.coord_fixe // cellule)
+            if voie.axe_y:
+                lignes, colonnes = rangs, fixe
+                visibles = (rangs >= 0) & (rangs < nb_lignes)
+            else:
+                lignes, colonnes = fixe, rangs
+                visibles = (rangs >= 0) & (rangs < nb_colonnes)
+            cellules = (lignes * nb_colonnes + colonnes)[visibles]
+            comptes += np.bincount(cellules, minlength=len(comptes))
+            if voie.contient_ambulance():
+                ambulances.extend(v for v in voie if v.est_ambulance)
+
+        palette = self.PALETTE_DENSITE
+        occupees = np.flatnonzero(comptes)
+        niveaux = np.minimum(comptes[occupees], len(palette) - 1)
+        for indice, niveau in zip(occupees.tolist(), niveaux.tolist()):
+            ligne, colonne = divmod(indice, nb_colonnes)
+            self.ecran.fill(palette[niveau], (colonne * cellule, ligne * cellule, cellule, cellule))
+
+        if ambulances:
+            self.ecran.blits([atlas_vehicules.sprite_simplifie(v) for v in ambulances], doreturn=False)
+
     def gerer_scroll(self, direction):
         """Gère le défilement du panneau de droite"""
         scroll_speed = 30
@@ -90,24 +281,24 @@ class GestionnaireRendu:
 
         # Ajouter des variations sur la petite tuile seulement
         for _ in range(200):
-            x = random.randint(0, tuile_size - 1)
-            y = random.randint(0, tuile_size - 1)
-            variation = random.randint(-20, 20)
+            x = self.rng.randint(0, tuile_size - 1)
+            y = self.rng.randint(0, tuile_size - 1)
+            variation = self.rng.randint(-20, 20)
             r = max(0, min(255, base_r + variation))
-            g = max(0, min(255, base_g + variation + random.randint(-5, 10)))
+            g = max(0, min(255, base_g + variation + self.rng.randint(-5, 10)))
             b = max(0, min(255, base_b + variation))
-            pygame.draw.circle(tuile, (r, g, b), (x, y), random.randint(1, 2))
+            pygame.draw.circle(tuile, (r, g, b), (x, y), self.rng.randint(1, 2))
 
         # Ajouter quelques brins sur la tuile
         for _ in range(80):
-            x = random.randint(0, tuile_size - 1)
-            y = random.randint(2, tuile_size - 1)
-            if random.random() > 0.5:
+            x = self.rng.randint(0, tuile_size - 1)
+            y = self.rng.randint(2, tuile_size - 1)
+            if self.rng.random() > 0.5:
                 couleur = (base_r - 25, base_g - 15, base_b - 25)
             else:
                 couleur = (base_r + 15, base_g + 25, base_b + 8)
             couleur = tuple(max(0, min(255, c)) for c in couleur)
-            pygame.draw.line(tuile, couleur, (x, y), (x, y - random.randint(2, 4)), 1)
+            pygame.draw.line(tuile, couleur, (x, y), (x, y - self.rng.randint(2, 4)), 1)
 
         # Répéter la tuile sur toute la surface
         for tx in range(0, self.largeur, tuile_size):
@@ -117,37 +308,62 @@ class GestionnaireRendu:
         return texture
 
     def dessiner_route(self):
-        """Dessine les routes et l'intersection"""
+        """Dessine les routes et l'intersection (un seul blit du décor pré-composé)"""
+        cle = (self.largeur, self.hauteur, self.centre_x, self.centre_y, self.ecran.get_size())
+        if self.fond_statique is None or cle != self._cle_fond:
+            self.fond_statique = self._composer_fond()
+            self._cle_fond = cle
+        self.ecran.blit(self.fond_statique, (0, 0))
+
+    def _composer_fond(self):
+        """
+        Décor statique au format de l'écran, relu dans le cache d'images s'il a
+        déjà été composé pour cette géométrie (sans générer la texture d'herbe).
+        """
+        parametres = (self.largeur, self.hauteur, self.centre_x, self.centre_y,
+                      VERT_GAZON, GRIS_FONCE, BLANC)
+        fond = cache_images.obtenir("fond", self.ecran.get_size(), parametres, self._dessiner_fond)
+        # Conversion au format de l'écran : blits du décor rapides à chaque frame
+        return fond.convert(self.ecran)
+
+    def _dessiner_fond(self):
+        """
+        Compose le décor statique : gazon, routes, lignes de stop, marquages et
+        passages piétons. Reconstruit uniquement si la géométrie ou la taille de
+        la fenêtre change.
+        """
+        fond = pygame.Surface(self.ecran.get_size())
+
         # Fond gazon avec texture réaliste
-        self.ecran.blit(self.texture_herbe, (0, 0))
+        fond.blit(self.texture_herbe, (0, 0))
 
         # Routes horizontales (Est-Ouest)
-        pygame.draw.rect(self.ecran, GRIS_FONCE,
+        pygame.draw.rect(fond, GRIS_FONCE,
                         (0, self.centre_y - 120, self.largeur - 600, 240))
 
         # Routes verticales (Nord-Sud)
-        pygame.draw.rect(self.ecran, GRIS_FONCE,
+        pygame.draw.rect(fond, GRIS_FONCE,
                         (self.centre_x - 120, 0, 240, self.hauteur))
 
         # Zone d'intersection centrale
-        pygame.draw.rect(self.ecran, GRIS_FONCE,
+        pygame.draw.rect(fond, GRIS_FONCE,
                         (self.centre_x - 120, self.centre_y - 120, 240, 240))
 
         # Lignes de STOP (épaisses et rouges) avant chaque feu
         # Nord - ligne horizontale
-        pygame.draw.rect(self.ecran, BLANC,
+        pygame.draw.rect(fond, BLANC,
                         (self.centre_x - 90, self.centre_y - 140, 60, 8))
 
         # Sud - ligne horizontale
-        pygame.draw.rect(self.ecran, BLANC,
+        pygame.draw.rect(fond, BLANC,
                         (self.centre_x + 30, self.centre_y + 132, 60, 8))
 
         # Est - ligne verticale
-        pygame.draw.rect(self.ecran, BLANC,
+        pygame.draw.rect(fond, BLANC,
                         (self.centre_x + 132, self.centre_y - 90, 8, 60))
 
         # Ouest - ligne verticale
-        pygame.draw.rect(self.ecran, BLANC,
+        pygame.draw.rect(fond, BLANC,
                         (self.centre_x - 140, self.centre_y + 30, 8, 60))
 
         # Lignes blanches horizontales (en pointillés)
@@ -155,48 +371,50 @@ class GestionnaireRendu:
             if x < self.centre_x - 130 or x > self.centre_x + 130:
                 # Ligne centrale voie Nord (y = centre_y - 60)
                 if self.centre_y - 70 > 120:
-                    pygame.draw.rect(self.ecran, BLANC, (x, self.centre_y - 65, 30, 10))
+                    pygame.draw.rect(fond, BLANC, (x, self.centre_y - 65, 30, 10))
                 # Ligne centrale voie Sud (y = centre_y + 60)
                 if self.centre_y + 70 < self.hauteur - 120:
-                    pygame.draw.rect(self.ecran, BLANC, (x, self.centre_y + 55, 30, 10))
+                    pygame.draw.rect(fond, BLANC, (x, self.centre_y + 55, 30, 10))
 
         # Lignes blanches verticales (en pointillés)
         for y in range(0, self.hauteur, 50):
             if y < self.centre_y - 130 or y > self.centre_y + 130:
                 # Ligne centrale voie Ouest (x = centre_x - 60)
-                pygame.draw.rect(self.ecran, BLANC, (self.centre_x - 65, y, 10, 30))
+                pygame.draw.rect(fond, BLANC, (self.centre_x - 65, y, 10, 30))
                 # Ligne centrale voie Est (x = centre_x + 60)
-                pygame.draw.rect(self.ecran, BLANC, (self.centre_x + 55, y, 10, 30))
+                pygame.draw.rect(fond, BLANC, (self.centre_x + 55, y, 10, 30))
 
         # Passages piétons (4 côtés)
-        self.dessiner_passages_pietons()
+        self.dessiner_passages_pietons(fond)
 
-    def dessiner_passages_pietons(self):
-        """Dessine les 4 passages piétons"""
+        return fond
+
+    def dessiner_passages_pietons(self, surface):
+        """Dessine les 4 passages piétons sur la surface donnée"""
         largeur_bande = 20
         espacement = 25
 
         # Nord
         for i in range(9):
-            pygame.draw.rect(self.ecran, BLANC,
+            pygame.draw.rect(surface, BLANC,
                            (self.centre_x - 110 + i * espacement, self.centre_y - 135,
                             largeur_bande, 12))
 
         # Sud
         for i in range(9):
-            pygame.draw.rect(self.ecran, BLANC,
+            pygame.draw.rect(surface, BLANC,
                            (self.centre_x - 110 + i * espacement, self.centre_y + 123,
                             largeur_bande, 12))
 
         # Ouest
         for i in range(9):
-            pygame.draw.rect(self.ecran, BLANC,
+            pygame.draw.rect(surface, BLANC,
                            (self.centre_x - 135, self.centre_y - 110 + i * espacement,
                             12, largeur_bande))
 
         # Est
         for i in range(9):
-            pygame.draw.rect(self.ecran, BLANC,
+            pygame.draw.rect(surface, BLANC,
                            (self.centre_x + 123, self.centre_y - 110 + i * espacement,
                             12, largeur_bande))
 
@@ -225,7 +443,7 @@ class GestionnaireRendu:
             pygame.draw.circle(self.ecran, NOIR, (x, y + 68), 16, 2)
 
             # Timer
-            texte = self.police_petite.render(f"{feu.temps_restant}s", True, BLANC)
+            texte = self.cache_texte.rendre(self.police_petite, f"{feu.temps_restant}s", True, BLANC)
             self.ecran.blit(texte, (x - 12, y + 85))
 
         else:  # horizontal
@@ -251,7 +469,7 @@ class GestionnaireRendu:
                 pygame.draw.circle(self.ecran, NOIR, (x + 68, y), 16, 2)
 
                 # Timer
-                texte = self.police_petite.render(f"{feu.temps_restant}s", True, BLANC)
+                texte = self.cache_texte.rendre(self.police_petite, f"{feu.temps_restant}s", True, BLANC)
                 self.ecran.blit(texte, (x + 30, y + 25))
             else:  # Est - poteau à droite (original)
                 # Poteau à DROITE (court comme les autres)
@@ -275,7 +493,7 @@ class GestionnaireRendu:
                 pygame.draw.circle(self.ecran, NOIR, (x + 68, y), 16, 2)
 
                 # Timer
-                texte = self.police_petite.render(f"{feu.temps_restant}s", True, BLANC)
+                texte = self.cache_texte.rendre(self.police_petite, f"{feu.temps_restant}s", True, BLANC)
                 self.ecran.blit(texte, (x + 30, y + 25))
 
     def dessiner_feu_pieton(self, x, y, feu):
@@ -335,15 +553,15 @@ class GestionnaireRendu:
             pygame.draw.circle(self.ecran, ROUGE, (pos_x, pos_y + 20), 4)
 
         # Texte "ACCIDENT"
-        texte_accident = self.police_normale.render("ACCIDENT", True, BLANC)
+        texte_accident = self.cache_texte.rendre(self.police_normale, "ACCIDENT", True, BLANC)
         rect_fond = pygame.Rect(pos_x - 60, pos_y - 90, 120, 35)
         pygame.draw.rect(self.ecran, ROUGE, rect_fond)
         pygame.draw.rect(self.ecran, BLANC, rect_fond, 2)
         self.ecran.blit(texte_accident, (pos_x - 55, pos_y - 85))
 
         # Compteur d'intervention
-        temps_restant = accident_actif["duree"] // 60
-        texte_temps = self.police_petite.render(f"Intervention: {temps_restant}s", True, BLANC)
+        temps_restant = int(accident_actif["duree"])
+        texte_temps = self.cache_texte.rendre(self.police_petite, f"Intervention: {temps_restant}s", True, BLANC)
         rect_temps = pygame.Rect(pos_x - 70, pos_y + 60, 140, 25)
         pygame.draw.rect(self.ecran, GRIS_FONCE, rect_temps)
         pygame.draw.rect(self.ecran, ORANGE, rect_temps, 2)
@@ -401,7 +619,7 @@ class GestionnaireRendu:
 
         # Animation de marche : oscillation continue
         # Chaque piéton a un décalage basé sur sa position
-        phase_marche = (self.frame_count + (progression * 100)) * 0.15
+        phase_marche = (self.frame_marche + (progression * 100)) * 0.15
 
         # Calcul du mouvement avant/arrière pour chaque jambe
         # sin() varie de -1 à +1, parfait pour avant/arrière
@@ -430,6 +648,21 @@ class GestionnaireRendu:
                         (int(x), int(jambe_y_start)),
                         (int(jambe_droite_x), int(jambe_droite_y)), epaisseur_droite)
 
+    def _profil_traversee(self):
+        """
+        Tire les piétons d'une traversée : type, taille et décalage de départ.
+
+        Returns:
+            list: (type_pieton, taille, décalage) pour chaque piéton, dans l'ordre de départ
+        """
+        profil = []
+        for i in range(NOMBRE_PIETONS_SIMULTANES):
+            type_pieton = self.rng.choice(TYPES_PIETONS)
+            # Étalement sur 1.5x la durée pour éviter regroupement
+            offset = i / (NOMBRE_PIETONS_SIMULTANES * 1.5)
+            profil.append((type_pieton, TAILLES_PIETONS[type_pieton], offset))
+        return profil
+
     def dessiner_pietons_traversant(self, feu_nord, feu_sud, feu_est, feu_ouest):
         """Affiche les piétons en train de traverser selon l'état des feux
 
@@ -484,6 +717,8 @@ class GestionnaireRendu:
         # Dessiner piétons pour chaque passage actif
         for sens, passage in passages.items():
             if not passage['actif']:
+                # Phase terminée : de nouveaux piétons seront tirés à la prochaine
+                self._profils_pietons.pop(sens, None)
                 continue
 
             # Calculer progression (0.0 à 1.0)
@@ -493,29 +728,21 @@ class GestionnaireRendu:
             # Compteur de piétons visibles
             pietons_count = 0
 
-            # Générer piétons avec types aléatoires (seed basée sur le sens pour cohérence)
-            random.seed(hash(sens))
-            types_pietons = []
-            for i in range(NOMBRE_PIETONS_SIMULTANES):
-                type_choix = random.choice(["enfant", "adulte", "adulte", "senior"])  # Plus d'adultes
-                taille_map = {"enfant": 0.7, "adulte": 1.0, "senior": 0.9}
-                types_pietons.append((type_choix, taille_map[type_choix]))
-            random.seed()  # Reset seed
+            # Piétons de cette traversée (tirés au début de la phase)
+            profil = self._profils_pietons.get(sens)
+            if profil is None:
+                profil = self._profil_traversee()
+                self._profils_pietons[sens] = profil
 
             # Dessiner plusieurs piétons espacés le long de TOUTE la traversée
-            for i in range(NOMBRE_PIETONS_SIMULTANES):
+            for type_pieton, taille, offset in profil:
                 # Chaque piéton démarre à un moment différent de la traversée
-                # Étalement sur 1.5x la durée pour éviter regroupement
-                offset = i / (NOMBRE_PIETONS_SIMULTANES * 1.5)
                 progression = progression_globale - offset
 
                 # Ne dessiner que si le piéton est dans la zone de traversée (0.0 à 1.0)
                 if progression < 0 or progression > 1.0:
                     continue  # Piéton pas encore parti ou déjà arrivé
 
-                # Récupérer type et taille de ce piéton
-                type_pieton, taille = types_pietons[i]
-
                 # Calculer position selon direction
                 if passage['direction'] == 'vertical':
                     x = passage['x_base']
@@ -547,19 +774,46 @@ class GestionnaireRendu:
 
                 # Fond du compteur
                 texte_compteur = f"{pietons_count} piéton{'s' if pietons_count > 1 else ''}"
-                texte_surf = self.police_petite.render(texte_compteur, True, BLANC)
+                texte_surf = self.cache_texte.rendre(self.police_petite, texte_compteur, True, BLANC)
                 texte_rect = texte_surf.get_rect(center=(compteur_x, compteur_y))
 
-                # Fond semi-transparent
+                # Fond semi-transparent (un par texte, créé une seule fois)
                 bg_rect = texte_rect.inflate(12, 8)
-                bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(bg_surf, (0, 150, 0, 180), bg_surf.get_rect(), border_radius=8)
+                bg_surf = self._bulles_pietons.get(texte_compteur)
+                if bg_surf is None:
+                    bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
+                    pygame.draw.rect(bg_surf, (0, 150, 0, 180), bg_surf.get_rect(), border_radius=8)
+                    self._bulles_pietons[texte_compteur] = bg_surf
                 self.ecran.blit(bg_surf, bg_rect.topleft)
 
                 # Texte
                 self.ecran.blit(texte_surf, texte_rect)
 
-    def dessiner_stats_rapides(self, x, y, cycle_count, temps_total_simulation, simulation_active, feu_nord, feu_sud):
+    def dessiner_section_entete(self, surface, x, y, simulation_active, cycle_count, temps_total_simulation,
+                                feu_nord, feu_sud):
+        """Dessine le header fixe du panneau (titre, stats rapides, bouton Démarrer/Arrêter)"""
+        panel_width = 590
+        pygame.draw.rect(surface, (255, 255, 255), (x, y, panel_width, self.header_height))
+
+        # Bordure en bas du header
+        pygame.draw.line(surface, (220, 220, 230), (x, y + self.header_height),
+                        (x + panel_width, y + self.header_height), 2)
+
+        # Titre
+        titre = self.cache_texte.rendre(self.police_titre, "CONTRÔLE INTERSECTION", True, (30, 41, 59))
+        surface.blit(titre, (x + 90, y + 15))
+
+        # Stats rapides en ligne (Cycle, Phase, Temps)
+        self.dessiner_stats_rapides(surface, x, y + 55, cycle_count, temps_total_simulation, simulation_active,
+                                    feu_nord, feu_sud)
+
+        # Bouton Démarrer/Arrêter
+        self.dessiner_bouton_principal(surface, x, y + 98, simulation_active)
+
+        return y + self.header_height + 2
+
+    def dessiner_stats_rapides(self, surface, x, y, cycle_count, temps_total_simulation, simulation_active,
+                               feu_nord, feu_sud):
         """Dessine les 3 stats rapides dans le header (Cycle, Phase, Temps)"""
         card_width = 150  # Réduit de 170 à 150
         card_height = 36
@@ -585,18 +839,18 @@ class GestionnaireRendu:
         for i, stat in enumerate(stats):
             sx = start_x + i * (card_width + gap)
             # Fond
-            pygame.draw.rect(self.ecran, stat["bg"], (sx, y, card_width, card_height), border_radius=8)
-            pygame.draw.rect(self.ecran, stat["border"], (sx, y, card_width, card_height), 1, border_radius=8)
+            pygame.draw.rect(surface, stat["bg"], (sx, y, card_width, card_height), border_radius=8)
+            pygame.draw.rect(surface, stat["border"], (sx, y, card_width, card_height), 1, border_radius=8)
 
             # Label
-            label_surf = self.police_petite.render(stat["label"], True, stat["text"])
-            self.ecran.blit(label_surf, (sx + 8, y + 5))
+            label_surf = self.cache_texte.rendre(self.police_petite, stat["label"], True, stat["text"])
+            surface.blit(label_surf, (sx + 8, y + 5))
 
             # Valeur
-            value_surf = self.police_normale.render(stat["value"], True, stat["text"])
-            self.ecran.blit(value_surf, (sx + 8, y + 17))
+            value_surf = self.cache_texte.rendre(self.police_normale, stat["value"], True, stat["text"])
+            surface.blit(value_surf, (sx + 8, y + 17))
 
-    def dessiner_bouton_principal(self, x, y, simulation_active):
+    def dessiner_bouton_principal(self, surface, x, y, simulation_active):
         """Dessine le bouton Démarrer/Arrêter dans le header"""
         btn_width = 470
         btn_height = 38
@@ -609,22 +863,22 @@ class GestionnaireRendu:
             couleur_bg = (239, 68, 68)  # Rouge vif
             texte_bouton = "|| Arrêter"
 
-        # Ombre subtile
+        # Ombre subtile (dessinée seulement quand la tuile du header est redessinée)
         shadow_surf = pygame.Surface((btn_width + 4, btn_height + 4), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surf, (0, 0, 0, 30), (0, 0, btn_width + 4, btn_height + 4), border_radius=10)
-        self.ecran.blit(shadow_surf, (btn_x - 2, y - 2))
+        surface.blit(shadow_surf, (btn_x - 2, y - 2))
 
         # Bouton
-        pygame.draw.rect(self.ecran, couleur_bg, (btn_x, y, btn_width, btn_height), border_radius=10)
+        pygame.draw.rect(surface, couleur_bg, (btn_x, y, btn_width, btn_height), border_radius=10)
 
         # Texte centré
-        texte = self.police_normale.render(texte_bouton, True, BLANC)
+        texte = self.cache_texte.rendre(self.police_normale, texte_bouton, True, BLANC)
         texte_rect = texte.get_rect(center=(btn_x + btn_width // 2, y + btn_height // 2))
-        self.ecran.blit(texte, texte_rect)
+        surface.blit(texte, texte_rect)
 
         # Sauvegarder le rectangle pour les clics
-        self.btn_start = pygame.Rect(btn_x, y, btn_width, btn_height)
-        self.btn_stop = pygame.Rect(btn_x, y, btn_width, btn_height)
+        self._bouton_tuile("btn_start", btn_x, y, btn_width, btn_height)
+        self._bouton_tuile("btn_stop", btn_x, y, btn_width, btn_height)
 
     def dessiner_section_feux(self, surface, x, y, feu_nord, feu_sud, feu_est, feu_ouest):
         """Dessine la section État des Feux comme une card"""
@@ -644,7 +898,7 @@ class GestionnaireRendu:
         # Titre de la section avec point lumineux animé
         titre_y = y + 16
         pygame.draw.circle(surface, (34, 197, 94), (card_x + 16, titre_y + 6), 4)  # Point vert
-        titre = self.police_petite.render("ÉTAT DES FEUX", True, (30, 41, 59))
+        titre = self.cache_texte.rendre(self.police_petite, "ÉTAT DES FEUX", True, (30, 41, 59))
         surface.blit(titre, (card_x + 28, titre_y))
 
         # Grille 2x2 des feux
@@ -688,19 +942,19 @@ class GestionnaireRendu:
 
         # Direction et point lumineux
         pygame.draw.circle(surface, light_color, (x + 12, y + 18), 5)
-        dir_text = self.police_petite.render(direction, True, text_color)
+        dir_text = self.cache_texte.rendre(self.police_petite, direction, True, text_color)
         surface.blit(dir_text, (x + 24, y + 12))
 
         # Timer
-        timer_text = self.police_titre.render(f"{feu.temps_restant}s", True, text_color)
+        timer_text = self.cache_texte.rendre(self.police_titre, f"{feu.temps_restant}s", True, text_color)
         surface.blit(timer_text, (x + width - 60, y + 8))
 
         # État textuel
-        etat_text = self.police_petite.render(
+        etat_text = self.cache_texte.rendre(
+            self.police_petite,
             "Passage autorisé" if feu.couleur == "Vert" else "Arrêt obligatoire" if feu.couleur == "Rouge" else "Attention",
-            True, text_color
+            True, text_color, alpha=180
         )
-        etat_text.set_alpha(180)
         surface.blit(etat_text, (x + 12, y + 50))
 
         return y + height
@@ -720,7 +974,7 @@ class GestionnaireRendu:
         pygame.draw.rect(surface, (229, 231, 235), (card_x, y, card_width, card_height), 1, border_radius=12)
 
         # Titre
-        titre = self.police_petite.render("TRAFIC EN TEMPS RÉEL", True, (30, 41, 59))
+        titre = self.cache_texte.rendre(self.police_petite, "TRAFIC EN TEMPS RÉEL", True, (30, 41, 59))
         surface.blit(titre, (card_x + 16, y + 16))
 
         # Grille 2x2 des stats - Dimensions optimisées
@@ -748,16 +1002,15 @@ class GestionnaireRendu:
         pygame.draw.rect(surface, stat["border"], (x, y, width, height), 2, border_radius=10)
 
         # Icône
-        icon_text = self.police_normale.render(stat["icon"], True, stat["text"])
+        icon_text = self.cache_texte.rendre(self.police_normale, stat["icon"], True, stat["text"])
         surface.blit(icon_text, (x + 12, y + 10))
 
         # Label
-        label_text = self.police_petite.render(stat["label"], True, stat["text"])
-        label_text.set_alpha(180)
+        label_text = self.cache_texte.rendre(self.police_petite, stat["label"], True, stat["text"], alpha=180)
         surface.blit(label_text, (x + 40, y + 10))
 
         # Valeur
-        value_text = self.police_titre.render(str(stat["value"]), True, stat["text"])
+        value_text = self.cache_texte.rendre(self.police_titre, str(stat["value"]), True, stat["text"])
         surface.blit(value_text, (x + 40, y + 30))
 
     def dessiner_section_pietons(self, surface, x, y):
@@ -775,7 +1028,7 @@ class GestionnaireRendu:
         pygame.draw.rect(surface, (229, 231, 235), (card_x, y, card_width, card_height), 1, border_radius=12)
 
         # Titre
-        titre = self.police_petite.render("CONTRÔLE PIÉTONS", True, (30, 41, 59))
+        titre = self.cache_texte.rendre(self.police_petite, "CONTRÔLE PIÉTONS", True, (30, 41, 59))
         surface.blit(titre, (card_x + 16, y + 16))
 
         # Boutons 2x2 - Dimensions optimisées pour rentrer dans le conteneur
@@ -795,25 +1048,13 @@ class GestionnaireRendu:
         for i, (label, bx, by) in enumerate(boutons):
             pygame.draw.rect(surface, (239, 246, 255), (bx, by, btn_width, btn_height), border_radius=10)
             pygame.draw.rect(surface, (147, 197, 253), (bx, by, btn_width, btn_height), 2, border_radius=10)
-            btn_text = self.police_normale.render(label, True, (29, 78, 216))
+            btn_text = self.cache_texte.rendre(self.police_normale, label, True, (29, 78, 216))
             btn_rect = btn_text.get_rect(center=(bx + btn_width // 2, by + btn_height // 2))
             surface.blit(btn_text, btn_rect)
 
-            # Sauvegarder les rectangles de clic (position absolue à l'écran)
-            # panel_x = largeur - 590, position absolue = panel_x + bx
-            # position y à l'écran = header_height + (by - scroll_offset)
-            panel_x = self.largeur - 590
-            screen_x = panel_x + bx
-            screen_y = self.header_height + by - self.scroll_offset
-
-            if i == 0:
-                self.btn_pieton_nord = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
-            elif i == 1:
-                self.btn_pieton_sud = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
-            elif i == 2:
-                self.btn_pieton_est = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
-            elif i == 3:
-                self.btn_pieton_ouest = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
+            # Sauvegarder les rectangles de clic (placés à l'écran avec la tuile)
+            nom = ("btn_pieton_nord", "btn_pieton_sud", "btn_pieton_est", "btn_pieton_ouest")[i]
+            self._bouton_tuile(nom, bx, by, btn_width, btn_height)
 
         return y + card_height
 
@@ -832,25 +1073,22 @@ class GestionnaireRendu:
         pygame.draw.rect(surface, (229, 231, 235), (card_x, y, card_width, card_height), 1, border_radius=12)
 
         # Titre
-        titre = self.police_petite.render("GESTION URGENCES", True, (30, 41, 59))
+        titre = self.cache_texte.rendre(self.police_petite, "GESTION URGENCES", True, (30, 41, 59))
         surface.blit(titre, (card_x + 16, y + 16))
 
         # Bouton Accident - Optimisé
         acc_y = y + 45
         acc_color = (239, 68, 68) if not mode_urgence else (185, 28, 28)
         pygame.draw.rect(surface, acc_color, (card_x + 16, acc_y, card_width - 32, 48), border_radius=10)
-        acc_text = self.police_normale.render("! Simuler Accident", True, BLANC)
+        acc_text = self.cache_texte.rendre(self.police_normale, "! Simuler Accident", True, BLANC)
         acc_rect = acc_text.get_rect(center=(card_x + card_width // 2, acc_y + 24))
         surface.blit(acc_text, acc_rect)
 
-        # Sauvegarder rectangle de clic (position absolue à l'écran)
-        panel_x = self.largeur - 590
-        screen_acc_x = panel_x + card_x + 16
-        screen_acc_y = self.header_height + acc_y - self.scroll_offset
-        self.btn_urgence = pygame.Rect(screen_acc_x, screen_acc_y, card_width - 32, 48)
+        # Sauvegarder rectangle de clic (placé à l'écran avec la tuile)
+        self._bouton_tuile("btn_urgence", card_x + 16, acc_y, card_width - 32, 48)
 
         # Sous-titre Ambulances
-        amb_title = self.police_petite.render("AMBULANCES", True, (100, 107, 115))
+        amb_title = self.cache_texte.rendre(self.police_petite, "AMBULANCES", True, (100, 107, 115))
         surface.blit(amb_title, (card_x + 16, y + 108))
 
         # Boutons Ambulances 2x2 - Dimensions réduites
@@ -868,22 +1106,13 @@ class GestionnaireRendu:
         for i, (label, bx, by) in enumerate(boutons_amb):
             pygame.draw.rect(surface, (255, 247, 237), (bx, by, btn_width, btn_height), border_radius=10)
             pygame.draw.rect(surface, (251, 146, 60), (bx, by, btn_width, btn_height), 1, border_radius=10)
-            btn_text = self.police_normale.render(label, True, (234, 88, 12))
+            btn_text = self.cache_texte.rendre(self.police_normale, label, True, (234, 88, 12))
             btn_rect = btn_text.get_rect(center=(bx + btn_width // 2, by + btn_height // 2))
             surface.blit(btn_text, btn_rect)
 
-            # Sauvegarder les rectangles de clic (position absolue à l'écran)
-            screen_x = panel_x + bx
-            screen_y = self.header_height + by - self.scroll_offset
-
-            if i == 0:
-                self.btn_ambulance_nord = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
-            elif i == 1:
-                self.btn_ambulance_sud = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
-            elif i == 2:
-                self.btn_ambulance_est = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
-            elif i == 3:
-                self.btn_ambulance_ouest = pygame.Rect(screen_x, screen_y, btn_width, btn_height)
+            # Sauvegarder les rectangles de clic (placés à l'écran avec la tuile)
+            nom = ("btn_ambulance_nord", "btn_ambulance_sud", "btn_ambulance_est", "btn_ambulance_ouest")[i]
+            self._bouton_tuile(nom, bx, by, btn_width, btn_height)
 
         return y + card_height
 
@@ -913,15 +1142,47 @@ class GestionnaireRendu:
             btn_text_str = "Meteo: NORMAL (cliquer pour pluie)"
 
         pygame.draw.rect(surface, btn_color, (card_x + 16, btn_y, card_width - 32, btn_height), border_radius=10)
-        btn_text = self.police_normale.render(btn_text_str, True, BLANC)
+        btn_text = self.cache_texte.rendre(self.police_normale, btn_text_str, True, BLANC)
         btn_rect = btn_text.get_rect(center=(card_x + card_width // 2, btn_y + btn_height // 2))
         surface.blit(btn_text, btn_rect)
 
-        # Sauvegarder rectangle de clic (position absolue à l'écran)
-        panel_x = self.largeur - 590
-        screen_x = panel_x + card_x + 16
-        screen_y = self.header_height + btn_y - self.scroll_offset
-        self.btn_meteo = pygame.Rect(screen_x, screen_y, card_width - 32, btn_height)
+        # Sauvegarder rectangle de clic (placé à l'écran avec la tuile)
+        self._bouton_tuile("btn_meteo", card_x + 16, btn_y, card_width - 32, btn_height)
+
+        return y + card_height
+
+    def dessiner_section_vitesse(self, surface, x, y, facteur_vitesse):
+        """Dessine la section Vitesse avec un bouton pour changer l'accélération"""
+        card_x = x + 30
+        card_width = 530
+        card_height = 80
+
+        # Ombre et fond
+        shadow_surf = pygame.Surface((card_width + 4, card_height + 4), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_surf, (0, 0, 0, 20), (0, 0, card_width + 4, card_height + 4), border_radius=12)
+        surface.blit(shadow_surf, (card_x - 2, y - 2))
+
+        pygame.draw.rect(surface, BLANC, (card_x, y, card_width, card_height), border_radius=12)
+        pygame.draw.rect(surface, (229, 231, 235), (card_x, y, card_width, card_height), 1, border_radius=12)
+
+        # Bouton Vitesse
+        btn_y = y + 16
+        btn_height = 48
+
+        if facteur_vitesse == 1:
+            btn_color = (100, 116, 139)  # Gris ardoise (temps réel)
+        else:
+            btn_color = (126, 34, 206)  # Violet (accéléré)
+        libelle = f"x{facteur_vitesse}" if facteur_vitesse else "MAX"
+        btn_text_str = f"Vitesse: {libelle} (cliquer ou +/- pour changer)"
+
+        pygame.draw.rect(surface, btn_color, (card_x + 16, btn_y, card_width - 32, btn_height), border_radius=10)
+        btn_text = self.cache_texte.rendre(self.police_normale, btn_text_str, True, BLANC)
+        btn_rect = btn_text.get_rect(center=(card_x + card_width // 2, btn_y + btn_height // 2))
+        surface.blit(btn_text, btn_rect)
+
+        # Sauvegarder rectangle de clic (placé à l'écran avec la tuile)
+        self._bouton_tuile("btn_vitesse", card_x + 16, btn_y, card_width - 32, btn_height)
 
         return y + card_height
 
@@ -941,7 +1202,7 @@ class GestionnaireRendu:
         pygame.draw.rect(surface, (229, 231, 235), (card_x, y, card_width, card_height), 1, border_radius=12)
 
         # Titre
-        titre = self.police_petite.render("ÉVÉNEMENTS RÉCENTS", True, (30, 41, 59))
+        titre = self.cache_texte.rendre(self.police_petite, "ÉVÉNEMENTS RÉCENTS", True, (30, 41, 59))
         surface.blit(titre, (card_x + 16, y + 16))
 
         event_y = y + 45  # Réduit de 50 à 45
@@ -950,12 +1211,11 @@ class GestionnaireRendu:
         # Carte Accidents
         pygame.draw.rect(surface, (254, 242, 242), (card_x + 16, event_y, card_width - 32, event_height), border_radius=10)
         pygame.draw.rect(surface, (252, 165, 165), (card_x + 16, event_y, card_width - 32, event_height), 1, border_radius=10)
-        icon_text = self.police_normale.render("!", True, (220, 38, 38))
+        icon_text = self.cache_texte.rendre(self.police_normale, "!", True, (220, 38, 38))
         surface.blit(icon_text, (card_x + 28, event_y + 10))
-        event_title = self.police_normale.render(f"{compteur_accidents} Accidents", True, (153, 27, 27))
+        event_title = self.cache_texte.rendre(self.police_normale, f"{compteur_accidents} Accidents", True, (153, 27, 27))
         surface.blit(event_title, (card_x + 50, event_y + 10))
-        event_sub = self.police_petite.render("Actifs dans la zone", True, (153, 27, 27))
-        event_sub.set_alpha(180)
+        event_sub = self.cache_texte.rendre(self.police_petite, "Actifs dans la zone", True, (153, 27, 27), alpha=180)
         surface.blit(event_sub, (card_x + 55, event_y + 28))
 
         event_y += 60  # event_height (50) + gap (10)
@@ -963,12 +1223,11 @@ class GestionnaireRendu:
         # Carte Ambulances
         pygame.draw.rect(surface, (255, 247, 237), (card_x + 16, event_y, card_width - 32, event_height), border_radius=10)
         pygame.draw.rect(surface, (251, 191, 36), (card_x + 16, event_y, card_width - 32, event_height), 1, border_radius=10)
-        icon_text = self.police_normale.render("+", True, (234, 88, 12))
+        icon_text = self.cache_texte.rendre(self.police_normale, "+", True, (234, 88, 12))
         surface.blit(icon_text, (card_x + 28, event_y + 10))
-        event_title = self.police_normale.render(f"{compteur_ambulances} Ambulances", True, (194, 65, 12))
+        event_title = self.cache_texte.rendre(self.police_normale, f"{compteur_ambulances} Ambulances", True, (194, 65, 12))
         surface.blit(event_title, (card_x + 50, event_y + 10))
-        event_sub = self.police_petite.render("En circulation", True, (194, 65, 12))
-        event_sub.set_alpha(180)
+        event_sub = self.cache_texte.rendre(self.police_petite, "En circulation", True, (194, 65, 12), alpha=180)
         surface.blit(event_sub, (card_x + 55, event_y + 28))
 
         # Mode Urgence actif (si applicable)
@@ -976,12 +1235,11 @@ class GestionnaireRendu:
             event_y += 60
             pygame.draw.rect(surface, (250, 245, 255), (card_x + 16, event_y, card_width - 32, event_height), border_radius=10)
             pygame.draw.rect(surface, (192, 132, 252), (card_x + 16, event_y, card_width - 32, event_height), 1, border_radius=10)
-            icon_text = self.police_normale.render("*", True, (126, 34, 206))
+            icon_text = self.cache_texte.rendre(self.police_normale, "*", True, (126, 34, 206))
             surface.blit(icon_text, (card_x + 28, event_y + 10))
-            event_title = self.police_normale.render("Mode Urgence Actif", True, (107, 33, 168))
+            event_title = self.cache_texte.rendre(self.police_normale, "Mode Urgence Actif", True, (107, 33, 168))
             surface.blit(event_title, (card_x + 50, event_y + 10))
-            event_sub = self.police_petite.render("Priorité maximale", True, (107, 33, 168))
-            event_sub.set_alpha(180)
+            event_sub = self.cache_texte.rendre(self.police_petite, "Priorité maximale", True, (107, 33, 168), alpha=180)
             surface.blit(event_sub, (card_x + 55, event_y + 28))
 
         return y + card_height
@@ -1001,7 +1259,7 @@ class GestionnaireRendu:
         pygame.draw.rect(surface, (229, 231, 235), (card_x, y, card_width, card_height), 1, border_radius=12)
 
         # Titre
-        titre = self.police_petite.render("TRAFIC (12 DERNIÈRES PHASES)", True, (30, 41, 59))
+        titre = self.cache_texte.rendre(self.police_petite, "TRAFIC (12 DERNIÈRES PHASES)", True, (30, 41, 59))
         surface.blit(titre, (card_x + 16, y + 16))
 
         # === ZONE GRAPHIQUE ===
@@ -1037,7 +1295,7 @@ class GestionnaireRendu:
 
         # === LABELS AXE Y (Nombre de véhicules) ===
         # Label principal de l'axe Y
-        label_y = self.police_petite.render("Véhicules", True, (100, 116, 139))
+        label_y = self.cache_texte.rendre(self.police_petite, "Véhicules", True, (100, 116, 139))
         # Rotation du texte (vertical)
         label_y_rotated = pygame.transform.rotate(label_y, 90)
         surface.blit(label_y_rotated, (card_x + 10, graph_y + graph_height // 2 - 25))
@@ -1050,7 +1308,7 @@ class GestionnaireRendu:
             pygame.draw.line(surface, (100, 116, 139), 
                             (graph_x - 5, py), (graph_x, py), 1)
             # Valeur
-            val_text = self.police_petite.render(str(val), True, (100, 116, 139))
+            val_text = self.cache_texte.rendre(self.police_petite, str(val), True, (100, 116, 139))
             surface.blit(val_text, (graph_x - 30, py - 8))
 
         # === DESSINER LES BARRES ===
@@ -1078,12 +1336,12 @@ class GestionnaireRendu:
 
             # Valeur au-dessus de la barre (si assez haute)
             if bar_height > 15:
-                val_text = self.police_petite.render(str(value), True, BLANC)
+                val_text = self.cache_texte.rendre(self.police_petite, str(value), True, BLANC)
                 val_rect = val_text.get_rect(center=(bar_x + bar_width // 2, bar_y + 8))
                 surface.blit(val_text, val_rect)
 
         # === LABELS AXE X (Numéros de cycles) ===
-        label_x = self.police_petite.render("Phases (cycles)", True, (100, 116, 139))
+        label_x = self.cache_texte.rendre(self.police_petite, "Phases (cycles)", True, (100, 116, 139))
         label_x_rect = label_x.get_rect(center=(graph_x + graph_width // 2, 
                                                 graph_y + graph_height + 25))
         surface.blit(label_x, label_x_rect)
@@ -1101,7 +1359,7 @@ class GestionnaireRendu:
             # Numéro de cycle
             cycle_num = cycle_total - bar_count + i + 1
             if cycle_num > 0:
-                cycle_text = self.police_petite.render(str(cycle_num), True, (100, 116, 139))
+                cycle_text = self.cache_texte.rendre(self.police_petite, str(cycle_num), True, (100, 116, 139))
                 cycle_rect = cycle_text.get_rect(center=(px, py + 15))
                 surface.blit(cycle_text, cycle_rect)
 
@@ -1111,106 +1369,129 @@ class GestionnaireRendu:
         # Carré N-S (bleu)
         pygame.draw.rect(surface, (59, 130, 246), 
                         (card_x + 150, legende_y, 12, 12), border_radius=2)
-        legende_ns = self.police_petite.render("N-S", True, (100, 116, 139))
+        legende_ns = self.cache_texte.rendre(self.police_petite, "N-S", True, (100, 116, 139))
         surface.blit(legende_ns, (card_x + 168, legende_y))
 
         # Carré E-O (orange)
         pygame.draw.rect(surface, (251, 146, 60), 
                         (card_x + 220, legende_y, 12, 12), border_radius=2)
-        legende_eo = self.police_petite.render("E-O", True, (100, 116, 139))
+        legende_eo = self.cache_texte.rendre(self.police_petite, "E-O", True, (100, 116, 139))
         surface.blit(legende_eo, (card_x + 238, legende_y))
 
         # Info : Total combiné
-        info_text = self.police_petite.render("(Somme N-S + E-O)", True, (100, 116, 139))
-        info_text.set_alpha(150)
+        info_text = self.cache_texte.rendre(self.police_petite, "(Somme N-S + E-O)", True, (100, 116, 139), alpha=150)
         surface.blit(info_text, (card_x + 300, legende_y))
 
         return y + card_height
 
+    def _bouton_tuile(self, nom, x, y, largeur, hauteur):
+        """Enregistre le rectangle de clic d'un bouton dessiné dans la tuile en cours"""
+        self._boutons_tuile[nom] = pygame.Rect(x, y, largeur, hauteur)
+
+    def _tuile_section(self, cle, signature, dessiner, args):
+        """
+        Retourne la tuile en cache d'une section du panneau, redessinée
+        uniquement si les valeurs qu'elle affiche (signature) ont changé.
+
+        Args:
+            cle (str): Nom de la section
+            signature (tuple): Valeurs affichées par la section
+            dessiner (callable): Méthode dessiner_section_* (surface, x, y, *args)
+            args (tuple): Arguments propres à la section
+
+        Returns:
+            tuple: (surface, hauteur de la card, boutons en coordonnées de la tuile)
+        """
+        tuile = self._tuiles_panneau.get(cle)
+        if tuile is not None and tuile[0] == signature:
+            return tuile[1:]
+
+        brouillon = self._brouillon_tuile
+        brouillon.fill(COULEUR_FOND_PANNEAU)
+        self._boutons_tuile = {}
+        bas = dessiner(brouillon, 0, MARGE_TUILE_PANNEAU, *args)
+        surface = brouillon.subsurface((0, 0, brouillon.get_width(), bas + MARGE_TUILE_PANNEAU)).copy()
+        tuile = (signature, surface, bas - MARGE_TUILE_PANNEAU, self._boutons_tuile)
+        self._tuiles_panneau[cle] = tuile
+        return tuile[1:]
+
     def dessiner_panel_droit(self, simulation_active, mode_urgence, feu_nord, feu_sud, feu_est, feu_ouest,
                             cycle_count, temps_total_simulation, voitures_nord, voitures_sud, voitures_est, voitures_ouest,
                             compteur_pietons_ns, compteur_pietons_eo, compteur_accidents, compteur_ambulances,
-                            ambulance_active, historique_trafic_ns, historique_trafic_eo):
+                            ambulance_active, historique_trafic_ns, historique_trafic_eo, facteur_vitesse=1):
         """Dessine le panneau de contrôle à droite avec header fixe et contenu scrollable"""
         panel_x = self.largeur - 590
         panel_width = 590
 
         # Fond du panneau avec gradient
-        pygame.draw.rect(self.ecran, (248, 249, 250), (panel_x, 0, panel_width, self.hauteur))
+        pygame.draw.rect(self.ecran, COULEUR_FOND_PANNEAU, (panel_x, 0, panel_width, self.hauteur))
         pygame.draw.line(self.ecran, (220, 220, 230), (panel_x, 0), (panel_x, self.hauteur), 2)
 
         # ═══════════════════════════════════════════════════════
         # HEADER FIXE (non-scrollable)
         # ═══════════════════════════════════════════════════════
-        header_bg = pygame.Surface((panel_width, self.header_height))
-        header_bg.fill((255, 255, 255))
-        self.ecran.blit(header_bg, (panel_x, 0))
-
-        # Bordure en bas du header
-        pygame.draw.line(self.ecran, (220, 220, 230), (panel_x, self.header_height),
-                        (panel_x + panel_width, self.header_height), 2)
-
-        # Titre
-        titre = self.police_titre.render("CONTRÔLE INTERSECTION", True, (30, 41, 59))
-        self.ecran.blit(titre, (panel_x + 90, 15))
-
-        # Stats rapides en ligne (Cycle, Phase, Temps)
-        y_stats = 55
-        self.dessiner_stats_rapides(panel_x, y_stats, cycle_count, temps_total_simulation, simulation_active, feu_nord, feu_sud)
-
-        # Bouton Démarrer/Arrêter
-        y_btn = 98
-        self.dessiner_bouton_principal(panel_x, y_btn, simulation_active)
+        # Tuile en cache comme les sections, redessinée seulement quand ses valeurs changent
+        entete, _, boutons = self._tuile_section(
+            "entete",
+            (simulation_active, cycle_count, int(temps_total_simulation), feu_nord.couleur, feu_sud.couleur),
+            self.dessiner_section_entete,
+            (simulation_active, cycle_count, temps_total_simulation, feu_nord, feu_sud)
+        )
+        self.ecran.blit(entete, (panel_x, -MARGE_TUILE_PANNEAU))
+        for nom, rect in boutons.items():
+            setattr(self, nom, rect.move(panel_x, -MARGE_TUILE_PANNEAU))
 
         # ═══════════════════════════════════════════════════════
         # CONTENU SCROLLABLE
         # ═══════════════════════════════════════════════════════
-        # Créer une surface pour le contenu scrollable
-        content_height = 2000  # Hauteur totale du contenu (suffisamment grande)
-        scroll_surface = pygame.Surface((panel_width, content_height))
-        scroll_surface.fill((248, 249, 250))
-
-        # Dessiner toutes les sections sur la surface scrollable
-        y = 20  # Marge du haut augmentée
-
-        # Section 1: État des feux
-        y = self.dessiner_section_feux(scroll_surface, 0, y, feu_nord, feu_sud, feu_est, feu_ouest)
-        y += 20  # Espacement entre sections augmenté
-
-        # Section 2: Statistiques temps réel
-        y = self.dessiner_section_stats(scroll_surface, 0, y, voitures_nord, voitures_sud,
-                                       voitures_est, voitures_ouest, compteur_pietons_ns, compteur_pietons_eo)
-        y += 20
-
-        # Section 3: Contrôle Piétons
-        y = self.dessiner_section_pietons(scroll_surface, 0, y)
-        y += 20
-
-        # Section 4: Gestion Urgences
-        y = self.dessiner_section_urgences(scroll_surface, 0, y, mode_urgence)
-        y += 20
+        # Chaque section est une tuile en cache, redessinée seulement quand les
+        # valeurs qu'elle affiche changent ; le défilement ne fait que déplacer les tuiles
+        feux = (feu_nord, feu_sud, feu_est, feu_ouest)
+        sections = [
+            # Section 1: État des feux
+            ("feux", tuple((feu.couleur, feu.temps_restant) for feu in feux),
+             self.dessiner_section_feux, feux),
+            # Section 2: Statistiques temps réel
+            ("stats", (len(voitures_nord) + len(voitures_sud), len(voitures_est) + len(voitures_ouest),
+                       compteur_pietons_ns, compteur_pietons_eo),
+             self.dessiner_section_stats, (voitures_nord, voitures_sud, voitures_est, voitures_ouest,
+                                           compteur_pietons_ns, compteur_pietons_eo)),
+            # Section 3: Contrôle Piétons
+            ("pietons", (), self.dessiner_section_pietons, ()),
+            # Section 4: Gestion Urgences
+            ("urgences", (mode_urgence,), self.dessiner_section_urgences, (mode_urgence,)),
+            # Section 5: Météo
+            ("meteo", (meteo.est_pluie,), self.dessiner_section_meteo, ()),
+            # Section 5 bis: Vitesse de simulation
+            ("vitesse", (facteur_vitesse,), self.dessiner_section_vitesse, (facteur_vitesse,)),
+            # Section 6: Événements récents
+            ("evenements", (compteur_accidents, compteur_ambulances, mode_urgence),
+             self.dessiner_section_evenements, (compteur_accidents, compteur_ambulances, mode_urgence)),
+            # Section 7: Graphique
+            ("graphique", (tuple(historique_trafic_ns), tuple(historique_trafic_eo)),
+             self.dessiner_section_graphique, (historique_trafic_ns, historique_trafic_eo)),
+        ]
 
-        # Section 5: Météo
-        y = self.dessiner_section_meteo(scroll_surface, 0, y)
-        y += 20
+        scrollable_area_height = self.hauteur - self.header_height
+        zone_contenu = pygame.Rect(panel_x, self.header_height, panel_width, scrollable_area_height)
+        pygame.draw.rect(self.ecran, COULEUR_FOND_PANNEAU, zone_contenu)
+        self.ecran.set_clip(zone_contenu)
 
-        # Section 6: Événements récents
-        y = self.dessiner_section_evenements(scroll_surface, 0, y, compteur_accidents,
-                                             compteur_ambulances, mode_urgence)
-        y += 20
+        y = 20  # Marge du haut augmentée
+        for cle, signature, dessiner, args in sections:
+            tuile, hauteur, boutons = self._tuile_section(cle, signature, dessiner, args)
+            y_ecran = self.header_height + y - MARGE_TUILE_PANNEAU - self.scroll_offset
+            if y_ecran < self.hauteur and y_ecran + tuile.get_height() > self.header_height:
+                self.ecran.blit(tuile, (panel_x, y_ecran))
+            for nom, rect in boutons.items():
+                setattr(self, nom, rect.move(panel_x, y_ecran))
+            y += hauteur + 20  # Espacement entre sections (et marge en bas)
 
-        # Section 7: Graphique
-        y = self.dessiner_section_graphique(scroll_surface, 0, y, historique_trafic_ns, historique_trafic_eo)
-        y += 20  # Marge en bas
+        self.ecran.set_clip(None)
 
         # Calculer scroll_max
-        scrollable_area_height = self.hauteur - self.header_height
         self.scroll_max = max(0, y - scrollable_area_height + 20)
 
-        # Blitter la partie visible de la surface scrollable
-        visible_rect = pygame.Rect(0, self.scroll_offset, panel_width, scrollable_area_height)
-        self.ecran.blit(scroll_surface, (panel_x, self.header_height), visible_rect)
-
     def dessiner_boutons(self, x, y, simulation_active, mode_urgence):
         """Dessine les boutons de contrôle avec design moderne inspiré de l'image"""
         y_start = y  # Sauvegarder position de départ pour calcul des Rects
@@ -1229,13 +1510,13 @@ class GestionnaireRendu:
 
         # Dessiner le bouton unique centré
         pygame.draw.rect(self.ecran, couleur_bg, (x + 40, y, 510, 50), border_radius=10)
-        texte = self.police_normale.render(texte_bouton, True, couleur_texte)
+        texte = self.cache_texte.rendre(self.police_normale, texte_bouton, True, couleur_texte)
         texte_rect = texte.get_rect(center=(x + 295, y + 25))
         self.ecran.blit(texte, texte_rect)
 
         # Section PIÉTONS avec titre bien espacé
         y += 58
-        titre_pietons = self.police_petite.render("PIÉTONS", True, (100, 100, 120))
+        titre_pietons = self.cache_texte.rendre(self.police_petite, "PIÉTONS", True, (100, 100, 120))
         self.ecran.blit(titre_pietons, (x + 260, y))
 
         y += 20
@@ -1261,7 +1542,7 @@ class GestionnaireRendu:
         for label, bx, by in boutons_pietons:
             # Bleu clair comme dans l'image
             pygame.draw.rect(self.ecran, (210, 230, 255), (bx, by, largeur_btn, hauteur_btn), border_radius=8)
-            texte = self.police_normale.render(label, True, (60, 120, 220))
+            texte = self.cache_texte.rendre(self.police_normale, label, True, (60, 120, 220))
             texte_rect = texte.get_rect(center=(bx + largeur_btn//2, by + hauteur_btn//2))
             self.ecran.blit(texte, texte_rect)
 
@@ -1271,8 +1552,8 @@ class GestionnaireRendu:
         texte_couleur_accident = BLANC
 
         pygame.draw.rect(self.ecran, couleur_accident_bg, (x + 40, y, 510, 55), border_radius=10)
-        texte_urgence = self.police_normale.render("⚠  Simuler Accident" if not mode_urgence else "⚠  ACCIDENT EN COURS",
-                                                   True, texte_couleur_accident)
+        texte_urgence = self.cache_texte.rendre(self.police_normale, "⚠  Simuler Accident" if not mode_urgence else "⚠  ACCIDENT EN COURS",
+                                                True, texte_couleur_accident)
         texte_rect = texte_urgence.get_rect(center=(x + 295, y + 27))
         self.ecran.blit(texte_urgence, texte_rect)
 
@@ -1294,7 +1575,7 @@ class GestionnaireRendu:
         for label, bx, by in boutons_ambulances:
             # Beige/orange clair comme dans l'image
             pygame.draw.rect(self.ecran, (255, 237, 213), (bx, by, largeur_btn, hauteur_btn), border_radius=5)
-            texte = self.police_normale.render(label, True, (220, 120, 50))
+            texte = self.cache_texte.rendre(self.police_normale, label, True, (220, 120, 50))
             texte_rect = texte.get_rect(center=(bx + largeur_btn//2, by + hauteur_btn//2))
             self.ecran.blit(texte, texte_rect)
 
@@ -1308,7 +1589,7 @@ class GestionnaireRendu:
             texte_meteo = "☀  Météo: NORMAL (cliquer pour pluie)"
 
         pygame.draw.rect(self.ecran, couleur_meteo_bg, (x + 40, y, 510, 50), border_radius=10)
-        texte = self.police_normale.render(texte_meteo, True, BLANC)
+        texte = self.cache_texte.rendre(self.police_normale, texte_meteo, True, BLANC)
         texte_rect = texte.get_rect(center=(x + 295, y + 25))
         self.ecran.blit(texte, texte_rect)
 
@@ -1346,7 +1627,7 @@ class GestionnaireRendu:
         pygame.draw.rect(self.ecran, BLANC, (x + 40, y, 510, 180), border_radius=10)
         pygame.draw.rect(self.ecran, BORDURE_FINE, (x + 40, y, 510, 180), 1, border_radius=10)
 
-        titre = self.police_petite.render("ÉTAT DES FEUX", True, (100, 100, 120))
+        titre = self.cache_texte.rendre(self.police_petite, "ÉTAT DES FEUX", True, (100, 100, 120))
         self.ecran.blit(titre, (x + 225, y + 12))
 
         feux_info = [
@@ -1375,10 +1656,10 @@ class GestionnaireRendu:
             pygame.draw.rect(self.ecran, couleur_bg, (fx, fy, 200, 45), border_radius=8)
             pygame.draw.rect(self.ecran, couleur_bordure, (fx, fy, 200, 45), 1, border_radius=8)
 
-            texte = self.police_petite.render(f"{label}: {feu.couleur}", True, couleur_texte)
+            texte = self.cache_texte.rendre(self.police_petite, f"{label}: {feu.couleur}", True, couleur_texte)
             self.ecran.blit(texte, (fx + 10, fy + 7))
 
-            texte_temps = self.police_petite.render(f"{feu.temps_restant}s", True, couleur_texte)
+            texte_temps = self.cache_texte.rendre(self.police_petite, f"{feu.temps_restant}s", True, couleur_texte)
             self.ecran.blit(texte_temps, (fx + 140, fy + 22))
 
     def dessiner_kpi(self, x, y, cycle_count, temps_total_simulation, voitures_nord, voitures_sud,
@@ -1436,19 +1717,18 @@ class GestionnaireRendu:
             pygame.draw.rect(self.ecran, BORDURE_FINE, (cx, cy, 230, 70), 1, border_radius=12)
 
             # Label en haut
-            texte_label = self.police_petite.render(card["label"], True, (100, 100, 120))
+            texte_label = self.cache_texte.rendre(self.police_petite, card["label"], True, (100, 100, 120))
             self.ecran.blit(texte_label, (cx + 15, cy + 12))
 
             # Valeur grande au centre
-            font_grande = pygame.font.Font(None, 42)
-            texte_valeur = font_grande.render(card["valeur"], True, card["couleur_texte"])
+            texte_valeur = self.cache_texte.rendre(self.police_kpi, card["valeur"], True, card["couleur_texte"])
             self.ecran.blit(texte_valeur, (cx + 15, cy + 32))
 
         # Section "Contrôles" (piétons et mode urgence)
         y_controles = y + 210
 
         # Titre section
-        titre = self.police_normale.render("CONTRÔLES", True, (80, 80, 100))
+        titre = self.cache_texte.rendre(self.police_normale, "CONTRÔLES", True, (80, 80, 100))
         self.ecran.blit(titre, (x + 230, y_controles))
 
         # Cartes piétons (2x2)
@@ -1465,8 +1745,8 @@ class GestionnaireRendu:
             pygame.draw.rect(self.ecran, BORDURE_FINE, (px, py, 230, 45), 1, border_radius=8)
 
             # Texte
-            texte_label = self.police_petite.render(label, True, (100, 100, 120))
-            texte_valeur = self.police_petite.render(str(valeur), True, BLEU_FONCE)
+            texte_label = self.cache_texte.rendre(self.police_petite, label, True, (100, 100, 120))
+            texte_valeur = self.cache_texte.rendre(self.police_petite, str(valeur), True, BLEU_FONCE)
             self.ecran.blit(texte_label, (px + 12, py + 8))
             self.ecran.blit(texte_valeur, (px + 150, py + 20))
 
@@ -1475,7 +1755,7 @@ class GestionnaireRendu:
         pygame.draw.rect(self.ecran, BLANC, (x + 40, y, 510, 180), border_radius=10)
         pygame.draw.rect(self.ecran, BLEU_FONCE, (x + 40, y, 510, 180), 3, border_radius=10)
 
-        titre = self.police_normale.render("Trafic Temps Reel", True, BLEU_FONCE)
+        titre = self.cache_texte.rendre(self.police_normale, "Trafic Temps Reel", True, BLEU_FONCE)
         self.ecran.blit(titre, (x + 180, y + 10))
 
         if len(historique_trafic_ns) > 1:
@@ -1505,11 +1785,11 @@ class GestionnaireRendu:
 
             # Légende
             pygame.draw.line(self.ecran, BLEU, (x + 80, y + 165), (x + 110, y + 165), 3)
-            texte = self.police_petite.render("N-S", True, BLEU)
+            texte = self.cache_texte.rendre(self.police_petite, "N-S", True, BLEU)
             self.ecran.blit(texte, (x + 115, y + 158))
 
             pygame.draw.line(self.ecran, ROUGE, (x + 180, y + 165), (x + 210, y + 165), 3)
-            texte = self.police_petite.render("E-O", True, ROUGE)
+            texte = self.cache_texte.rendre(self.police_petite, "E-O", True, ROUGE)
             self.ecran.blit(texte, (x + 215, y + 158))
 
     def dessiner_message(self):
@@ -1518,18 +1798,30 @@ class GestionnaireRendu:
             pygame.draw.rect(self.ecran, self.message_couleur, (50, self.hauteur - 60, 900, 45),
                            border_radius=10)
             pygame.draw.rect(self.ecran, NOIR, (50, self.hauteur - 60, 900, 45), 2, border_radius=10)
-            texte = self.police_normale.render(self.message, True, BLANC)
+            texte = self.cache_texte.rendre(self.police_normale, self.message, True, BLANC)
             self.ecran.blit(texte, (70, self.hauteur - 48))
             self.message_temps -= 1
+            self.message_affiche = (self.message, self.message_couleur)
 
     def dessiner_interface(self, simulation_active, mode_urgence, feu_nord, feu_sud, feu_est, feu_ouest,
                           voitures_nord, voitures_sud, voitures_est, voitures_ouest,
                           accident_actif, temps_clignotement, cycle_count, temps_total_simulation,
                           compteur_pietons_ns, compteur_pietons_eo, compteur_accidents,
-                          compteur_ambulances, ambulance_active, historique_trafic_ns, historique_trafic_eo):
-        """Dessine toute l'interface"""
+                          compteur_ambulances, ambulance_active, historique_trafic_ns, historique_trafic_eo,
+                          facteur_vitesse=1):
+        """Dessine toute l'interface (facteur_vitesse: accélération affichée, None = MAX)"""
         # Incrémenter compteur pour animation piétons
         self.frame_count += 1
+        self.message_affiche = None
+
+        # Réglages de qualité de la frame (voir GouverneurQualite)
+        gouverneur = self.gouverneur
+        if gouverneur.jambes_animees:
+            self.frame_marche = self.frame_count
+        panneau_dessine = gouverneur.dessiner_panneau(self.frame_count)
+        if not panneau_dessine:
+            # Le panneau de la frame précédente reste à l'écran : rien ne doit déborder dessus
+            self.ecran.set_clip(pygame.Rect(0, 0, self.largeur - 590, self.hauteur))
 
         self.dessiner_route()
 
@@ -1559,53 +1851,71 @@ class GestionnaireRendu:
         # Dessiner piétons en train de traverser
         self.dessiner_pietons_traversant(feu_nord, feu_sud, feu_est, feu_ouest)
 
-        # Dessiner voitures avec ordre de profondeur correct
-        # Les voitures plus éloignées du centre doivent être dessinées en premier
-        # pour créer un effet de profondeur réaliste
-        toutes_voitures = voitures_nord + voitures_sud + voitures_est + voitures_ouest
         # Message en bas
         self.dessiner_message()
-        
-        # NOUVEAU: Dessiner la pluie si météo = pluie
-        
 
-        # Tri par profondeur : calculer la distance au centre pour chaque voiture
-        # Les voitures loin du centre sont dessinées d'abord (arrière-plan)
-        def distance_au_centre(voiture):
-            dx = voiture.x - self.centre_x
-            dy = voiture.y - self.centre_y
-            return -(dx*dx + dy*dy)  # Négatif pour trier du plus loin au plus proche
+        # Niveau de détail selon la densité du trafic (voir _choisir_niveau_detail)
+        voies = (voitures_nord, voitures_sud, voitures_est, voitures_ouest)
+        self.niveau_detail = self._choisir_niveau_detail(sum(len(voie) for voie in voies))
 
-        voitures_triees = sorted(toutes_voitures, key=distance_au_centre)
+        if self.niveau_detail == DETAIL_COMPLET:
+            # Dessiner voitures avec ordre de profondeur correct
+            # Les voitures plus éloignées du centre doivent être dessinées en premier
+            # pour créer un effet de profondeur réaliste (ordre tenu à jour d'une frame à l'autre)
+            voitures_triees = self.ordre_profondeur.mettre_a_jour(voies, self.centre_x, self.centre_y)
 
-        for voiture in voitures_triees:
-            voiture.dessiner(self.ecran)
+            # Tous les véhicules en un seul appel, à partir des sprites pré-rendus
+            self.ecran.blits(atlas_vehicules.sequence(voitures_triees, meteo.est_pluie and gouverneur.faisceaux,
+                                                      gouverneur.gyrophares), doreturn=False)
+        else:
+            # Trafic dense : la scène est réaffichée entièrement, aucune zone par véhicule
+            voitures_triees = []
+            if self.niveau_detail == DETAIL_SIMPLIFIE:
+                self.ecran.blits(atlas_vehicules.sequence_simplifiee(voies), doreturn=False)
+            else:
+                # Trafic très dense : carte de densité à la place des véhicules
+                self._dessiner_densite(voies)
 
-        from feu_tricolore.meteo import meteo
         if meteo.est_pluie:
+            self.effet_pluie.definir_proportion(gouverneur.proportion_pluie)
             self.effet_pluie.update()
+            # Le panneau recouvre la droite de l'écran : la pluie n'est dessinée que sur la scène
+            clip = self.ecran.get_clip()
+            self.ecran.set_clip(clip.clip(0, 0, self.largeur - 590, self.hauteur))
             self.effet_pluie.dessiner(self.ecran)
+            self.ecran.set_clip(clip)
 
 
-            # ÉTAPE 3: Re-dessiner les faisceaux lumineux et phares PAR-DESSUS la pluie
-            # pour qu'ils restent bien visibles et jaunes vifs
-            for voiture in voitures_triees:
-                # Dessiner uniquement les faisceaux et phares
-                if hasattr(voiture, '_dessiner_faisceaux_lumineux'):
-                    voiture._dessiner_faisceaux_lumineux(self.ecran)
-                if hasattr(voiture, '_dessiner_phares_seuls'):
-                    voiture._dessiner_phares_seuls(self.ecran)
+            # ÉTAPE 3: Re-dessiner les faisceaux lumineux PAR-DESSUS la pluie
+            # pour qu'ils restent bien visibles et jaunes vifs (détail complet seulement)
+            if self.niveau_detail == DETAIL_COMPLET and gouverneur.faisceaux:
+                self.ecran.blits(atlas_vehicules.sequence_faisceaux(voitures_triees), doreturn=False)
 
         # Dessiner accident si actif
         if accident_actif:
             self.dessiner_accident(accident_actif, temps_clignotement)
 
         # Panel droit
-        self.dessiner_panel_droit(simulation_active, mode_urgence, feu_nord, feu_sud, feu_est, feu_ouest,
-                                 cycle_count, temps_total_simulation, voitures_nord, voitures_sud,
-                                 voitures_est, voitures_ouest, compteur_pietons_ns, compteur_pietons_eo,
-                                 compteur_accidents, compteur_ambulances, ambulance_active,
-                                 historique_trafic_ns, historique_trafic_eo)
+        if panneau_dessine:
+            self.dessiner_panel_droit(simulation_active, mode_urgence, feu_nord, feu_sud, feu_est, feu_ouest,
+                                     cycle_count, temps_total_simulation, voitures_nord, voitures_sud,
+                                     voitures_est, voitures_ouest, compteur_pietons_ns, compteur_pietons_eo,
+                                     compteur_accidents, compteur_ambulances, ambulance_active,
+                                     historique_trafic_ns, historique_trafic_eo, facteur_vitesse)
 
         # Message en bas
         self.dessiner_message()
+        self.ecran.set_clip(None)
+
+        # Zones à transmettre à l'écran (voir zones_modifiees)
+        feux = (feu_nord, feu_sud, feu_est, feu_ouest)
+        signature_entete = (cycle_count, temps_total_simulation, simulation_active,
+                            feu_nord.couleur, feu_sud.couleur)
+        signature_contenu = (
+            self.scroll_offset, tuple((feu.couleur, feu.temps_restant) for feu in feux),
+            len(voitures_nord) + len(voitures_sud), len(voitures_est) + len(voitures_ouest),
+            compteur_pietons_ns, compteur_pietons_eo, mode_urgence, meteo.est_pluie, facteur_vitesse,
+            compteur_accidents, compteur_ambulances, tuple(historique_trafic_ns), tuple(historique_trafic_eo)
+        )
+        self._relever_zones_modifiees(voitures_triees, accident_actif, feux, signature_entete, signature_contenu,
+                                      panneau_dessine)
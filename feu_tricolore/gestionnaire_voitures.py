@@ -1,5 +1,8 @@
 import random
-from feu_tricolore.voiture import Voiture
+from feu_tricolore.pool_vehicules import PoolVehicules
+from feu_tricolore.voie_vehicules import VoieVehicules
+from feu_tricolore.grille_spatiale import GrilleSpatiale
+from feu_tricolore.etat_voies import EtatVoies
 from feu_tricolore.meteo import meteo
 from feu_tricolore.constants import (
     COULEURS_VOITURES,
@@ -7,9 +10,9 @@ from feu_tricolore.constants import (
     PROBABILITE_SPAWN,
     VOITURES_INITIALES_MIN,
     VOITURES_INITIALES_MAX,
-    DISTANCE_SECURITE_VOITURE,
     SEUIL_COLLISION_X,
     SEUIL_COLLISION_Y,
+    TAILLE_CELLULE_GRILLE,
     ZONE_INTERSECTION_DEMI_LARGEUR,
     ZONE_INTERSECTION_DEMI_HAUTEUR,
     DUREE_INTERVENTION_ACCIDENT,
@@ -25,9 +28,6 @@ from feu_tricolore.constants import (
     ZONE_ARRET_SUD_MIN, ZONE_ARRET_SUD_MAX,
     ZONE_ARRET_EST_MIN, ZONE_ARRET_EST_MAX,
     ZONE_ARRET_OUEST_MIN, ZONE_ARRET_OUEST_MAX,
-    ZONE_ATTENTE_NS_MIN, ZONE_ATTENTE_NS_MAX,
-    ZONE_ATTENTE_EO_MIN, ZONE_ATTENTE_EO_MAX,
-    ZONE_APPROCHE_DISTANCE,
     ROUGE, BLEU
 )
 
@@ -38,11 +38,21 @@ class GestionnaireVoitures:
         self.largeur = largeur
         self.hauteur = hauteur
 
-        # Voitures animées par direction
-        self.voitures_nord = []
-        self.voitures_sud = []
-        self.voitures_est = []
-        self.voitures_ouest = []
+        # Voitures recyclées (aucune allocation en régime établi)
+        self.pool = PoolVehicules()
+
+        # Index spatial de la zone d'intersection (tenu à jour par les voies)
+        self.grille = GrilleSpatiale(
+            centre_x - ZONE_INTERSECTION_DEMI_LARGEUR, centre_y - ZONE_INTERSECTION_DEMI_HAUTEUR,
+            centre_x + ZONE_INTERSECTION_DEMI_LARGEUR, centre_y + ZONE_INTERSECTION_DEMI_HAUTEUR,
+            TAILLE_CELLULE_GRILLE
+        )
+
+        # Voitures animées par direction (colonnes NumPy, ordre de la file)
+        self.voitures_nord = VoieVehicules("N", SPAWN_NORD_X, LIMITE_SORTIE_NORD, (ZONE_ARRET_NORD_MIN, ZONE_ARRET_NORD_MAX), centre_y, self.grille, self.pool)
+        self.voitures_sud = VoieVehicules("S", SPAWN_SUD_X, LIMITE_SORTIE_SUD, (ZONE_ARRET_SUD_MIN, ZONE_ARRET_SUD_MAX), centre_y, self.grille, self.pool)
+        self.voitures_est = VoieVehicules("E", SPAWN_EST_Y, LIMITE_SORTIE_EST, (ZONE_ARRET_EST_MIN, ZONE_ARRET_EST_MAX), centre_x, self.grille, self.pool)
+        self.voitures_ouest = VoieVehicules("O", SPAWN_OUEST_Y, LIMITE_SORTIE_OUEST, (ZONE_ARRET_OUEST_MIN, ZONE_ARRET_OUEST_MAX), centre_x, self.grille, self.pool)
         self.temps_spawn_voiture = 0
 
         # Système d'accidents
@@ -55,9 +65,16 @@ class GestionnaireVoitures:
         # Système de priorité ambulance
         self.ambulance_direction_active = None
 
-    def spawn_voitures(self, trafic_nord, trafic_sud, trafic_est, trafic_ouest):
-        """Génère des voitures selon le niveau de trafic"""
-        self.temps_spawn_voiture += 1
+        # Facteur météo appliqué aux vitesses des voies (mis à jour au changement de météo)
+        self.facteur_vitesse = 1.0
+
+        # Instantané agrégé des voies (voir etat_voies)
+        self._etat = None
+        self._versions_etat = None
+
+    def spawn_voitures(self, trafic_nord, trafic_sud, trafic_est, trafic_ouest, dt):
+        """Génère des voitures selon le niveau de trafic (dt en secondes)"""
+        self.temps_spawn_voiture += dt
 
         if self.temps_spawn_voiture > INTERVALLE_SPAWN_VOITURES:
             self.temps_spawn_voiture = 0
@@ -65,37 +82,32 @@ class GestionnaireVoitures:
             # Nord (venant du haut, allant vers le bas)
             if len(self.voitures_nord) < trafic_nord.niveau and random.random() > PROBABILITE_SPAWN:
                 couleur = random.choice(COULEURS_VOITURES)
-                self.voitures_nord.append(Voiture(SPAWN_NORD_X, SPAWN_NORD_Y, "N", couleur))
+                self.voitures_nord.ajouter(self.pool.obtenir(SPAWN_NORD_X, SPAWN_NORD_Y, "N", couleur))
 
             # Sud (venant du bas, allant vers le haut)
             if len(self.voitures_sud) < trafic_sud.niveau and random.random() > PROBABILITE_SPAWN:
                 couleur = random.choice(COULEURS_VOITURES)
-                self.voitures_sud.append(Voiture(SPAWN_SUD_X, SPAWN_SUD_Y, "S", couleur))
+                self.voitures_sud.ajouter(self.pool.obtenir(SPAWN_SUD_X, SPAWN_SUD_Y, "S", couleur))
 
             # Est (venant de la droite, allant vers la gauche)
             if len(self.voitures_est) < trafic_est.niveau and random.random() > PROBABILITE_SPAWN:
                 couleur = random.choice(COULEURS_VOITURES)
-                self.voitures_est.append(Voiture(SPAWN_EST_X, SPAWN_EST_Y, "E", couleur))
+                self.voitures_est.ajouter(self.pool.obtenir(SPAWN_EST_X, SPAWN_EST_Y, "E", couleur))
 
             # Ouest (venant de la gauche, allant vers la droite)
             if len(self.voitures_ouest) < trafic_ouest.niveau and random.random() > PROBABILITE_SPAWN:
                 couleur = random.choice(COULEURS_VOITURES)
-                self.voitures_ouest.append(Voiture(SPAWN_OUEST_X, SPAWN_OUEST_Y, "O", couleur))
+                self.voitures_ouest.ajouter(self.pool.obtenir(SPAWN_OUEST_X, SPAWN_OUEST_Y, "O", couleur))
+
+    def voies(self):
+        """Retourne les 4 voies dans l'ordre Nord, Sud, Est, Ouest"""
+        return (self.voitures_nord, self.voitures_sud, self.voitures_est, self.voitures_ouest)
 
     def detecter_ambulance_active(self):
         """Détecte s'il y a une ambulance active et dans quelle direction"""
-        for voiture in self.voitures_nord:
-            if voiture.est_ambulance:
-                return "N"
-        for voiture in self.voitures_sud:
-            if voiture.est_ambulance:
-                return "S"
-        for voiture in self.voitures_est:
-            if voiture.est_ambulance:
-                return "E"
-        for voiture in self.voitures_ouest:
-            if voiture.est_ambulance:
-                return "O"
+        for voie in self.voies():
+            if voie.contient_ambulance():
+                return voie.direction
         return None
 
     def intersection_est_securisee_pour_ambulance(self, direction_ambulance):
@@ -109,27 +121,11 @@ class GestionnaireVoitures:
         Returns:
             bool: True si l'intersection est sécurisée
         """
-        # Zone d'intersection
-        zone_x_min = self.centre_x - ZONE_INTERSECTION_DEMI_LARGEUR
-        zone_x_max = self.centre_x + ZONE_INTERSECTION_DEMI_LARGEUR
-        zone_y_min = self.centre_y - ZONE_INTERSECTION_DEMI_HAUTEUR
-        zone_y_max = self.centre_y + ZONE_INTERSECTION_DEMI_HAUTEUR
-
-        # Vérifier les voitures dans l'intersection (sauf l'ambulance elle-même)
-        for voiture in self.voitures_nord:
-            if not voiture.est_ambulance and zone_y_min <= voiture.y <= zone_y_max:
-                return False
-
-        for voiture in self.voitures_sud:
-            if not voiture.est_ambulance and zone_y_min <= voiture.y <= zone_y_max:
-                return False
-
-        for voiture in self.voitures_est:
-            if not voiture.est_ambulance and zone_x_min <= voiture.x <= zone_x_max:
-                return False
-
-        for voiture in self.voitures_ouest:
-            if not voiture.est_ambulance and zone_x_min <= voiture.x <= zone_x_max:
+        # Vérifier les voitures dans l'intersection (sauf l'ambulance elle-même).
+        # Appelé pendant le déplacement des voies : la grille est à jour voie par
+        # voie, contrairement à l'instantané etat_voies() calculé en fin de pas.
+        for voiture in self.grille.cellule_de:
+            if not voiture.est_ambulance:
                 return False
 
         return True
@@ -205,30 +201,39 @@ class GestionnaireVoitures:
 
     def spawn_voitures_initial(self):
         """Crée quelques voitures au démarrage pour avoir du trafic immédiatement"""
+        initiales = {"N": [], "S": [], "E": [], "O": []}
+
         # Créer 2-3 voitures par direction au démarrage
         for _ in range(random.randint(VOITURES_INITIALES_MIN, VOITURES_INITIALES_MAX)):
             # Nord
             couleur = random.choice(COULEURS_VOITURES)
             y_pos = random.randint(50, 200)
-            self.voitures_nord.append(Voiture(SPAWN_NORD_X, y_pos, "N", couleur))
+            initiales["N"].append(self.pool.obtenir(SPAWN_NORD_X, y_pos, "N", couleur))
 
             # Sud
             couleur = random.choice(COULEURS_VOITURES)
             y_pos = random.randint(self.hauteur - 200, self.hauteur - 50)
-            self.voitures_sud.append(Voiture(SPAWN_SUD_X, y_pos, "S", couleur))
+            initiales["S"].append(self.pool.obtenir(SPAWN_SUD_X, y_pos, "S", couleur))
 
             # Est
             couleur = random.choice(COULEURS_VOITURES)
             x_pos = random.randint(self.largeur - 800, self.largeur - 650)
-            self.voitures_est.append(Voiture(x_pos, SPAWN_EST_Y, "E", couleur))
+            initiales["E"].append(self.pool.obtenir(x_pos, SPAWN_EST_Y, "E", couleur))
 
             # Ouest
             couleur = random.choice(COULEURS_VOITURES)
             x_pos = random.randint(50, 200)
-            self.voitures_ouest.append(Voiture(x_pos, SPAWN_OUEST_Y, "O", couleur))
+            initiales["O"].append(self.pool.obtenir(x_pos, SPAWN_OUEST_Y, "O", couleur))
 
-    def update_voitures(self, feu_nord, feu_sud, feu_est, feu_ouest):
-        """Met à jour les positions des voitures"""
+        # Ajouter dans l'ordre de la file : la plus avancée en premier
+        for voie in self.voies():
+            voitures = initiales[voie.direction]
+            voitures.sort(key=lambda v: (v.y if voie.axe_y else v.x) * voie.signe, reverse=True)
+            for voiture in voitures:
+                voie.ajouter(voiture)
+
+    def update_voitures(self, feu_nord, feu_sud, feu_est, feu_ouest, dt):
+        """Met à jour les positions des voitures (dt en secondes)"""
 
         # BLOQUER mouvement si mode urgence (accident)
         if self.mode_urgence:
@@ -245,224 +250,48 @@ class GestionnaireVoitures:
             'ouest': feu_ouest
         }
 
-        # Nord (venant du haut, descendant vers le sud)
-        # Voie à gauche de la route verticale (x = centre_x - 60)
-        for i, voiture in enumerate(self.voitures_nord):
-            peut_avancer = True
-
-            # AMBULANCES : Priorité conditionnelle - vérifie sécurité avant d'avancer
-            if voiture.est_ambulance:
-                peut_avancer = self.peut_ambulance_avancer(voiture, "N", feux_pietons)
-                voiture.deplacer(peut_avancer)
-                continue
-
-            # VOITURES NORMALES : S'arrêtent si ambulance active sur leur axe
-            if self.ambulance_direction_active in ["N", "S"]:
-                # Ambulance N-S active : arrêt obligatoire AVANT l'intersection
-                if ZONE_ARRET_NORD_MIN <= voiture.y < ZONE_ARRET_NORD_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # SÉCURITÉ PIÉTONS : Bloquer si piétons traversent cette voie
-            # Voiture NORD (x=-60, voie gauche) croise passages horizontaux Nord/Sud
-            # Passage Nord/Sud = piétons traversant la route E-O (horizontale)
-            if feux_pietons['nord'].pieton_vert or feux_pietons['sud'].pieton_vert:
-                if ZONE_ARRET_NORD_MIN <= voiture.y < ZONE_ARRET_NORD_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # Vérifier collision avec la voiture devant
-            if i > 0:
-                voiture_devant = self.voitures_nord[i - 1]
-                distance = voiture_devant.y - voiture.y
-                if distance < DISTANCE_SECURITE_VOITURE:
-                    peut_avancer = False
-
-            # Zone d'arrêt au feu AVANT l'intersection - s'arrête seulement si PAS ENCORE dans l'intersection
-            if feu_nord.couleur != "Vert":
-                if ZONE_ARRET_NORD_MIN <= voiture.y < ZONE_ARRET_NORD_MAX:
-                    peut_avancer = False
-
-            voiture.deplacer(peut_avancer)
-
-        # Supprimer les voitures qui sortent
-        self.voitures_nord = [v for v in self.voitures_nord if v.y <= LIMITE_SORTIE_NORD]
-
-        # Sud (venant du bas, montant vers le nord)
-        # Voie à droite de la route verticale (x = centre_x + 60)
-        for i, voiture in enumerate(self.voitures_sud):
-            peut_avancer = True
-
-            # AMBULANCES : Priorité conditionnelle - vérifie sécurité avant d'avancer
-            if voiture.est_ambulance:
-                peut_avancer = self.peut_ambulance_avancer(voiture, "S", feux_pietons)
-                voiture.deplacer(peut_avancer)
-                continue
-
-            # VOITURES NORMALES : S'arrêtent si ambulance active sur leur axe
-            if self.ambulance_direction_active in ["N", "S"]:
-                # Ambulance N-S active : arrêt obligatoire AVANT l'intersection
-                if ZONE_ARRET_SUD_MIN < voiture.y <= ZONE_ARRET_SUD_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # SÉCURITÉ PIÉTONS : Bloquer si piétons traversent cette voie
-            # Voiture SUD (x=+60, voie droite) croise passages horizontaux Nord/Sud
-            # Passage Nord/Sud = piétons traversant la route E-O (horizontale)
-            if feux_pietons['nord'].pieton_vert or feux_pietons['sud'].pieton_vert:
-                if ZONE_ARRET_SUD_MIN < voiture.y <= ZONE_ARRET_SUD_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # Vérifier collision avec la voiture devant
-            if i > 0:
-                voiture_devant = self.voitures_sud[i - 1]
-                distance = voiture.y - voiture_devant.y
-                if distance < DISTANCE_SECURITE_VOITURE:
-                    peut_avancer = False
-
-            # Zone d'arrêt au feu AVANT l'intersection - s'arrête seulement si PAS ENCORE dans l'intersection
-            if feu_sud.couleur != "Vert":
-                if ZONE_ARRET_SUD_MIN < voiture.y <= ZONE_ARRET_SUD_MAX:
-                    peut_avancer = False
-
-            voiture.deplacer(peut_avancer)
-
-        # Supprimer les voitures qui sortent
-        self.voitures_sud = [v for v in self.voitures_sud if v.y >= LIMITE_SORTIE_SUD]
-
-        # Est (venant de la droite, allant vers la gauche/ouest)
-        # Voie en haut de la route horizontale (y = centre_y - 60)
-        for i, voiture in enumerate(self.voitures_est):
-            peut_avancer = True
-
-            # AMBULANCES : Priorité conditionnelle - vérifie sécurité avant d'avancer
-            if voiture.est_ambulance:
-                peut_avancer = self.peut_ambulance_avancer(voiture, "E", feux_pietons)
-                voiture.deplacer(peut_avancer)
-                continue
-
-            # VOITURES NORMALES : S'arrêtent si ambulance active sur leur axe
-            if self.ambulance_direction_active in ["E", "O"]:
-                # Ambulance E-O active : arrêt obligatoire AVANT l'intersection
-                if ZONE_ARRET_EST_MIN < voiture.x <= ZONE_ARRET_EST_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # SÉCURITÉ PIÉTONS : Bloquer si piétons traversent cette voie
-            # Voiture EST (y=-60, voie haut) croise passages verticaux Est/Ouest
-            # Passage Est/Ouest = piétons traversant la route N-S (verticale)
-            if feux_pietons['est'].pieton_vert or feux_pietons['ouest'].pieton_vert:
-                if ZONE_ARRET_EST_MIN < voiture.x <= ZONE_ARRET_EST_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # Vérifier collision avec la voiture devant
-            if i > 0:
-                voiture_devant = self.voitures_est[i - 1]
-                distance = voiture.x - voiture_devant.x
-                if distance < DISTANCE_SECURITE_VOITURE:
-                    peut_avancer = False
-
-            # Zone d'arrêt au feu AVANT l'intersection - s'arrête seulement si PAS ENCORE dans l'intersection
-            if feu_est.couleur != "Vert":
-                if ZONE_ARRET_EST_MIN < voiture.x <= ZONE_ARRET_EST_MAX:
-                    peut_avancer = False
-
-            voiture.deplacer(peut_avancer)
-
-        # Supprimer les voitures qui sortent
-        self.voitures_est = [v for v in self.voitures_est if v.x >= LIMITE_SORTIE_EST]
-
-        # Ouest (venant de la gauche, allant vers la droite/est)
-        # Voie en bas de la route horizontale (y = centre_y + 60)
-        for i, voiture in enumerate(self.voitures_ouest):
-            peut_avancer = True
-
-            # AMBULANCES : Priorité conditionnelle - vérifie sécurité avant d'avancer
-            if voiture.est_ambulance:
-                peut_avancer = self.peut_ambulance_avancer(voiture, "O", feux_pietons)
-                voiture.deplacer(peut_avancer)
-                continue
-
-            # VOITURES NORMALES : S'arrêtent si ambulance active sur leur axe
-            if self.ambulance_direction_active in ["E", "O"]:
-                # Ambulance E-O active : arrêt obligatoire AVANT l'intersection
-                if ZONE_ARRET_OUEST_MIN <= voiture.x < ZONE_ARRET_OUEST_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # SÉCURITÉ PIÉTONS : Bloquer si piétons traversent cette voie
-            # Voiture OUEST (y=+60, voie bas) croise passages verticaux Est/Ouest
-            # Passage Est/Ouest = piétons traversant la route N-S (verticale)
-            if feux_pietons['est'].pieton_vert or feux_pietons['ouest'].pieton_vert:
-                if ZONE_ARRET_OUEST_MIN <= voiture.x < ZONE_ARRET_OUEST_MAX:
-                    peut_avancer = False
-                    voiture.deplacer(peut_avancer)
-                    continue
-
-            # Vérifier collision avec la voiture devant
-            if i > 0:
-                voiture_devant = self.voitures_ouest[i - 1]
-                distance = voiture_devant.x - voiture.x
-                if distance < DISTANCE_SECURITE_VOITURE:
-                    peut_avancer = False
-
-            # Zone d'arrêt au feu AVANT l'intersection - s'arrête seulement si PAS ENCORE dans l'intersection
-            if feu_ouest.couleur != "Vert":
-                if ZONE_ARRET_OUEST_MIN <= voiture.x < ZONE_ARRET_OUEST_MAX:
-                    peut_avancer = False
-
-            voiture.deplacer(peut_avancer)
-
-        # Supprimer les voitures qui sortent
-        self.voitures_ouest = [v for v in self.voitures_ouest if v.x <= LIMITE_SORTIE_OUEST]
+        # Vitesses effectives recalculées seulement quand la météo change
+        if meteo.facteur_vitesse != self.facteur_vitesse:
+            self.facteur_vitesse = meteo.facteur_vitesse
+            for voie in self.voies():
+                voie.appliquer_facteur_vitesse(self.facteur_vitesse)
+
+        # SÉCURITÉ PIÉTONS : les voies N/S croisent les passages Nord/Sud,
+        # les voies E/O croisent les passages Est/Ouest
+        pietons_ns = feu_nord.pieton_vert or feu_sud.pieton_vert
+        pietons_eo = feu_est.pieton_vert or feu_ouest.pieton_vert
+        ambulance_ns = self.ambulance_direction_active in ["N", "S"]
+        ambulance_eo = self.ambulance_direction_active in ["E", "O"]
+
+        for voie, feu in ((self.voitures_nord, feu_nord), (self.voitures_sud, feu_sud),
+                          (self.voitures_est, feu_est), (self.voitures_ouest, feu_ouest)):
+            if voie.axe_y:
+                arret_force = ambulance_ns or pietons_ns or feu.couleur != "Vert"
+            else:
+                arret_force = ambulance_eo or pietons_eo or feu.couleur != "Vert"
+
+            direction = voie.direction
+            voie.mettre_a_jour(
+                dt, arret_force,
+                lambda ambulance, direction=direction: self.peut_ambulance_avancer(ambulance, direction, feux_pietons)
+            )
 
     def detecter_collisions(self):
         """Détecte les collisions entre voitures dans l'intersection"""
         if self.accident_actif:
             return  # Un accident est déjà en cours
 
-        # Zone d'intersection pour détection
-        zone_x_min = self.centre_x - ZONE_INTERSECTION_DEMI_LARGEUR
-        zone_x_max = self.centre_x + ZONE_INTERSECTION_DEMI_LARGEUR
-        zone_y_min = self.centre_y - ZONE_INTERSECTION_DEMI_HAUTEUR
-        zone_y_max = self.centre_y + ZONE_INTERSECTION_DEMI_HAUTEUR
-
-        # Collecter toutes les voitures dans l'intersection
+        # La grille ne contient que les véhicules de l'intersection ; seules les
+        # cellules voisines sont comparées
         # NOTE: Les ambulances sont incluses mais la logique les empêche d'entrer si dangereux
-        voitures_intersection = []
-
-        for voiture in self.voitures_nord:
-            if zone_y_min <= voiture.y <= zone_y_max:
-                voitures_intersection.append(("N", voiture))
-
-        for voiture in self.voitures_sud:
-            if zone_y_min <= voiture.y <= zone_y_max:
-                voitures_intersection.append(("S", voiture))
-
-        for voiture in self.voitures_est:
-            if zone_x_min <= voiture.x <= zone_x_max:
-                voitures_intersection.append(("E", voiture))
-
-        for voiture in self.voitures_ouest:
-            if zone_x_min <= voiture.x <= zone_x_max:
-                voitures_intersection.append(("O", voiture))
-
-        # Vérifier les collisions entre voitures de directions différentes
-        for i, (dir1, v1) in enumerate(voitures_intersection):
-            for dir2, v2 in voitures_intersection[i+1:]:
-                # Collision si les rectangles se chevauchent
-                if (abs(v1.x - v2.x) < SEUIL_COLLISION_X and abs(v1.y - v2.y) < SEUIL_COLLISION_Y):
-                    # ACCIDENT DÉTECTÉ !
-                    return (v1, v2, dir1, dir2)
+        if len(self.grille) < 2:
+            return None
+
+        collision = self.grille.premiere_collision(SEUIL_COLLISION_X, SEUIL_COLLISION_Y)
+        if collision:
+            # ACCIDENT DÉTECTÉ !
+            v1, v2 = collision
+            return (v1, v2, v1.direction, v2.direction)
         return None
 
     def declencher_accident(self, voiture1, voiture2, dir1, dir2):
@@ -481,19 +310,21 @@ class GestionnaireVoitures:
         self.mode_urgence = True
         self.compteur_accidents += 1
 
-    def gerer_accident(self):
-        """Gère l'évolution de l'accident et le retour à la normale"""
+    def gerer_accident(self, dt):
+        """Gère l'évolution de l'accident et le retour à la normale (dt en secondes)"""
         if not self.accident_actif:
             return False
 
-        self.accident_actif["duree"] -= 1
+        self.accident_actif["duree"] -= dt
 
         if self.accident_actif["duree"] <= 0:
-            # Retirer les voitures accidentées
+            # Retirer les voitures accidentées (rendues au pool par leur voie,
+            # directement pour les voitures fictives d'un accident simulé)
             for voiture in self.accident_actif["voitures"]:
-                for liste in [self.voitures_nord, self.voitures_sud, self.voitures_est, self.voitures_ouest]:
-                    if voiture in liste:
-                        liste.remove(voiture)
+                if voiture.voie is not None:
+                    voiture.voie.retirer(voiture)
+                else:
+                    self.pool.liberer(voiture)
 
             self.accident_actif = None
             self.mode_urgence = False
@@ -510,65 +341,43 @@ class GestionnaireVoitures:
         voitures_fictives = []
 
         # Voiture fictive 1 (de la direction Nord)
-        v1 = Voiture(self.centre_x - 60, self.centre_y, "N", ROUGE)
+        v1 = self.pool.obtenir(self.centre_x - 60, self.centre_y, "N", ROUGE)
         voitures_fictives.append(v1)
 
         # Voiture fictive 2 (de la direction Est)
-        v2 = Voiture(self.centre_x, self.centre_y - 60, "E", BLEU)
+        v2 = self.pool.obtenir(self.centre_x, self.centre_y - 60, "E", BLEU)
         voitures_fictives.append(v2)
 
         # Déclencher l'accident
         self.declencher_accident(v1, v2, "N", "E")
         return True
 
+    def etat_voies(self):
+        """
+        Instantané agrégé des 4 voies (comptages, ambulances, occupation).
+
+        Recalculé en une passe uniquement si une voie a changé depuis le dernier
+        appel : tous les consommateurs d'un même pas partagent le même instantané.
+        """
+        versions = tuple(voie.version for voie in self.voies())
+        if versions != self._versions_etat:
+            self._etat = EtatVoies(self.voies(), self.centre_x, self.centre_y)
+            self._versions_etat = versions
+        return self._etat
+
+    # Les comptages lisent les effectifs tenus à jour par les voies (O(1))
     def compter_voitures_en_attente_ns(self):
         """Compte les voitures en attente dans la zone d'arrêt Nord-Sud"""
-        count = 0
-        # Voitures Nord en attente (zone d'arrêt)
-        for voiture in self.voitures_nord:
-            if self.centre_y - ZONE_ATTENTE_NS_MAX <= voiture.y < self.centre_y - ZONE_ATTENTE_NS_MIN:
-                count += 1
-        # Voitures Sud en attente (zone d'arrêt)
-        for voiture in self.voitures_sud:
-            if self.centre_y + ZONE_ATTENTE_NS_MIN < voiture.y <= self.centre_y + ZONE_ATTENTE_NS_MAX:
-                count += 1
-        return count
+        return self.voitures_nord.nb_en_attente() + self.voitures_sud.nb_en_attente()
 
     def compter_voitures_en_attente_eo(self):
         """Compte les voitures en attente dans la zone d'arrêt Est-Ouest"""
-        count = 0
-        # Voitures Est en attente (zone d'arrêt)
-        for voiture in self.voitures_est:
-            if self.centre_x + ZONE_ATTENTE_EO_MIN < voiture.x <= self.centre_x + ZONE_ATTENTE_EO_MAX:
-                count += 1
-        # Voitures Ouest en attente (zone d'arrêt)
-        for voiture in self.voitures_ouest:
-            if self.centre_x - ZONE_ATTENTE_EO_MAX <= voiture.x < self.centre_x - ZONE_ATTENTE_EO_MIN:
-                count += 1
-        return count
+        return self.voitures_est.nb_en_attente() + self.voitures_ouest.nb_en_attente()
 
     def compter_voitures_approchant_ns(self):
         """Compte les voitures qui approchent de l'intersection Nord-Sud"""
-        count = 0
-        # Voitures Nord approchant (dans les 200 pixels avant l'intersection)
-        for voiture in self.voitures_nord:
-            if voiture.y < self.centre_y - ZONE_ATTENTE_NS_MIN and voiture.y > self.centre_y - ZONE_APPROCHE_DISTANCE:
-                count += 1
-        # Voitures Sud approchant
-        for voiture in self.voitures_sud:
-            if voiture.y > self.centre_y + ZONE_ATTENTE_NS_MIN and voiture.y < self.centre_y + ZONE_APPROCHE_DISTANCE:
-                count += 1
-        return count
+        return self.voitures_nord.nb_approchant() + self.voitures_sud.nb_approchant()
 
     def compter_voitures_approchant_eo(self):
         """Compte les voitures qui approchent de l'intersection Est-Ouest"""
-        count = 0
-        # Voitures Est approchant
-        for voiture in self.voitures_est:
-            if voiture.x > self.centre_x + ZONE_ATTENTE_EO_MIN and voiture.x < self.centre_x + ZONE_APPROCHE_DISTANCE:
-                count += 1
-        # Voitures Ouest approchant
-        for voiture in self.voitures_ouest:
-            if voiture.x < self.centre_x - ZONE_ATTENTE_EO_MIN and voiture.x > self.centre_x - ZONE_APPROCHE_DISTANCE:
-                count += 1
-        return count
+        return self.voitures_est.nb_approchant() + self.voitures_ouest.nb_approchant()
@@ -0,0 +1,93 @@
+# feu_tricolore/gouverneur_qualite.py
+from feu_tricolore.constants import (
+    BUDGET_RENDU, LISSAGE_TEMPS_RENDU, MARGE_RETABLISSEMENT_QUALITE,
+    FRAMES_AVANT_DEGRADATION, FRAMES_AVANT_RETABLISSEMENT
+)
+
+
+class GouverneurQualite:
+    """
+    Ajuste la qualité du rendu au temps réellement mis à dessiner les frames.
+
+    Le temps de rendu est lissé (moyenne exponentielle). S'il dépasse le budget
+    pendant FRAMES_AVANT_DEGRADATION frames, le niveau de qualité baisse d'un
+    cran ; s'il reste sous MARGE_RETABLISSEMENT_QUALITE fois le budget pendant
+    FRAMES_AVANT_RETABLISSEMENT frames, il remonte d'un cran. Les effets coûteux
+    sont coupés dans l'ordre où leur absence se remarque le moins.
+    """
+
+    # Réglages par niveau (0 = qualité maximale) :
+    # (proportion de gouttes de pluie, panneau redessiné toutes les N frames,
+    #  jambes des piétons animées, halos des gyrophares, faisceaux des phares)
+    NIVEAUX = (
+        (1.0, 1, True, True, True),
+        (1.0, 2, True, True, True),
+        (1.0, 2, False, True, True),
+        (0.5, 2, False, True, True),
+        (0.5, 3, False, False, True),
+        (0.5, 3, False, False, False),
+        (0.25, 4, False, False, False),
+    )
+
+    def __init__(self, budget=BUDGET_RENDU, actif=True):
+        """
+        Args:
+            budget (float): Temps de rendu visé par frame (secondes)
+            actif (bool): False pour garder la qualité maximale en permanence
+        """
+        self.budget = budget
+        self.actif = actif
+        self.temps_moyen = 0.0  # Temps de rendu lissé (secondes)
+        self.frames_hors_budget = 0
+        self.frames_sous_marge = 0
+        self.nb_changements = 0
+        self.niveau = 0
+        self._appliquer()
+
+    def _appliquer(self):
+        """Expose les réglages du niveau courant"""
+        (self.proportion_pluie, self.intervalle_panneau, self.jambes_animees,
+         self.gyrophares, self.faisceaux) = self.NIVEAUX[self.niveau]
+
+    def enregistrer(self, duree):
+        """
+        Prend en compte le temps de rendu d'une frame.
+
+        Args:
+            duree (float): Temps passé à dessiner la frame (secondes)
+
+        Returns:
+            bool: True si le niveau de qualité a changé
+        """
+        self.temps_moyen += LISSAGE_TEMPS_RENDU * (duree - self.temps_moyen)
+        if not self.actif:
+            return False
+
+        if self.temps_moyen > self.budget:
+            self.frames_hors_budget += 1
+            self.frames_sous_marge = 0
+        elif self.temps_moyen < self.budget * MARGE_RETABLISSEMENT_QUALITE:
+            self.frames_sous_marge += 1
+            self.frames_hors_budget = 0
+        else:
+            self.frames_hors_budget = 0
+            self.frames_sous_marge = 0
+
+        if self.frames_hors_budget >= FRAMES_AVANT_DEGRADATION and self.niveau < len(self.NIVEAUX) - 1:
+            return self._changer_niveau(self.niveau + 1)
+        if self.frames_sous_marge >= FRAMES_AVANT_RETABLISSEMENT and self.niveau > 0:
+            return self._changer_niveau(self.niveau - 1)
+        return False
+
+    def _changer_niveau(self, niveau):
+        """Passe à un autre niveau ; l'effet est observé de nouveau avant le cran suivant"""
+        self.niveau = niveau
+        self.frames_hors_budget = 0
+        self.frames_sous_marge = 0
+        self.nb_changements += 1
+        self._appliquer()
+        return True
+
+    def dessiner_panneau(self, frame):
+        """True si le panneau de droite doit être redessiné à cette frame"""
+        return frame % self.intervalle_panneau == 0
@@ -0,0 +1,124 @@
+# feu_tricolore/grille_spatiale.py
+import numpy as np
+
+
+class GrilleSpatiale:
+    """
+    Index spatial en grille uniforme sur la zone de conflit (intersection).
+
+    Chaque véhicule présent dans la zone est rangé dans une cellule carrée.
+    La grille est tenue à jour au fil des déplacements : seules les voitures qui
+    changent de cellule (ou entrent / sortent de la zone) sont touchées.
+    Une collision n'est cherchée qu'entre véhicules de cellules voisines, la
+    taille de cellule étant au moins égale aux seuils de collision.
+    """
+
+    HORS_GRILLE = -1
+
+    def __init__(self, x_min, y_min, x_max, y_max, taille_cellule):
+        """
+        Args:
+            x_min, y_min, x_max, y_max (float): Limites de la zone couverte (incluses)
+            taille_cellule (float): Côté d'une cellule en pixels
+        """
+        self.x_min = x_min
+        self.y_min = y_min
+        self.x_max = x_max
+        self.y_max = y_max
+        self.taille_cellule = taille_cellule
+        self.nb_colonnes = max(1, int(np.ceil((x_max - x_min) / taille_cellule)))
+        self.nb_lignes = max(1, int(np.ceil((y_max - y_min) / taille_cellule)))
+
+        # cellule -> {voiture: None} (dict pour un ordre d'itération déterministe)
+        self.cellules = {}
+        # voiture -> cellule occupée
+        self.cellule_de = {}
+
+    def __len__(self):
+        return len(self.cellule_de)
+
+    def projection_voie(self, axe_y, coord_fixe):
+        """
+        Découpe une voie rectiligne selon les cellules qu'elle traverse.
+
+        Args:
+            axe_y (bool): True si la voie est verticale (N/S)
+            coord_fixe (float): Coordonnée transversale de la voie
+
+        Returns:
+            tuple: (bords, table) ou None si la voie ne traverse pas la grille.
+                np.searchsorted(bords, pos, side="right") donne un rang dans table,
+                qui contient l'indice linéaire de cellule (HORS_GRILLE aux extrémités).
+        """
+        if axe_y:
+            trans_min, trans_max, nb_trans = self.x_min, self.x_max, self.nb_colonnes
+            axe_min, axe_max, nb_axe = self.y_min, self.y_max, self.nb_lignes
+        else:
+            trans_min, trans_max, nb_trans = self.y_min, self.y_max, self.nb_lignes
+            axe_min, axe_max, nb_axe = self.x_min, self.x_max, self.nb_colonnes
+        if not trans_min <= coord_fixe <= trans_max:
+            return None
+
+        fixe = min(int((coord_fixe - trans_min) // self.taille_cellule), nb_trans - 1)
+        rangs = np.arange(nb_axe)
+        if axe_y:
+            cellules = rangs * self.nb_colonnes + fixe
+        else:
+            cellules = fixe * self.nb_colonnes + rangs
+
+        bords = axe_min + self.taille_cellule * np.arange(nb_axe + 1, dtype=np.float64)
+        # Bornes incluses : la limite haute appartient encore à la dernière cellule
+        bords[-1] = np.nextafter(axe_max, np.inf)
+        table = np.concatenate(([self.HORS_GRILLE], cellules, [self.HORS_GRILLE])).astype(np.int64)
+        return bords, table
+
+    def placer(self, voiture, cellule):
+        """Range une voiture dans une cellule (HORS_GRILLE pour la sortir de la grille)"""
+        ancienne = self.cellule_de.get(voiture, self.HORS_GRILLE)
+        if ancienne == cellule:
+            return
+        if ancienne != self.HORS_GRILLE:
+            occupants = self.cellules[ancienne]
+            del occupants[voiture]
+            if not occupants:
+                del self.cellules[ancienne]
+            del self.cellule_de[voiture]
+        if cellule != self.HORS_GRILLE:
+            self.cellules.setdefault(cellule, {})[voiture] = None
+            self.cellule_de[voiture] = cellule
+
+    def retirer(self, voiture):
+        """Sort une voiture de la grille"""
+        self.placer(voiture, self.HORS_GRILLE)
+
+    def _voisins_avant(self, cellule):
+        """Cellules voisines à comparer (demi-voisinage pour ne tester chaque paire qu'une fois)"""
+        ligne, colonne = divmod(cellule, self.nb_colonnes)
+        for dl, dc in ((0, 1), (1, -1), (1, 0), (1, 1)):
+            l, c = ligne + dl, colonne + dc
+            if 0 <= l < self.nb_lignes and 0 <= c < self.nb_colonnes:
+                voisine = self.cellules.get(l * self.nb_colonnes + c)
+                if voisine:
+                    yield voisine
+
+    def premiere_collision(self, seuil_x, seuil_y):
+        """
+        Cherche une paire de véhicules qui se chevauchent.
+
+        Args:
+            seuil_x, seuil_y (float): Écarts en dessous desquels deux véhicules se touchent
+
+        Returns:
+            tuple: (voiture1, voiture2) ou None
+        """
+        for cellule, occupants in self.cellules.items():
+            voisines = list(self._voisins_avant(cellule))
+            if len(occupants) < 2 and not voisines:
+                continue
+            locaux = [(v, v.x, v.y) for v in occupants]
+            voisins = [(v, v.x, v.y) for voisine in voisines for v in voisine]
+            for i, (v1, x1, y1) in enumerate(locaux):
+                for v2, x2, y2 in locaux[i + 1:] + voisins:
+                    if abs(x1 - x2) < seuil_x and abs(y1 - y2) < seuil_y:
+                        return v1, v2
+        return None
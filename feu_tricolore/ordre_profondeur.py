@@ -0,0 +1,59 @@
+# feu_tricolore/ordre_profondeur.py
+
+
+class OrdreProfondeur:
+    """
+    Ordre de dessin des véhicules, du plus loin au plus proche du centre.
+
+    La liste est conservée d'une frame à l'autre : les voitures apparues sont
+    ajoutées, celles qui ont quitté leur voie sont retirées, puis la liste est
+    retriée en place. D'une frame à l'autre l'ordre ne change que localement
+    (véhicules qui se croisent près du centre) : le tri de Python, qui exploite
+    les séquences déjà ordonnées, ne fait alors qu'une passe quasi linéaire.
+    Les distances sont calculées voie par voie sur les colonnes NumPy.
+    """
+
+    def __init__(self):
+        self.voitures = []  # Ordre de dessin courant
+        self._presentes = set()
+
+    def __len__(self):
+        return len(self.voitures)
+
+    def __iter__(self):
+        return iter(self.voitures)
+
+    def mettre_a_jour(self, voies, centre_x, centre_y):
+        """
+        Recalcule l'ordre de dessin.
+
+        Args:
+            voies (iterable): VoieVehicules à dessiner
+            centre_x, centre_y (float): Centre de l'intersection
+
+        Returns:
+            list: Voitures du plus loin au plus proche du centre (liste partagée)
+        """
+        distances = {}
+        for voie in voies:
+            if len(voie) == 0:
+                continue
+            if voie.axe_y:
+                transverse = voie.coord_fixe - centre_x
+                axe = voie.positions() - centre_y
+            else:
+                transverse = voie.coord_fixe - centre_y
+                axe = voie.positions() - centre_x
+            carres = axe * axe + transverse * transverse
+            distances.update(zip(voie.lignes(), carres.tolist()))
+        distances.pop(None, None)  # Trous de la file
+
+        presentes = distances.keys()
+        if presentes != self._presentes:
+            # Sorties : retirées ; entrées : ajoutées en tête (elles apparaissent loin du centre)
+            nouvelles = [v for v in presentes if v not in self._presentes]
+            self.voitures = nouvelles + [v for v in self.voitures if v in distances]
+            self._presentes = set(presentes)
+
+        self.voitures.sort(key=distances.__getitem__, reverse=True)
+        return self.voitures
@@ -0,0 +1,53 @@
+# feu_tricolore/pool_vehicules.py
+from feu_tricolore.voiture import Voiture
+
+
+class PoolVehicules:
+    """
+    Réserve de Voiture recyclées.
+
+    Une voiture qui quitte sa voie (sortie ou accident) est rendue au pool puis
+    réinitialisée au prochain spawn : en régime établi, la simulation ne crée
+    plus aucun objet véhicule.
+    """
+
+    def __init__(self):
+        self.libres = []
+        self.nb_crees = 0  # Voitures réellement allouées
+        self.nb_recyclees = 0  # Spawns servis par une voiture libre
+
+    def obtenir(self, x, y, direction, couleur, est_ambulance=False):
+        """Retourne une voiture prête à circuler (recyclée si possible)"""
+        if self.libres:
+            voiture = self.libres.pop()
+            voiture.reinitialiser(x, y, direction, couleur, est_ambulance)
+            self.nb_recyclees += 1
+            return voiture
+        self.nb_crees += 1
+        return Voiture(x, y, direction, couleur, est_ambulance)
+
+    def liberer(self, voiture):
+        """Rend une voiture qui n'est plus utilisée"""
+        self.libres.append(voiture)
+
+    @property
+    def en_service(self):
+        """Nombre de voitures actuellement utilisées"""
+        return self.nb_crees - len(self.libres)
+
+    @property
+    def occupation(self):
+        """Part des voitures allouées actuellement en service (0 à 1)"""
+        if self.nb_crees == 0:
+            return 0.0
+        return self.en_service / self.nb_crees
+
+    def statistiques(self):
+        """Métriques d'occupation du pool"""
+        return {
+            "en_service": self.en_service,
+            "libres": len(self.libres),
+            "crees": self.nb_crees,
+            "recyclees": self.nb_recyclees,
+            "occupation": self.occupation,
+        }
@@ -0,0 +1,353 @@
+# feu_tricolore/voie_vehicules.py
+import numpy as np
+from feu_tricolore.constants import (
+    DISTANCE_SECURITE_VOITURE,
+    ZONE_ATTENTE_NS_MIN, ZONE_ATTENTE_NS_MAX,
+    ZONE_ATTENTE_EO_MIN, ZONE_ATTENTE_EO_MAX,
+    ZONE_APPROCHE_DISTANCE
+)
+from feu_tricolore.grille_spatiale import GrilleSpatiale
+
+
+class VoieVehicules:
+    """
+    Voie de circulation (une direction) stockée en structure de tableaux NumPy.
+
+    Les véhicules sont rangés dans l'ordre de la file entre les lignes debut
+    (le premier entré, le plus proche de la sortie) et fin : chaque véhicule suit
+    le véhicule réel qui le précède. Comme une deque, la file se vide par la tête
+    (les sorties avancent debut) et se remplit par la queue. Une voiture garde
+    sa ligne tant qu'elle est sur la voie (Voiture.indice), ce qui permet de la
+    retirer en O(1) : sa ligne devient un trou (position NaN), transparent pour
+    les véhicules suivants et éliminé quand il atteint la tête.
+    Les positions font foi dans les colonnes ; les objets Voiture associés ne
+    servent qu'à l'identité et au rendu, et lisent leur position dans la voie.
+
+    Colonnes :
+      - pos : coordonnée le long de l'axe de circulation (y pour N/S, x pour E/O), NaN pour un trou
+      - vitesse : vitesse effective en pixels par seconde (météo comprise)
+      - ambulance : True pour les véhicules prioritaires
+      - troncon : tronçon de voie occupé (voir _decouper)
+
+    La voie est découpée en tronçons aux frontières des zones de comptage et des
+    cellules de la grille spatiale. Un véhicule ne change de tronçon qu'en
+    franchissant une frontière : les effectifs par zone et la grille ne sont
+    modifiés qu'à ces événements d'entrée / sortie.
+    """
+
+    CAPACITE_INITIALE = 16
+
+    # Zones de comptage, dans l'ordre de progression vers le centre
+    ZONE_LOIN = 0  # Avant la zone d'approche
+    ZONE_APPROCHE = 1  # Zone d'approche, hors zone d'attente
+    ZONE_ATTENTE = 2  # Zone d'attente (comptée aussi dans l'approche)
+    ZONE_PASSEE = 3  # Entrée dans l'intersection et au-delà
+    NB_ZONES = 4
+
+    def __init__(self, direction, coord_fixe, limite_sortie, zone_arret, centre, grille=None, pool=None):
+        """
+        Args:
+            direction (str): "N", "S", "E" ou "O"
+            coord_fixe (float): Coordonnée transversale de la voie (x pour N/S, y pour E/O)
+            limite_sortie (float): Coordonnée au-delà de laquelle un véhicule quitte la voie
+            zone_arret (tuple): (min, max) de la zone d'arrêt au feu sur l'axe de la voie
+            centre (float): Coordonnée du centre de l'intersection sur l'axe de la voie
+            grille (GrilleSpatiale): Index spatial tenu à jour par la voie (optionnel)
+            pool (PoolVehicules): Reçoit les voitures qui quittent la voie (optionnel)
+        """
+        self.direction = direction
+        self.axe_y = direction in ("N", "S")
+        self.coord_fixe = coord_fixe
+        self.centre = centre
+        # Sens de progression sur l'axe : +1 si la coordonnée augmente (N descend, O va à droite)
+        self.signe = 1 if direction in ("N", "O") else -1
+
+        # Bornes exprimées en progression (signe * pos), croissante vers la sortie
+        self.progression_sortie = self.signe * limite_sortie
+        bornes = sorted((self.signe * zone_arret[0], self.signe * zone_arret[1]))
+        self.arret_debut, self.arret_fin = bornes
+
+        if self.axe_y:
+            self.attente_min, self.attente_max = ZONE_ATTENTE_NS_MIN, ZONE_ATTENTE_NS_MAX
+        else:
+            self.attente_min, self.attente_max = ZONE_ATTENTE_EO_MIN, ZONE_ATTENTE_EO_MAX
+
+        self.grille = grille
+        self.pool = pool
+        self._decouper()
+        self.effectifs = [0] * self.NB_ZONES  # Véhicules par zone de comptage
+
+        capacite = self.CAPACITE_INITIALE
+        self.debut = 0  # Ligne de tête de file
+        self.fin = 0  # Ligne suivant la queue de file
+        self.nb_trous = 0  # Lignes libérées entre debut et fin
+        self.pos = np.zeros(capacite, dtype=np.float64)
+        self.vitesse = np.zeros(capacite, dtype=np.float64)
+        self.ambulance = np.zeros(capacite, dtype=bool)
+        self.troncon = np.zeros(capacite, dtype=np.int64)
+        self.voitures = [None] * capacite  # Voiture de chaque ligne (None pour un trou)
+        self.nb_ambulances = 0  # Évite de parcourir la colonne à chaque pas
+        self.facteur_vitesse = 1.0  # Facteur météo appliqué à la colonne vitesse
+        self.version = 0  # Incrémentée à chaque modification (invalide les instantanés)
+
+    def __len__(self):
+        return self.fin - self.debut - self.nb_trous
+
+    def __iter__(self):
+        return (voiture for voiture in self.voitures[self.debut:self.fin] if voiture is not None)
+
+    def __contains__(self, voiture):
+        return voiture.voie is self
+
+    def positions(self):
+        """Vue sur les coordonnées le long de l'axe de la file (NaN pour les trous)"""
+        return self.pos[self.debut:self.fin]
+
+    def lignes(self):
+        """Voitures de la file ligne à ligne, alignées sur positions() (None pour les trous)"""
+        return self.voitures[self.debut:self.fin]
+
+    def ambulances(self):
+        """Vue sur le masque des ambulances de la file"""
+        return self.ambulance[self.debut:self.fin]
+
+    def contient_ambulance(self):
+        """True si au moins une ambulance circule sur la voie"""
+        return self.nb_ambulances > 0
+
+    def nb_en_attente(self):
+        """Véhicules dans la zone d'attente (O(1))"""
+        return self.effectifs[self.ZONE_ATTENTE]
+
+    def nb_approchant(self):
+        """Véhicules dans la zone d'approche, zone d'attente comprise (O(1))"""
+        return self.effectifs[self.ZONE_APPROCHE] + self.effectifs[self.ZONE_ATTENTE]
+
+    def zone_de_position(self, pos):
+        """Zone de comptage d'une coordonnée (mêmes inégalités strictes / larges que les comptages)"""
+        debut_approche = self.centre - self.signe * ZONE_APPROCHE_DISTANCE
+        debut_attente = self.centre - self.signe * self.attente_max
+        fin_attente = self.centre - self.signe * self.attente_min
+        if self.signe > 0:
+            if pos <= debut_approche:
+                return self.ZONE_LOIN
+            if pos < debut_attente:
+                return self.ZONE_APPROCHE
+            if pos < fin_attente:
+                return self.ZONE_ATTENTE
+            return self.ZONE_PASSEE
+        if pos >= debut_approche:
+            return self.ZONE_LOIN
+        if pos > debut_attente:
+            return self.ZONE_APPROCHE
+        if pos > fin_attente:
+            return self.ZONE_ATTENTE
+        return self.ZONE_PASSEE
+
+    def position(self, voiture):
+        """Coordonnée le long de l'axe d'une voiture de la voie"""
+        return float(self.pos[voiture.indice])
+
+    def deplacer_vers(self, voiture, valeur):
+        """Modifie la coordonnée le long de l'axe d'une voiture de la voie"""
+        i = voiture.indice
+        self.pos[i] = valeur
+        self.version += 1
+        self._mettre_a_jour_troncons(slice(i, i + 1))
+
+    def ajouter(self, voiture):
+        """Ajoute une voiture en queue de file"""
+        if self.fin == len(self.pos):
+            self._reorganiser()
+        i = self.fin
+        self.pos[i] = voiture.y if self.axe_y else voiture.x
+        voiture.vitesse = voiture.vitesse_base * self.facteur_vitesse
+        self.vitesse[i] = voiture.vitesse
+        self.ambulance[i] = voiture.est_ambulance
+        self.fin += 1
+        self.nb_ambulances += voiture.est_ambulance
+        self.voitures[i] = voiture
+        voiture.attacher(self, i)
+        self.version += 1
+
+        # Entrée sur la voie : premier tronçon occupé
+        troncon = int(np.searchsorted(self.bords_troncons, self.pos[i], side="right"))
+        self.troncon[i] = troncon
+        self.effectifs[self.zone_troncon[troncon]] += 1
+        if self.grille is not None:
+            self.grille.placer(voiture, self.cellule_troncon[troncon])
+
+    def appliquer_facteur_vitesse(self, facteur_vitesse):
+        """Recalcule les vitesses effectives (appelé uniquement quand la météo change)"""
+        self.facteur_vitesse = facteur_vitesse
+        for i in range(self.debut, self.fin):
+            voiture = self.voitures[i]
+            if voiture is not None:
+                voiture.vitesse = voiture.vitesse_base * facteur_vitesse
+                self.vitesse[i] = voiture.vitesse
+
+    def retirer(self, voiture):
+        """Retire une voiture de la voie (accident) en O(1)"""
+        if voiture.voie is not self:
+            return
+        self._liberer(voiture.indice)
+        self._depiler_tete()
+
+    def mettre_a_jour(self, dt, arret_force, peut_ambulance_avancer):
+        """
+        Avance tous les véhicules de la voie en une passe vectorisée.
+
+        Args:
+            dt (float): Durée du pas (secondes)
+            arret_force (bool): True si les véhicules doivent s'arrêter dans la zone
+                d'arrêt (feu non vert, ambulance sur l'axe ou piétons)
+            peut_ambulance_avancer (callable): Appelé avec une ambulance, renvoie True
+                si elle peut avancer
+        """
+        debut, fin = self.debut, self.fin
+        n = fin - debut
+        if n == 0:
+            return
+
+        pos = self.pos[debut:fin]
+        progression = pos * self.signe
+
+        # Distance de sécurité avec le véhicule devant
+        bloque = np.zeros(n, dtype=bool)
+        if self.nb_trous:
+            # Les trous sont transparents : chacun suit le dernier véhicule réel devant lui
+            reels = ~np.isnan(progression)
+            devant = np.maximum.accumulate(np.where(reels, np.arange(n), -1))[:-1]
+            bloque[1:] = (devant >= 0) & ((progression[devant] - progression[1:]) < DISTANCE_SECURITE_VOITURE)
+        else:
+            bloque[1:] = (progression[:-1] - progression[1:]) < DISTANCE_SECURITE_VOITURE
+
+        # Zone d'arrêt au feu AVANT l'intersection
+        if arret_force:
+            bloque |= (progression >= self.arret_debut) & (progression < self.arret_fin)
+
+        # AMBULANCES : ignorent file et feu, seule la sécurité de l'intersection compte
+        if self.nb_ambulances:
+            for i in np.flatnonzero(self.ambulance[debut:fin]):
+                bloque[i] = not peut_ambulance_avancer(self.voitures[debut + i])
+
+        deplacement = self.vitesse[debut:fin] * (self.signe * dt)
+        deplacement[bloque] = 0.0
+        pos += deplacement
+        self.version += 1
+        self._mettre_a_jour_troncons(slice(debut, fin))
+
+        # Supprimer les voitures qui sortent : en tête de file dans le cas courant,
+        # au milieu si une ambulance a doublé (la ligne devient alors un trou)
+        progression += np.abs(deplacement)
+        sorties = progression > self.progression_sortie
+        if sorties.any():
+            for i in np.flatnonzero(sorties):
+                self._liberer(debut + i)
+            self._depiler_tete()
+
+    def _liberer(self, ligne):
+        """Transforme la ligne d'une voiture qui quitte la voie en trou"""
+        voiture = self.voitures[ligne]
+        self.effectifs[self.zone_troncon[self.troncon[ligne]]] -= 1
+        if self.grille is not None:
+            self.grille.retirer(voiture)
+        voiture.detacher(float(self.pos[ligne]))
+        self.nb_ambulances -= voiture.est_ambulance
+
+        self.pos[ligne] = np.nan
+        self.vitesse[ligne] = 0.0
+        self.ambulance[ligne] = False
+        self.troncon[ligne] = self.troncon_trou
+        self.voitures[ligne] = None
+        self.nb_trous += 1
+        self.version += 1
+        if self.pool is not None:
+            self.pool.liberer(voiture)
+
+    def _depiler_tete(self):
+        """Retire les trous en tête de file"""
+        while self.debut < self.fin and self.voitures[self.debut] is None:
+            self.debut += 1
+            self.nb_trous -= 1
+        if self.debut == self.fin:
+            self.debut = self.fin = 0
+
+    def _reorganiser(self):
+        """
+        Ramène la file en début de colonnes sans les trous quand la queue atteint
+        la fin de la capacité (doublée si la file occupe plus de la moitié).
+        Seul moment où les voitures changent de ligne.
+        """
+        capacite = len(self.pos)
+        lignes = [i for i in range(self.debut, self.fin) if self.voitures[i] is not None]
+        if len(lignes) >= capacite // 2:
+            capacite *= 2
+        k = len(lignes)
+
+        for nom in ("pos", "vitesse", "ambulance", "troncon"):
+            ancienne = getattr(self, nom)
+            nouvelle = np.zeros(capacite, dtype=ancienne.dtype)
+            nouvelle[:k] = ancienne[lignes]
+            setattr(self, nom, nouvelle)
+
+        voitures = [None] * capacite
+        for i, ligne in enumerate(lignes):
+            voiture = self.voitures[ligne]
+            voiture.indice = i
+            voitures[i] = voiture
+        self.voitures = voitures
+        self.debut, self.fin, self.nb_trous = 0, k, 0
+
+    def _decouper(self):
+        """
+        Découpe la voie en tronçons homogènes (même zone de comptage, même cellule).
+
+        np.searchsorted(bords_troncons, pos, side="right") donne le tronçon d'une
+        position ; zone_troncon et cellule_troncon en donnent la zone et la cellule.
+        """
+        # Frontières des zones de comptage : chaque seuil et la position juste
+        # au-dessus, pour que l'égalité tombe dans un tronçon à part
+        bords = []
+        for distance in (self.attente_min, self.attente_max, ZONE_APPROCHE_DISTANCE):
+            seuil = float(self.centre - self.signe * distance)
+            bords += [seuil, np.nextafter(seuil, np.inf)]
+
+        projection = self.grille.projection_voie(self.axe_y, self.coord_fixe) if self.grille is not None else None
+        if projection is None:
+            self.grille = None
+        else:
+            bords_cellules, table_cellules = projection
+            bords += list(bords_cellules)
+
+        self.bords_troncons = np.unique(np.array(bords, dtype=np.float64))
+        # Tronçon des trous (NaN est rangé après tous les bords) : jamais de franchissement
+        self.troncon_trou = len(self.bords_troncons)
+
+        # Chaque tronçon [bord_k, bord_k+1) est évalué en son bord inférieur
+        representants = np.concatenate(([self.bords_troncons[0] - 1.0], self.bords_troncons))
+        self.zone_troncon = [self.zone_de_position(r) for r in representants]
+        if self.grille is None:
+            self.cellule_troncon = [GrilleSpatiale.HORS_GRILLE] * len(representants)
+        else:
+            rangs = np.searchsorted(bords_cellules, representants, side="right")
+            self.cellule_troncon = [int(c) for c in table_cellules[rangs]]
+
+    def _mettre_a_jour_troncons(self, lignes):
+        """Recalcule le tronçon des lignes données ; seuls les franchissements de frontière coûtent"""
+        nouveaux = np.searchsorted(self.bords_troncons, self.pos[lignes], side="right")
+        anciens = self.troncon[lignes]
+        differents = nouveaux != anciens
+        if not differents.any():
+            return
+        changes = np.flatnonzero(differents)
+        debut = lignes.start
+        for j in changes:
+            ancien, nouveau = anciens[j], nouveaux[j]
+            zone_ancienne, zone_nouvelle = self.zone_troncon[ancien], self.zone_troncon[nouveau]
+            if zone_ancienne != zone_nouvelle:
+                self.effectifs[zone_ancienne] -= 1
+                self.effectifs[zone_nouvelle] += 1
+            if self.grille is not None and self.cellule_troncon[ancien] != self.cellule_troncon[nouveau]:
+                self.grille.placer(self.voitures[debut + j], self.cellule_troncon[nouveau])
+        anciens[changes] = nouveaux[changes]
@@ -1,13 +1,35 @@
 # feu_tricolore/voiture.py
+import itertools
+import threading
+import numpy as np
 import pygame
 from feu_tricolore.meteo import meteo
+from feu_tricolore.audio import audio
+from feu_tricolore.cache_audio import cache_audio, frequence_mixer
+from feu_tricolore.constants import (
+    VITESSE_VOITURE, VITESSE_AMBULANCE, MARGE_AFFICHAGE_VOITURE,
+    DETAIL_COMPLET, DETAIL_SIMPLIFIE
+)
 
 class Voiture:
     """
     Représente une voiture animée dans la simulation.
     Modèle (Model) dans l'architecture MVC.
+
+    Enregistrement léger (__slots__, pas de __dict__) : la position et la
+    vitesse de circulation sont portées par la voie, la sirène est gérée
+    explicitement par GestionnaireAmbulances (demarrer_sirene / arreter_sirene).
     """
 
+    __slots__ = (
+        "id", "voie", "indice", "_x", "_y", "direction", "couleur",
+        "est_ambulance", "vitesse_base", "vitesse", "temps_gyrophare"
+    )
+
+    # Dimensions communes à tous les véhicules
+    largeur = 40
+    hauteur = 25
+
     # Constantes de couleurs (pour les phares)
     JAUNE = (255, 255, 0)
     NOIR = (0, 0, 0)
@@ -18,14 +40,60 @@ class Voiture:
     # Son d'ambulance (variable de classe partagée)
     son_ambulance = None
     son_initialise = False
+    # Signaux de sirène déjà synthétisés : (type, fréquence) -> tableau int16 mono
+    _signaux_sirene = {}
+    _prechargement_sirene = None  # Thread de synthèse lancé au démarrage
+
+    # Identifiants uniques croissants (ordre d'arrivée dans les voies)
+    _compteur_ids = itertools.count()
+
+    @classmethod
+    def demarrer_sirene(cls):
+        """Lance la sirène en boucle (partagée par toutes les ambulances)"""
+        # Initialiser le son si pas encore fait
+        if not cls.son_initialise:
+            cls.initialiser_son_ambulance()
+
+        if cls.son_ambulance:
+            try:
+                cls.son_ambulance.play(loops=-1)  # -1 = boucle infinie
+            except Exception as e:
+                print(f"Erreur lors de la lecture du son: {e}")
+
+    @classmethod
+    def arreter_sirene(cls):
+        """Arrête la sirène (plus aucune ambulance en circulation)"""
+        if cls.son_ambulance:
+            try:
+                cls.son_ambulance.stop()
+            except Exception:
+                pass
+
+    @classmethod
+    def precharger_sirene(cls, type_sirene="europeenne"):
+        """
+        Prépare le signal de la sirène en arrière-plan (appelé au démarrage),
+        pour que la première ambulance n'interrompe pas la simulation.
+        """
+        if cls._prechargement_sirene is not None:
+            return
+        frequence = frequence_mixer()
+        cls._prechargement_sirene = threading.Thread(
+            target=cls._signal_sirene, args=(type_sirene, frequence),
+            name="synthese-sirene", daemon=True
+        )
+        cls._prechargement_sirene.start()
 
     @classmethod
     def initialiser_son_ambulance(cls):
         """Initialise le son d'ambulance une seule fois pour toutes les instances"""
         if not cls.son_initialise:
             try:
-                # Créer un son de sirène synthétique avec Pygame
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                # Ouvrir le mixer (rien en mode headless, où l'audio n'est pas activé)
+                if not audio.ouvrir():
+                    return
+                if cls._prechargement_sirene is not None:
+                    cls._prechargement_sirene.join()
                 cls.son_ambulance = cls._generer_son_sirene("europeenne")
                 cls.son_initialise = True
             except Exception as e:
@@ -34,72 +102,81 @@ class Voiture:
                 cls.son_initialise = True
 
     @classmethod
-    def _generer_son_sirene(cls, type_sirene="europeenne"):
+    def _signal_sirene(cls, type_sirene, frequence):
+        """Signal de la sirène (mémoire, puis cache disque, puis synthèse)"""
+        cle = (type_sirene, frequence)
+        signal = cls._signaux_sirene.get(cle)
+        if signal is None:
+            signal = cache_audio.obtenir(
+                f"sirene_{type_sirene}", frequence,
+                lambda f: cls._synthetiser_sirene(type_sirene, f)
+            )
+            cls._signaux_sirene[cle] = signal
+        return signal
+
+    @staticmethod
+    def _synthetiser_sirene(type_sirene, sample_rate):
         """
-        Génère un son de sirène synthétique
+        Synthétise une sirène (calcul NumPy vectorisé, sans Pygame)
         Types disponibles:
         - "europeenne" : Hi-Lo classique (660/960 Hz)
         - "americaine" : Wail montant/descendant
         - "yelp" : Rapide et urgent
         - "simple" : Bip-bip basique
+
+        Returns:
+            np.ndarray: Signal mono int16
+        """
+        # Paramètres du son
+        duration = 1.5  # 1.5 secondes
+        t = np.linspace(0, duration, int(sample_rate * duration))
+
+        if type_sirene == "americaine":
+            # Sirène américaine "Wail" - fréquence qui monte et descend
+            freq_min = 500
+            freq_max = 1200
+            # Modulation sinusoïdale de la fréquence
+            freq = freq_min + (freq_max - freq_min) * (0.5 + 0.5 * np.sin(2 * np.pi * 1.5 * t))
+            # Créer le signal avec fréquence variable
+            phase = np.cumsum(2 * np.pi * freq / sample_rate)
+            signal = np.sin(phase)
+
+        elif type_sirene == "yelp":
+            # Sirène "Yelp" - rapide et urgente
+            freq_min = 600
+            freq_max = 1400
+            # Modulation rapide (4 cycles par seconde)
+            freq = freq_min + (freq_max - freq_min) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t))
+            phase = np.cumsum(2 * np.pi * freq / sample_rate)
+            signal = np.sin(phase)
+
+        elif type_sirene == "simple":
+            # Simple bip-bip (pour tests ou préférence minimaliste)
+            freq = 800
+            # Bip de 0.15s toutes les 0.4s
+            signal = np.where((t % 0.4) < 0.15, np.sin(2 * np.pi * freq * t), 0.0)
+
+        else:
+            # Sirène européenne Hi-Lo (660/960 Hz), type par défaut
+            freq1 = 660
+            freq2 = 960
+            freq = np.where((t % 0.5) < 0.25, freq1, freq2)
+            signal = np.sin(2 * np.pi * freq * t)
+
+        # Ajouter une enveloppe pour éviter les clics
+        envelope = np.minimum(t * 10, 1.0) * np.minimum((duration - t) * 10, 1.0)
+        signal = signal * envelope * 0.3  # Volume à 30%
+
+        # Convertir en format pygame
+        return np.int16(signal * 32767)
+
+    @classmethod
+    def _generer_son_sirene(cls, type_sirene="europeenne"):
+        """
+        Crée le son de sirène à la fréquence du mixer (voir _synthetiser_sirene)
         """
         try:
-            import numpy as np
-
-            # Paramètres du son
-            sample_rate = 22050
-            duration = 1.5  # 1.5 secondes
-            t = np.linspace(0, duration, int(sample_rate * duration))
-
-            if type_sirene == "europeenne":
-                # Sirène européenne Hi-Lo (660/960 Hz)
-                freq1 = 660
-                freq2 = 960
-                signal = np.zeros_like(t)
-                for i, time in enumerate(t):
-                    if (time % 0.5) < 0.25:
-                        signal[i] = np.sin(2 * np.pi * freq1 * time)
-                    else:
-                        signal[i] = np.sin(2 * np.pi * freq2 * time)
-
-            elif type_sirene == "americaine":
-                # Sirène américaine "Wail" - fréquence qui monte et descend
-                freq_min = 500
-                freq_max = 1200
-                # Modulation sinusoïdale de la fréquence
-                freq = freq_min + (freq_max - freq_min) * (0.5 + 0.5 * np.sin(2 * np.pi * 1.5 * t))
-                # Créer le signal avec fréquence variable
-                phase = np.cumsum(2 * np.pi * freq / sample_rate)
-                signal = np.sin(phase)
-
-            elif type_sirene == "yelp":
-                # Sirène "Yelp" - rapide et urgente
-                freq_min = 600
-                freq_max = 1400
-                # Modulation rapide (4 cycles par seconde)
-                freq = freq_min + (freq_max - freq_min) * (0.5 + 0.5 * np.sin(2 * np.pi * 4 * t))
-                phase = np.cumsum(2 * np.pi * freq / sample_rate)
-                signal = np.sin(phase)
-
-            elif type_sirene == "simple":
-                # Simple bip-bip (pour tests ou préférence minimaliste)
-                freq = 800
-                signal = np.zeros_like(t)
-                # Créer des bips courts
-                for i, time in enumerate(t):
-                    if (time % 0.4) < 0.15:  # Bip de 0.15s toutes les 0.4s
-                        signal[i] = np.sin(2 * np.pi * freq * time)
-
-            else:
-                # Par défaut: européenne
-                return cls._generer_son_sirene("europeenne")
-
-            # Ajouter une enveloppe pour éviter les clics
-            envelope = np.minimum(t * 10, 1.0) * np.minimum((duration - t) * 10, 1.0)
-            signal = signal * envelope * 0.3  # Volume à 30%
-
-            # Convertir en format pygame
-            signal = np.int16(signal * 32767)
+            signal = cls._signal_sirene(type_sirene, frequence_mixer())
 
             # Créer un tableau stéréo
             stereo_signal = np.column_stack((signal, signal))
@@ -123,62 +200,85 @@ class Voiture:
             couleur (tuple): Couleur RGB de la voiture
             est_ambulance (bool): True si c'est une ambulance (priorité absolue)
         """
-        self.x = x
-        self.y = y
+        self.reinitialiser(x, y, direction, couleur, est_ambulance)
+
+    def reinitialiser(self, x, y, direction, couleur, est_ambulance=False):
+        """Remet la voiture à neuf (utilisé aussi par PoolVehicules pour recycler)"""
+        self.id = next(Voiture._compteur_ids)
+        self.voie = None  # VoieVehicules propriétaire de la position, si la voiture circule
+        self.indice = 0  # Ligne occupée dans les colonnes de la voie (stable tant qu'elle y circule)
+        self._x = x
+        self._y = y
         self.direction = direction  # "N", "S", "E", "O"
         self.couleur = couleur
         self.est_ambulance = est_ambulance
-        self.largeur = 40
-        self.hauteur = 25
-        self.vitesse_base = 5 if est_ambulance else 3  # Ambulance plus rapide
+        self.vitesse_base = VITESSE_AMBULANCE if est_ambulance else VITESSE_VOITURE  # px/s, ambulance plus rapide
+        # Vitesse effective (px/s) : recalculée par la voie seulement quand la météo change
+        self.vitesse = self.vitesse_base
         self.temps_gyrophare = 0  # Pour animation du gyrophare
 
-        # Gestion du son pour les ambulances
-        if self.est_ambulance:
-            # Initialiser le son si pas encore fait
-            if not Voiture.son_initialise:
-                Voiture.initialiser_son_ambulance()
-
-            # Démarrer le son de sirène en boucle
-            if Voiture.son_ambulance:
-                try:
-                    Voiture.son_ambulance.play(loops=-1)  # -1 = boucle infinie
-                except Exception as e:
-                    print(f"Erreur lors de la lecture du son: {e}")
+    @property
+    def x(self):
+        """Position x (lue dans la voie pour les véhicules Est/Ouest en circulation)."""
+        if self.voie is not None and not self.voie.axe_y:
+            return self.voie.position(self)
+        return self._x
+
+    @x.setter
+    def x(self, valeur):
+        if self.voie is not None and not self.voie.axe_y:
+            self.voie.deplacer_vers(self, valeur)
+        else:
+            self._x = valeur
 
     @property
-    def vitesse(self):
-        """Vitesse effective tenant compte de la météo."""
-        return self.vitesse_base * meteo.facteur_vitesse
+    def y(self):
+        """Position y (lue dans la voie pour les véhicules Nord/Sud en circulation)."""
+        if self.voie is not None and self.voie.axe_y:
+            return self.voie.position(self)
+        return self._y
+
+    @y.setter
+    def y(self, valeur):
+        if self.voie is not None and self.voie.axe_y:
+            self.voie.deplacer_vers(self, valeur)
+        else:
+            self._y = valeur
 
-    def __del__(self):
-        """Destructeur - arrête le son quand l'ambulance est détruite"""
-        if self.est_ambulance and Voiture.son_ambulance:
-            try:
-                Voiture.son_ambulance.stop()
-            except Exception:
-                pass
+    def attacher(self, voie, indice):
+        """Confie la position à une voie (appelé par VoieVehicules.ajouter)."""
+        self.voie = voie
+        self.indice = indice
+
+    def detacher(self, position):
+        """Reprend la position en local quand la voiture quitte sa voie."""
+        if self.voie.axe_y:
+            self._y = position
+        else:
+            self._x = position
+        self.voie = None
 
-    def deplacer(self, peut_avancer):
+    def dessiner(self, ecran, niveau_detail=DETAIL_COMPLET):
         """
-        Déplace la voiture si autorisé.
+        Dessine la voiture sur l'écran Pygame à partir des sprites pré-rendus
+        (voir AtlasVehicules) : un blit, deux pour une ambulance.
 
         Args:
-            peut_avancer (bool): True si la voiture peut avancer (feu vert)
+            ecran (pygame.Surface): Surface Pygame sur laquelle dessiner
+            niveau_detail (str): DETAIL_COMPLET, DETAIL_SIMPLIFIE (carrosserie unie)
+                ou DETAIL_DENSITE (simple point de la couleur du véhicule)
         """
-        if peut_avancer:
-            if self.direction == "N":  # Nord -> Sud (descend)
-                self.y += self.vitesse
-            elif self.direction == "S":  # Sud -> Nord (monte)
-                self.y -= self.vitesse
-            elif self.direction == "E":  # Est -> Ouest (va vers la gauche)
-                self.x -= self.vitesse
-            elif self.direction == "O":  # Ouest -> Est (va vers la droite)
-                self.x += self.vitesse
-
-    def dessiner(self, ecran):
+        from feu_tricolore.atlas_vehicules import atlas_vehicules
+        if niveau_detail == DETAIL_COMPLET:
+            ecran.blits(atlas_vehicules.sprites(self, meteo.est_pluie), doreturn=False)
+        elif niveau_detail == DETAIL_SIMPLIFIE:
+            ecran.blit(*atlas_vehicules.sprite_simplifie(self))
+        else:
+            ecran.fill(self.couleur, (int(self.x) - 2, int(self.y) - 2, 4, 4))
+
+    def dessiner_modele(self, ecran):
         """
-        Dessine la voiture sur l'écran Pygame.
+        Dessin vectoriel de la carrosserie, modèle des sprites de AtlasVehicules.
 
         Args:
             ecran (pygame.Surface): Surface Pygame sur laquelle dessiner
@@ -196,21 +296,28 @@ class Voiture:
         pygame.draw.rect(ecran, self.NOIR, rect, 2, border_radius=5)
 
         if self.est_ambulance:
-            # Ambulance : dessin spécial avec croix rouge et gyrophare
-            self._dessiner_ambulance(ecran, rect)
+            # Ambulance : croix rouge (le gyrophare animé est un sprite à part)
+            self._dessiner_croix(ecran)
         else:
             # Dessiner les phares selon la direction
             self._dessiner_phares(ecran)
 
-    
+    def phase_gyrophare(self):
+        """
+        Avance l'animation du gyrophare d'une frame.
+
+        Returns:
+            int: Phase stroboscopique (0 flash bleu, 1 flash rouge, 2 éteint)
+        """
+        self.temps_gyrophare += 1
+        return (self.temps_gyrophare // 6) % 3
 
-    def _dessiner_ambulance(self, ecran, rect):
+    def _dessiner_croix(self, ecran):
         """
-        Dessine les éléments distinctifs d'une ambulance.
+        Dessine la croix rouge d'une ambulance.
 
         Args:
             ecran (pygame.Surface): Surface Pygame sur laquelle dessiner
-            rect (pygame.Rect): Rectangle de la voiture
         """
         # Croix rouge au centre
         taille_croix = 10
@@ -225,14 +332,21 @@ class Voiture:
                         (self.x - epaisseur//2, self.y - taille_croix//2,
                         epaisseur, taille_croix))
 
+    def dessiner_gyrophare(self, surface, phase):
+        """
+        Dessine le gyrophare d'une ambulance pour une phase donnée.
+
+        La surface doit avoir un canal alpha : le halo y est écrit avec sa
+        transparence et ne se mélange au décor qu'au blit du sprite.
+
+        Args:
+            surface (pygame.Surface): Surface SRCALPHA sur laquelle dessiner
+            phase (int): Phase retournée par phase_gyrophare()
+        """
         # ═════════════════════════════════════════════════════════════
         # GYROPHARE AMÉLIORÉ - Plus intense et visible
         # ═════════════════════════════════════════════════════════════
-        self.temps_gyrophare += 1
-        
         # Effet stroboscopique : 3 niveaux d'intensité
-        phase = (self.temps_gyrophare // 6) % 3
-        
         if phase == 0:
             # Flash BLEU intense
             couleur_gyro = (0, 100, 255)  # Bleu vif
@@ -260,19 +374,33 @@ class Voiture:
         # HALO LUMINEUX (effet de diffusion) - visible seulement pendant flash
         if rayon_halo > 0:
             # Cercle extérieur semi-transparent (effet glow)
-            s = pygame.Surface((rayon_halo * 2 + 4, rayon_halo * 2 + 4), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*couleur_gyro, 80), (rayon_halo + 2, rayon_halo + 2), rayon_halo)
-            ecran.blit(s, (int(gyro_x) - rayon_halo - 2, int(gyro_y) - rayon_halo - 2))
+            pygame.draw.circle(surface, (*couleur_gyro, 80), (int(gyro_x), int(gyro_y)), rayon_halo)
 
         # Dessiner le gyrophare principal (plus gros)
-        pygame.draw.circle(ecran, couleur_gyro, (int(gyro_x), int(gyro_y)), rayon_gyro)
+        pygame.draw.circle(surface, couleur_gyro, (int(gyro_x), int(gyro_y)), rayon_gyro)
         
         # Contour blanc pour visibilité
-        pygame.draw.circle(ecran, self.BLANC, (int(gyro_x), int(gyro_y)), rayon_gyro, 2)
+        pygame.draw.circle(surface, self.BLANC, (int(gyro_x), int(gyro_y)), rayon_gyro, 2)
         
         # Reflet blanc (effet LED réaliste) - visible seulement pendant flash
         if rayon_gyro >= 6:
-            pygame.draw.circle(ecran, self.BLANC, (int(gyro_x - 2), int(gyro_y - 2)), 2)
+            pygame.draw.circle(surface, self.BLANC, (int(gyro_x - 2), int(gyro_y - 2)), 2)
+
+    def zone_affichage(self):
+        """
+        Rectangle couvrant tout ce que dessiner() peut toucher : carrosserie
+        élargie pour les phares, faisceaux et gyrophare.
+
+        Returns:
+            pygame.Rect: Zone à rafraîchir à l'écran
+        """
+        if self.direction in ["N", "S"]:
+            largeur, hauteur = self.hauteur, self.largeur
+        else:
+            largeur, hauteur = self.largeur, self.hauteur
+        largeur += 2 * MARGE_AFFICHAGE_VOITURE
+        hauteur += 2 * MARGE_AFFICHAGE_VOITURE
+        return pygame.Rect(int(self.x) - largeur // 2, int(self.y) - hauteur // 2, largeur, hauteur)
 
     def est_hors_zone(self, largeur_ecran, hauteur_ecran, marge=50):
         """
@@ -330,9 +458,6 @@ class Voiture:
         largeur_base = 12
         largeur_fin = 35
         
-        # Créer une surface avec transparence pour le faisceau
-        faisceau_surface = pygame.Surface((200, 200), pygame.SRCALPHA)
-        
         # Couleur jaune semi-transparente (R, G, B, Alpha)
         # Couleurs plus claires et plus transparentes
         couleur_faisceau = (255, 255, 220, 60)  # jaune très clair, alpha plus bas
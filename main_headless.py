@@ -0,0 +1,36 @@
+import argparse
+import random
+import time
+from feu_tricolore.simulation import Simulation
+from feu_tricolore.constants import DT_SIMULATION
+
+
+def main():
+    """Exécute la simulation sans rendu, aussi vite que le CPU le permet"""
+    parser = argparse.ArgumentParser(description="Simulation de l'intersection sans interface graphique")
+    parser.add_argument("--duree", type=float, default=3600, help="Durée simulée en secondes")
+    parser.add_argument("--seed", type=int, default=None, help="Graine du générateur aléatoire")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    sim = Simulation()
+    sim.demarrer_simulation()
+
+    nombre_pas = round(args.duree / DT_SIMULATION)
+    debut = time.perf_counter()
+    for _ in range(nombre_pas):
+        sim.step()
+    duree_reelle = time.perf_counter() - debut
+
+    print(f"Temps simulé : {sim.temps_total_simulation}s ({nombre_pas} pas)")
+    print(f"Temps réel : {duree_reelle:.2f}s (x{args.duree / max(duree_reelle, 1e-9):.0f})")
+    print(f"Cycles : {sim.cycle_count} - Accidents : {sim.gestionnaire_voitures.compteur_accidents}")
+    pool = sim.gestionnaire_voitures.pool.statistiques()
+    print(f"Pool véhicules : {pool['en_service']} en service / {pool['crees']} créés "
+          f"({pool['occupation']:.0%}), {pool['recyclees']} recyclés")
+
+
+if __name__ == "__main__":
+    main()